@@ -99,6 +99,7 @@ from .setup import (
     _setup_started,
     async_get_setup_timings,
     async_notify_setup_error,
+    async_record_import_times,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -284,6 +285,7 @@ async def async_setup_hass(
             hass.config.debug = True
 
         hass.config.safe_mode = runtime_config.safe_mode
+        hass.config.lazy_platforms = runtime_config.lazy_platforms
         hass.config.skip_pip = runtime_config.skip_pip
         hass.config.skip_pip_packages = runtime_config.skip_pip_packages
 
@@ -442,6 +444,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_compiled_templates(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -1075,6 +1078,7 @@ async def _async_set_up_integrations(
         )
 
     watcher.async_stop()
+    async_record_import_times(hass)
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
@@ -1082,3 +1086,13 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        _LOGGER.debug(
+            "Integration import times: %s",
+            dict(
+                sorted(
+                    loader.async_get_import_timings(hass).items(),
+                    key=lambda item: sum(item[1].values()),
+                    reverse=True,
+                )
+            ),
+        )
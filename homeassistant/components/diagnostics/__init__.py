@@ -77,7 +77,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[_DIAGNOSTICS_DATA] = DiagnosticsData()
 
     await integration_platform.async_process_integration_platforms(
-        hass, DOMAIN, _register_diagnostics_platform
+        hass, DOMAIN, _register_diagnostics_platform, lazy=True
     )
 
     websocket_api.async_register_command(hass, handle_info)
@@ -115,11 +115,12 @@ def _register_diagnostics_platform(
 
 @websocket_api.require_admin
 @websocket_api.websocket_command({vol.Required("type"): "diagnostics/list"})
-@callback
-def handle_info(
+@websocket_api.async_response
+async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all possible diagnostic handlers."""
+    await integration_platform.async_process_lazy_integration_platforms(hass, DOMAIN)
     diagnostics_data = hass.data[_DIAGNOSTICS_DATA]
     result = [
         {
@@ -141,11 +142,12 @@ def handle_info(
         vol.Required("domain"): str,
     }
 )
-@callback
-def handle_get(
+@websocket_api.async_response
+async def handle_get(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all diagnostic handlers for a domain."""
+    await integration_platform.async_process_lazy_integration_platforms(hass, DOMAIN)
     domain = msg["domain"]
     diagnostics_data = hass.data[_DIAGNOSTICS_DATA]
 
@@ -269,6 +271,9 @@ class DownloadDiagnosticsView(http.HomeAssistantView):
         if (config_entry := hass.config_entries.async_get_entry(d_id)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
+        await integration_platform.async_process_lazy_integration_platforms(
+            hass, DOMAIN
+        )
         diagnostics_data = hass.data[_DIAGNOSTICS_DATA]
         if (info := diagnostics_data.platforms.get(config_entry.domain)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
@@ -11,7 +11,12 @@ import voluptuous as vol
 
 from homeassistant.components import frontend
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import (
+    ReadQueryKind,
+    add_read_rows,
+    get_instance,
+    history,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
 from homeassistant.core import HomeAssistant, valid_entity_id
@@ -123,7 +128,8 @@ class HistoryPeriodView(HomeAssistantView):
 
         return cast(
             web.Response,
-            await get_instance(hass).async_add_executor_job(
+            await get_instance(hass).async_add_read_job(
+                ReadQueryKind.HISTORY,
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
@@ -149,19 +155,17 @@ class HistoryPeriodView(HomeAssistantView):
     ) -> web.Response:
         """Fetch significant stats from the database as json."""
         with session_scope(hass=hass, read_only=True) as session:
-            return self.json(
-                list(
-                    history.get_significant_states_with_session(
-                        hass,
-                        session,
-                        start_time,
-                        end_time,
-                        entity_ids,
-                        None,
-                        include_start_time_state,
-                        significant_changes_only,
-                        minimal_response,
-                        no_attributes,
-                    ).values()
-                )
+            states = history.get_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
             )
+        add_read_rows(sum(map(len, states.values())))
+        return self.json(list(states.values()))
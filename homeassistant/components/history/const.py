@@ -5,3 +5,12 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The number of live states serialized once and shared between live streams
+LIVE_STATE_CACHE_SIZE = 2048
+
+MAX_DOWNSAMPLED_POINTS = 10000
+
+# How often a columnar history query waiting for the client
+# to read the last chunk checks if it was unsubscribed
+CHUNK_DRAIN_CHECK_INTERVAL = 1.0
@@ -7,12 +7,20 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
-from typing import Any, cast
+import threading
+from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import (
+    ReadQueryKind,
+    add_read_rows,
+    get_instance,
+    history,
+)
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -34,21 +42,34 @@ from homeassistant.helpers.event import (
     async_track_point_in_utc_time,
     async_track_state_change_event,
 )
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
-
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    CHUNK_DRAIN_CHECK_INTERVAL,
+    DOMAIN,
+    EVENT_COALESCE_TIME,
+    LIVE_STATE_CACHE_SIZE,
+    MAX_DOWNSAMPLED_POINTS,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
 
+# Serialized states of live events shared between live streams
+DATA_LIVE_STATES: HassKey[
+    LRU[tuple[Event[EventStateChangedData], bool], json_fragment]
+] = HassKey(f"{DOMAIN}_live_states")
+
 
 @dataclass(slots=True)
 class HistoryLiveStream:
     """Track a history live stream."""
 
-    stream_queue: asyncio.Queue[Event]
+    stream_queue: asyncio.Queue[Event[EventStateChangedData]]
     subscriptions: list[CALLBACK_TYPE]
     end_time_unsub: CALLBACK_TYPE | None = None
     task: asyncio.Task | None = None
@@ -58,7 +79,10 @@ class HistoryLiveStream:
 @callback
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history websocket API."""
+    hass.data[DATA_LIVE_STATES] = LRU(LIVE_STATE_CACHE_SIZE)
     websocket_api.async_register_command(hass, ws_get_history_during_period)
+    websocket_api.async_register_command(hass, ws_get_history_during_period_columnar)
+    websocket_api.async_register_command(hass, ws_get_downsampled_history_during_period)
     websocket_api.async_register_command(hass, ws_stream)
 
 
@@ -74,23 +98,20 @@ def _ws_get_significant_states(
     no_attributes: bool,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
     )
+    add_read_rows(sum(map(len, states.values())))
+    return json_bytes(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -110,6 +131,40 @@ async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle history during period websocket command."""
+    if not (period := _async_history_period(hass, connection, msg)):
+        return
+    start_time, end_time, entity_ids = period
+    include_start_time_state = msg["include_start_time_state"]
+    no_attributes = msg["no_attributes"]
+    significant_changes_only = msg["significant_changes_only"]
+    minimal_response = msg["minimal_response"]
+
+    connection.send_message(
+        await get_instance(hass).async_add_read_job(
+            ReadQueryKind.HISTORY,
+            _ws_get_significant_states,
+            hass,
+            msg["id"],
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    )
+
+
+@callback
+def _async_history_period(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> tuple[dt, dt | None, list[str]] | None:
+    """Return the period and entity_ids of a history request.
+
+    Returns None and answers the request when the
+    period is invalid or has no states to return.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
 
@@ -117,29 +172,26 @@ async def ws_get_history_during_period(
         start_time = dt_util.as_utc(start_time)
     else:
         connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
-        return
+        return None
 
     if end_time_str:
         if end_time := dt_util.parse_datetime(end_time_str):
             end_time = dt_util.as_utc(end_time)
         else:
             connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
-            return
+            return None
     else:
         end_time = None
 
     if start_time > dt_util.utcnow():
         connection.send_result(msg["id"], {})
-        return
+        return None
 
     entity_ids: list[str] = msg["entity_ids"]
     for entity_id in entity_ids:
         if not hass.states.get(entity_id) and not valid_entity_id(entity_id):
             connection.send_error(msg["id"], "invalid_entity_ids", "Invalid entity_ids")
-            return
-
-    include_start_time_state = msg["include_start_time_state"]
-    no_attributes = msg["no_attributes"]
+            return None
 
     if (
         # has_states_before will return True if there are states older than
@@ -147,31 +199,185 @@ async def ws_get_history_during_period(
         # database up until end_time.
         (end_time and not has_states_before(hass, end_time))
         or (
-            not include_start_time_state
+            not msg.get("include_start_time_state", True)
             and entity_ids
             and not entities_may_have_state_changes_after(
-                hass, entity_ids, start_time, no_attributes
+                hass, entity_ids, start_time, msg.get("no_attributes", False)
             )
         )
     ):
         connection.send_result(msg["id"], {})
-        return
+        return None
 
-    significant_changes_only = msg["significant_changes_only"]
-    minimal_response = msg["minimal_response"]
+    return start_time, end_time, entity_ids
 
-    connection.send_message(
-        await get_instance(hass).async_add_executor_job(
-            _ws_get_significant_states,
+
+def _ws_stream_significant_states_columnar(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    cancelled: threading.Event,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> int:
+    """Send history significant_states in columnar chunks from the executor.
+
+    Every chunk is converted to json as soon as it is read from the
+    database and the next chunk is only read once the previous one has
+    been written to the socket, so a client that reads slowly does not
+    make chunks pile up in memory. The query stops when cancelled is set.
+    Returns the number of chunks sent.
+    """
+    chunks = 0
+    with session_scope(hass=hass, read_only=True) as session:
+        for chunk in history.stream_significant_states_with_session(
             hass,
-            msg["id"],
+            session,
             start_time,
             end_time,
             entity_ids,
             include_start_time_state,
             significant_changes_only,
-            minimal_response,
             no_attributes,
+        ):
+            if cancelled.is_set():
+                break
+            chunk["chunk"] = chunks
+            chunks += 1
+            add_read_rows(
+                sum(
+                    len(columns[COMPRESSED_STATE_STATE])
+                    for columns in chunk["states"].values()
+                )
+            )
+            sent = asyncio.run_coroutine_threadsafe(
+                _async_send_chunk(
+                    connection, json_bytes(messages.event_message(msg_id, chunk))
+                ),
+                hass.loop,
+            )
+            while not cancelled.is_set():
+                try:
+                    sent.result(CHUNK_DRAIN_CHECK_INTERVAL)
+                    break
+                except TimeoutError:
+                    continue
+            else:
+                sent.cancel()
+                break
+    return chunks
+
+
+async def _async_send_chunk(connection: ActiveConnection, message: bytes) -> None:
+    """Send a chunk and wait until it has been written to the socket."""
+    connection.send_message(message)
+    await connection.async_drained()
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/history_during_period_columnar",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): [str],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("no_attributes", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_get_history_during_period_columnar(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle history during period websocket command with columnar chunks.
+
+    The result is sent first and followed by an event for every
+    chunk of states and a final event with the number of chunks.
+    Unsubscribing or closing the connection stops the query.
+    """
+    if not (period := _async_history_period(hass, connection, msg)):
+        return
+    start_time, end_time, entity_ids = period
+    msg_id: int = msg["id"]
+    cancelled = threading.Event()
+    connection.subscriptions[msg_id] = cancelled.set
+    connection.send_result(msg_id)
+    chunks = await get_instance(hass).async_add_read_job(
+        ReadQueryKind.HISTORY,
+        _ws_stream_significant_states_columnar,
+        hass,
+        connection,
+        msg_id,
+        cancelled,
+        start_time,
+        end_time,
+        entity_ids,
+        msg["include_start_time_state"],
+        msg["significant_changes_only"],
+        msg["no_attributes"],
+    )
+    if cancelled.is_set():
+        return
+    connection.subscriptions.pop(msg_id, None)
+    connection.send_message(
+        json_bytes(messages.event_message(msg_id, {"done": True, "chunks": chunks}))
+    )
+
+
+def _ws_get_downsampled_states(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    points: int,
+) -> bytes:
+    """Fetch downsampled history and convert it to json in the executor."""
+    with session_scope(hass=hass, read_only=True) as session:
+        buckets = history.get_downsampled_states_with_session(
+            hass, session, start_time, end_time, entity_ids, points
+        )
+    add_read_rows(sum(map(len, buckets.values())))
+    return json_bytes(messages.result_message(msg_id, buckets))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/downsampled_history_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): vol.All([str], vol.Length(min=1)),
+        vol.Required("points"): vol.All(
+            int, vol.Range(min=1, max=MAX_DOWNSAMPLED_POINTS)
+        ),
+    }
+)
+@websocket_api.async_response
+async def ws_get_downsampled_history_during_period(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle downsampled history during period websocket command.
+
+    Numeric states are reduced to points buckets per entity with
+    the min, max, mean and last value of every bucket.
+    """
+    if not (period := _async_history_period(hass, connection, msg)):
+        return
+    start_time, end_time, entity_ids = period
+    connection.send_message(
+        await get_instance(hass).async_add_read_job(
+            ReadQueryKind.HISTORY,
+            _ws_get_downsampled_states,
+            hass,
+            msg["id"],
+            start_time,
+            end_time or dt_util.utcnow(),
+            entity_ids,
+            msg["points"],
         )
     )
 
@@ -243,6 +449,7 @@ def _generate_historical_response(
             True,
         ),
     )
+    add_read_rows(sum(map(len, states.values())))
     last_time_ts = 0.0
     for state_list in states.values():
         if (
@@ -284,7 +491,8 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_job(
+        ReadQueryKind.HISTORY,
         _generate_historical_response,
         hass,
         msg_id,
@@ -314,53 +522,60 @@ def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, An
 
 
 def _events_to_compressed_states(
-    events: Iterable[Event], no_attributes: bool
-) -> dict[str, list[dict[str, Any]]]:
-    """Convert events to a compressed states."""
-    states_by_entity_ids: dict[str, list[dict[str, Any]]] = {}
+    live_states: LRU[tuple[Event[EventStateChangedData], bool], json_fragment],
+    events: Iterable[Event[EventStateChangedData]],
+    no_attributes: bool,
+) -> dict[str, list[json_fragment]]:
+    """Convert events to a compressed states.
+
+    Every live stream that receives an event shares its serialized state.
+    """
+    states_by_entity_ids: dict[str, list[json_fragment]] = {}
     for event in events:
-        state: State = event.data["new_state"]
-        entity_id: str = state.entity_id
-        states_by_entity_ids.setdefault(entity_id, []).append(
-            _history_compressed_state(state, no_attributes)
+        key = (event, no_attributes)
+        if (compressed_state := live_states.get(key)) is None:
+            state = event.data["new_state"]
+            if TYPE_CHECKING:
+                assert state is not None
+            live_states[key] = compressed_state = json_fragment(
+                json_bytes(_history_compressed_state(state, no_attributes))
+            )
+        states_by_entity_ids.setdefault(event.data["entity_id"], []).append(
+            compressed_state
         )
     return states_by_entity_ids
 
 
 async def _async_events_consumer(
+    hass: HomeAssistant,
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
     msg_id: int,
-    stream_queue: asyncio.Queue[Event],
+    stream_queue: asyncio.Queue[Event[EventStateChangedData]],
     no_attributes: bool,
 ) -> None:
     """Stream events from the queue."""
     subscriptions_setup_complete_timestamp = (
         subscriptions_setup_complete_time.timestamp()
     )
-    while True:
-        events: list[Event] = [await stream_queue.get()]
-        # If the event is older than the last db
-        # event we already sent it so we skip it.
-        if events[0].time_fired_timestamp <= subscriptions_setup_complete_timestamp:
-            continue
-        # We sleep for the EVENT_COALESCE_TIME so
-        # we can group events together to minimize
-        # the number of websocket messages when the
-        # system is overloaded with an event storm
-        await asyncio.sleep(EVENT_COALESCE_TIME)
-        while not stream_queue.empty():
-            events.append(stream_queue.get_nowait())
-
-        if history_states := _events_to_compressed_states(events, no_attributes):
-            connection.send_message(
-                json_bytes(
-                    messages.event_message(
-                        msg_id,
-                        {"states": history_states},
-                    )
-                )
-            )
+    live_states = hass.data[DATA_LIVE_STATES]
+
+    def _is_stale(event: Event[EventStateChangedData]) -> bool:
+        """Return if the event is older than the last db event we already sent."""
+        return event.time_fired_timestamp <= subscriptions_setup_complete_timestamp
+
+    def _build_message(events: list[Event[EventStateChangedData]]) -> bytes | None:
+        """Build the message for a batch of events."""
+        history_states = _events_to_compressed_states(
+            live_states, events, no_attributes
+        )
+        if not history_states:
+            return None
+        return json_bytes(messages.event_message(msg_id, {"states": history_states}))
+
+    await websocket_api.async_stream_batches(
+        connection, stream_queue, _is_stale, _build_message, EVENT_COALESCE_TIME
+    )
 
 
 @callback
@@ -478,7 +693,9 @@ async def ws_stream(
         return
 
     subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_HISTORY_STATES)
+    stream_queue: asyncio.Queue[Event[EventStateChangedData]] = asyncio.Queue(
+        MAX_PENDING_HISTORY_STATES
+    )
     live_stream = HistoryLiveStream(
         subscriptions=subscriptions, stream_queue=stream_queue
     )
@@ -503,7 +720,7 @@ async def ws_stream(
         )
 
     @callback
-    def _queue_or_cancel(event: Event) -> None:
+    def _queue_or_cancel(event: Event[EventStateChangedData]) -> None:
         """Queue an event to be processed or cancel."""
         try:
             stream_queue.put_nowait(event)
@@ -546,6 +763,7 @@ async def ws_stream(
 
     live_stream.task = create_eager_task(
         _async_events_consumer(
+            hass,
             subscriptions_setup_complete_time,
             connection,
             msg_id,
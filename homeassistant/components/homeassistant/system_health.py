@@ -6,7 +6,7 @@ from typing import Any
 
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import system_info
+from homeassistant.helpers import system_info, template
 
 
 @callback
@@ -20,6 +20,8 @@ def async_register(
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
+    state_memory = hass.states.async_memory_usage()
+    template_cache = template.COMPILED_TEMPLATE_CACHE.info()
 
     return {
         "version": f"core-{info.get('version')}",
@@ -35,4 +37,9 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "arch": info.get("arch"),
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
+        "entities": state_memory["entities"],
+        "state_memory_per_entity": f"{state_memory['bytes_per_entity']} B",
+        "compact_states": state_memory["compact_storage"],
+        "compiled_templates": template_cache["size"],
+        "compiled_template_hit_rate": f"{template_cache['hit_rate']:.1%}",
     }
@@ -141,7 +141,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
-    await async_process_integration_platforms(hass, DOMAIN, _process_logbook_platform)
+    await async_process_integration_platforms(
+        hass, DOMAIN, _process_logbook_platform, lazy=True
+    )
 
     return True
 
@@ -43,6 +43,15 @@ LOGBOOK_ENTRY_NAME = "name"
 LOGBOOK_ENTRY_STATE = "state"
 LOGBOOK_ENTRY_WHEN = "when"
 
+# The number of events and entity names kept while humanifying
+# rows so long logbook windows do not grow memory
+EVENT_CACHE_SIZE = 4096
+ENTITY_NAME_CACHE_SIZE = 4096
+
+# The number of live events humanified and serialized
+# once and shared between logbook live streams
+LIVE_ENTRY_CACHE_SIZE = 2048
+
 # Automation events that can affect an entity_id or device_id
 AUTOMATION_EVENTS = {EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED}
 
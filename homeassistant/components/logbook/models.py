@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Final, NamedTuple, cast
 
+from lru import LRU
 from propcache.api import cached_property
 from sqlalchemy.engine.row import Row
 
@@ -18,10 +19,13 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import ATTR_ICON, EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, State, callback
+from homeassistant.helpers.json import json_fragment
 from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+from .const import LIVE_ENTRY_CACHE_SIZE
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -33,6 +37,10 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    # Serialized entries of live events shared between live streams
+    live_entries: LRU[tuple[Event, bool, bool], json_fragment | None] = field(
+        default_factory=lambda: LRU(LIVE_ENTRY_CACHE_SIZE)
+    )
 
 
 class LazyEventPartialState:
@@ -41,7 +49,7 @@ class LazyEventPartialState:
     def __init__(
         self,
         row: Row | EventAsRow,
-        event_data_cache: dict[str, dict[str, Any]],
+        event_data_cache: dict[str, dict[str, Any]] | LRU[str, dict[str, Any]],
     ) -> None:
         """Init the lazy event."""
         self.row = row
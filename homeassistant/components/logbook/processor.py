@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
 import time
 from typing import TYPE_CHECKING, Any
 
+from lru import LRU
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
 
-from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder import add_read_rows, get_instance
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import (
     bytes_to_uuid_hex_or_none,
@@ -34,8 +35,9 @@ from homeassistant.const import (
     EVENT_CALL_SERVICE,
     EVENT_LOGBOOK_ENTRY,
 )
-from homeassistant.core import HomeAssistant, split_entity_id
+from homeassistant.core import Event, HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.event_type import EventType
 
@@ -52,6 +54,8 @@ from .const import (
     CONTEXT_STATE,
     CONTEXT_USER_ID,
     DOMAIN,
+    ENTITY_NAME_CACHE_SIZE,
+    EVENT_CACHE_SIZE,
     LOGBOOK_ENTRY_DOMAIN,
     LOGBOOK_ENTRY_ENTITY_ID,
     LOGBOOK_ENTRY_ICON,
@@ -126,10 +130,11 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.live_entries = logbook_config.live_entries
         self.logbook_run = LogbookRun(
             context_lookup={None: None},
             external_events=logbook_config.external_events,
-            event_cache=EventCache({}),
+            event_cache=EventCache(),
             entity_name_cache=EntityNameCache(self.hass),
             include_entity_name=include_entity_name,
             timestamp=timestamp,
@@ -156,6 +161,36 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        events = list(self._iter_events(start_day, end_day))
+        add_read_rows(len(events))
+        return events
+
+    def get_events_json(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> tuple[json_fragment, float | str | None]:
+        """Get events for a period of time as a json array.
+
+        Every entry is serialized as soon as it is humanified, so only
+        the json of the entries is held in memory and not the entries.
+        Returns the array and the time of the last entry.
+        """
+        buffer = bytearray(b"[")
+        last_when: float | str | None = None
+        count = 0
+        for entry in self._iter_events(start_day, end_day):
+            if count:
+                buffer += b","
+            buffer += json_bytes(entry)
+            last_when = entry[LOGBOOK_ENTRY_WHEN]
+            count += 1
+        buffer += b"]"
+        add_read_rows(count)
+        return json_fragment(bytes(buffer)), last_when
+
+    def _iter_events(self, start_day: dt, end_day: dt) -> Iterator[dict[str, Any]]:
+        """Humanify the events for a period of time as they are read."""
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -180,33 +215,91 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            # Windows longer than a day are streamed from the cursor
+            # so only the rows that are being humanified are in memory
+            yield from self.humanify(
+                execute_stmt_lambda_element(
+                    session,
+                    stmt,
+                    dt_util.as_utc(start_day),
+                    dt_util.as_utc(end_day),
+                    orm_rows=False,
+                )
             )
 
     def humanify(
-        self, rows: Generator[EventAsRow] | Sequence[Row] | Result
-    ) -> list[dict[str, str]]:
+        self,
+        rows: Generator[EventAsRow] | Sequence[Row] | Sequence[EventAsRow] | Result,
+    ) -> Generator[dict[str, Any]]:
         """Humanify rows."""
-        return list(
-            _humanify(
-                self.hass,
-                rows,
-                self.ent_reg,
-                self.logbook_run,
-                self.context_augmenter,
-            )
+        return _humanify(
+            self.hass,
+            rows,
+            self.ent_reg,
+            self.logbook_run,
+            self.context_augmenter,
         )
 
+    def humanify_live(self, events: list[Event]) -> list[json_fragment]:
+        """Humanify live events into serialized entries.
+
+        Once switched to live, the entry of an event no longer depends on the
+        rows seen before, so the entry of every event is humanified and
+        serialized once and shared with the other live streams. The shared
+        entries are humanified without the context lookup and entity name
+        cache of this stream, their context only comes from the event.
+        """
+        logbook_run = self.logbook_run
+        live_entries = self.live_entries
+        entries: list[json_fragment] = []
+        live_run: LogbookRun | None = None
+        for event in events:
+            key = (event, logbook_run.include_entity_name, logbook_run.timestamp)
+            if key not in live_entries:
+                if live_run is None:
+                    live_run = LogbookRun(
+                        context_lookup={},
+                        external_events=logbook_run.external_events,
+                        event_cache=EventCache(),
+                        entity_name_cache=EntityNameCache(self.hass),
+                        include_entity_name=logbook_run.include_entity_name,
+                        timestamp=logbook_run.timestamp,
+                        memoize_new_contexts=False,
+                    )
+                humanified = next(
+                    _humanify(
+                        self.hass,
+                        (async_event_to_row(event),),
+                        self.ent_reg,
+                        live_run,
+                        ContextAugmenter(live_run),
+                    ),
+                    None,
+                )
+                live_entries[key] = (
+                    json_fragment(json_bytes(humanified))
+                    if humanified is not None
+                    else None
+                )
+            if (entry := live_entries[key]) is not None:
+                entries.append(entry)
+        return entries
+
 
 def _humanify(
     hass: HomeAssistant,
-    rows: Generator[EventAsRow] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow] | Sequence[Row] | Sequence[EventAsRow] | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
 ) -> Generator[dict[str, Any]]:
-    """Generate a converted list of events into entries."""
+    """Generate a converted list of events into entries.
+
+    The rows are in the order they were fired, so the first row of a
+    context is indexed before the rows that refer to it. The index only
+    holds the first row of every context, so the context of a row is
+    found however far back in the window it started.
+    """
     # Continuous sensors, will be excluded from the logbook
     continuous_sensors: dict[str, bool] = {}
     context_lookup = logbook_run.context_lookup
@@ -400,12 +493,12 @@ class EntityNameCache:
     def __init__(self, hass: HomeAssistant) -> None:
         """Init the cache."""
         self._hass = hass
-        self._names: dict[str, str] = {}
+        self._names: LRU[str, str] = LRU(ENTITY_NAME_CACHE_SIZE)
 
     def get(self, entity_id: str) -> str:
         """Lookup an the friendly name."""
-        if entity_id in self._names:
-            return self._names[entity_id]
+        if (name := self._names.get(entity_id)) is not None:
+            return name
         if (current_state := self._hass.states.get(entity_id)) and (
             friendly_name := current_state.attributes.get(ATTR_FRIENDLY_NAME)
         ):
@@ -417,12 +510,19 @@ class EntityNameCache:
 
 
 class EventCache:
-    """Cache LazyEventPartialState by row."""
+    """Cache LazyEventPartialState by row.
 
-    def __init__(self, event_data_cache: dict[str, dict[str, Any]]) -> None:
+    The events and the decoded event data are kept in LRU
+    caches so humanifying a long window does not keep every
+    event in memory.
+    """
+
+    def __init__(self) -> None:
         """Init the cache."""
-        self._event_data_cache = event_data_cache
-        self.event_cache: dict[Row | EventAsRow, LazyEventPartialState] = {}
+        self._event_data_cache: LRU[str, dict[str, Any]] = LRU(EVENT_CACHE_SIZE)
+        self.event_cache: LRU[Row | EventAsRow, LazyEventPartialState] = LRU(
+            EVENT_CACHE_SIZE
+        )
 
     def get(self, row: EventAsRow | Row) -> LazyEventPartialState:
         """Get the event from the row."""
@@ -437,5 +537,5 @@ class EventCache:
 
     def clear(self) -> None:
         """Clear the event cache."""
-        self._event_data_cache = {}
-        self.event_cache = {}
+        self._event_data_cache.clear()
+        self.event_cache.clear()
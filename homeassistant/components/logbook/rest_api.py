@@ -11,14 +11,18 @@ from aiohttp import web
 import voluptuous as vol
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
-from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder import ReadQueryKind, get_instance
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import InvalidEntityFormatError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.integration_platform import (
+    async_process_lazy_integration_platforms,
+)
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
+from .const import DOMAIN
 from .helpers import async_determine_event_types
 from .processor import EventProcessor
 
@@ -96,6 +100,7 @@ class LogbookView(HomeAssistantView):
                 "Can't combine entity with context_id", HTTPStatus.BAD_REQUEST
             )
 
+        await async_process_lazy_integration_platforms(hass, DOMAIN)
         event_types = async_determine_event_types(hass, entity_ids, None)
         event_processor = EventProcessor(
             hass,
@@ -109,6 +114,8 @@ class LogbookView(HomeAssistantView):
 
         def json_events() -> web.Response:
             """Fetch events and generate JSON."""
-            return self.json(event_processor.get_events(start_day, end_day))
+            return self.json(event_processor.get_events_json(start_day, end_day)[0])
 
-        return await get_instance(hass).async_add_executor_job(json_events)
+        return await get_instance(hass).async_add_read_job(
+            ReadQueryKind.LOGBOOK, json_events
+        )
@@ -7,16 +7,19 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
-from typing import Any
+from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder import ReadQueryKind, get_instance
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.integration_platform import (
+    async_process_lazy_integration_platforms,
+)
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import create_eager_task
 
@@ -163,7 +166,8 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_job(
+        ReadQueryKind.LOGBOOK,
         _ws_stream_get_events,
         msg_id,
         start_time,
@@ -174,7 +178,7 @@ async def _async_get_ws_stream_events(
 
 
 def _generate_stream_message(
-    events: list[dict[str, Any]], start_day: dt, end_day: dt
+    events: list[dict[str, Any]] | json_fragment, start_day: dt, end_day: dt
 ) -> dict[str, Any]:
     """Generate a logbook stream message response."""
     return {
@@ -192,10 +196,10 @@ def _ws_stream_get_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    events, last_when = event_processor.get_events_json(start_day, end_day)
     last_time = None
-    if events:
-        last_time = dt_util.utc_from_timestamp(events[-1]["when"])
+    if last_when is not None:
+        last_time = dt_util.utc_from_timestamp(cast(float, last_when))
     message = _generate_stream_message(events, start_day, end_day)
     if partial:
         # This is a hint to consumers of the api that
@@ -217,31 +221,29 @@ async def _async_events_consumer(
     subscriptions_setup_complete_timestamp = (
         subscriptions_setup_complete_time.timestamp()
     )
-    while True:
-        events: list[Event] = [await stream_queue.get()]
-        # If the event is older than the last db
-        # event we already sent it so we skip it.
-        if events[0].time_fired_timestamp <= subscriptions_setup_complete_timestamp:
-            continue
-        # We sleep for the EVENT_COALESCE_TIME so
-        # we can group events together to minimize
-        # the number of websocket messages when the
-        # system is overloaded with an event storm
-        await asyncio.sleep(EVENT_COALESCE_TIME)
-        while not stream_queue.empty():
-            events.append(stream_queue.get_nowait())
-
-        if logbook_events := event_processor.humanify(
-            async_event_to_row(e) for e in events
-        ):
-            connection.send_message(
-                json_bytes(
-                    messages.event_message(
-                        msg_id,
-                        {"events": logbook_events},
-                    )
-                )
+
+    def _is_stale(event: Event) -> bool:
+        """Return if the event is older than the last db event we already sent."""
+        return event.time_fired_timestamp <= subscriptions_setup_complete_timestamp
+
+    def _build_message(events: list[Event]) -> bytes | None:
+        """Build the message for a batch of events."""
+        logbook_events: list[dict[str, Any]] | list[json_fragment]
+        if event_processor.logbook_run.memoize_new_contexts:
+            # Still syncing with the database, the context of
+            # the events may be found in the rows already sent
+            logbook_events = list(
+                event_processor.humanify(async_event_to_row(e) for e in events)
             )
+        else:
+            logbook_events = event_processor.humanify_live(events)
+        if not logbook_events:
+            return None
+        return json_bytes(messages.event_message(msg_id, {"events": logbook_events}))
+
+    await websocket_api.async_stream_batches(
+        connection, stream_queue, _is_stale, _build_message, EVENT_COALESCE_TIME
+    )
 
 
 @websocket_api.websocket_command(
@@ -258,6 +260,7 @@ async def ws_event_stream(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle logbook stream events websocket command."""
+    await async_process_lazy_integration_platforms(hass, DOMAIN)
     start_time_str = msg["start_time"]
     msg_id: int = msg["id"]
     utc_now = dt_util.utcnow()
@@ -434,11 +437,8 @@ def _ws_formatted_get_events(
     event_processor: EventProcessor,
 ) -> bytes:
     """Fetch events and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id, event_processor.get_events(start_time, end_time)
-        )
-    )
+    events, _ = event_processor.get_events_json(start_time, end_time)
+    return json_bytes(messages.result_message(msg_id, events))
 
 
 @websocket_api.websocket_command(
@@ -456,6 +456,7 @@ async def ws_get_events(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle logbook get events websocket command."""
+    await async_process_lazy_integration_platforms(hass, DOMAIN)
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
     utc_now = dt_util.utcnow()
@@ -501,7 +502,8 @@ async def ws_get_events(
     )
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_job(
+            ReadQueryKind.LOGBOOK,
             _ws_formatted_get_events,
             msg["id"],
             start_time,
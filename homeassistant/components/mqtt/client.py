@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 import contextlib
 from dataclasses import dataclass
-from functools import lru_cache, partial
-from itertools import chain, groupby
+from functools import partial
+from itertools import chain, count, groupby
 import logging
 from operator import attrgetter
 import socket
@@ -53,7 +53,9 @@ from .const import (
     CONF_CERTIFICATE,
     CONF_CLIENT_CERT,
     CONF_CLIENT_KEY,
+    CONF_COALESCE_PUBLISH,
     CONF_KEEPALIVE,
+    CONF_MAX_INFLIGHT,
     CONF_TLS_INSECURE,
     CONF_TRANSPORT,
     CONF_WILL_MESSAGE,
@@ -62,6 +64,7 @@ from .const import (
     DEFAULT_BIRTH,
     DEFAULT_ENCODING,
     DEFAULT_KEEPALIVE,
+    DEFAULT_MAX_INFLIGHT,
     DEFAULT_PORT,
     DEFAULT_PROTOCOL,
     DEFAULT_QOS,
@@ -81,6 +84,7 @@ from .models import (
     MqttData,
     PublishMessage,
     PublishPayloadType,
+    PublishStats,
     ReceiveMessage,
 )
 from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
@@ -260,18 +264,145 @@ def subscribe(
     return remove
 
 
+def _max_inflight(config: ConfigType) -> int:
+    """Return the in-flight window size, at least one message.
+
+    The option is read from the config entry data without a schema,
+    a window of zero would never let a publish through.
+    """
+    return max(1, int(config.get(CONF_MAX_INFLIGHT, DEFAULT_MAX_INFLIGHT)))
+
+
 @dataclass(slots=True, frozen=True)
 class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+@dataclass(slots=True)
+class _QueuedPublish:
+    """A publish waiting for a free slot in the in-flight window."""
+
+    topic: str
+    payload: PublishPayloadType
+    qos: int
+    retain: bool
+    future: asyncio.Future[None]
+    queued_at: float
+
+
+class _TopicNode:
+    """A level of a topic filter in the subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode] = {}
+        self.subscriptions: dict[Subscription, None] = {}
+
+
+class SubscriptionTrie:
+    """Match topics against the wildcard subscriptions.
+
+    The topic filters of all subscriptions are stored in a single trie
+    keyed by topic level, so matching a topic only visits the levels that
+    can match it instead of every subscription. Matches are returned in
+    the order the subscriptions were added.
+    """
+
+    __slots__ = ("_counter", "_order", "_root")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicNode()
+        self._order: dict[Subscription, int] = {}
+        self._counter = count()
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions."""
+        return len(self._order)
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if there is a subscription for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.subscriptions[subscription] = None
+        self._order[subscription] = next(self._counter)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError if the subscription was not added.
+        """
+        del self._order[subscription]
+        path: list[tuple[_TopicNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.subscriptions[subscription]
+        # Prune the levels that no longer lead to a subscription
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter that matches a topic.
+
+        Wildcards at the first level do not match topics starting with $.
+        """
+        matches: list[Subscription] = []
+        levels = topic.split("/")
+        wildcards = not topic.startswith("$")
+        nodes = [self._root]
+        for level in levels:
+            next_nodes: list[_TopicNode] = []
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if wildcards:
+                    if (child := children.get("+")) is not None:
+                        next_nodes.append(child)
+                    if (child := children.get("#")) is not None:
+                        matches.extend(child.subscriptions)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+            wildcards = True
+        else:
+            for node in nodes:
+                matches.extend(node.subscriptions)
+                # A multi-level wildcard also matches its parent level
+                if (child := node.children.get("#")) is not None:
+                    matches.extend(child.subscriptions)
+        if len(matches) > 1:
+            # A topic filter passed as topic can reach a level both directly
+            # and through a wildcard, so remove the duplicates
+            return sorted(dict.fromkeys(matches), key=self._order.__getitem__)
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -318,6 +449,9 @@ class MqttClientSetup:
             reconnect_on_failure=False,
         )
         self._client.setup()
+        # The in-flight window is enforced by the MQTT class,
+        # paho should not queue messages on its own.
+        self._client.max_inflight_messages_set(_max_inflight(config))
 
         # Enable logging
         self._client.enable_logger()
@@ -362,6 +496,7 @@ class MQTT:
     _mqttc: AsyncMQTTClient
     _last_subscribe: float
     _mqtt_data: MqttData
+    _publish_stats: PublishStats
 
     def __init__(
         self, hass: HomeAssistant, config_entry: ConfigEntry, conf: ConfigType
@@ -378,6 +513,10 @@ class MQTT:
         # To ensure the wildcard subscriptions order is preserved, we use a dict
         # with `None` values instead of a set.
         self._wildcard_subscriptions: dict[Subscription, None] = {}
+        self._wildcard_trie = SubscriptionTrie()
+        # Subscriptions matching a topic, keyed by topic. A simple subscription
+        # only invalidates its own topic, a wildcard subscription all of them.
+        self._matching_subscriptions_cache: dict[str, list[Subscription]] = {}
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -389,6 +528,14 @@ class MQTT:
 
         self._connection_lock = asyncio.Lock()
         self._pending_operations: dict[int, asyncio.Future[None]] = {}
+        # Publishes waiting for a free slot in the in-flight window
+        self._max_inflight = _max_inflight(conf)
+        self._publish_inflight = 0
+        self._publish_queue: deque[_QueuedPublish] = deque()
+        # With coalescing, the queued publish per (topic, qos, retain)
+        # takes the payload of a later publish with the same key.
+        self._coalesce_publish: bool = conf.get(CONF_COALESCE_PUBLISH, False)
+        self._coalescable_publishes: dict[tuple[str, int, bool], _QueuedPublish] = {}
         self._subscribe_debouncer = EnsureJobAfterCooldown(
             INITIAL_SUBSCRIBE_COOLDOWN, self._async_perform_subscriptions
         )
@@ -426,6 +573,7 @@ class MQTT:
     ) -> None:
         """Start Home Assistant MQTT client."""
         self._mqtt_data = mqtt_data
+        self._publish_stats = mqtt_data.publish_stats
         await self.async_init_client()
 
     @property
@@ -591,8 +739,14 @@ class MQTT:
 
     @callback
     def _async_writer_callback(self, client: mqtt.Client) -> None:
-        """Handle writing data to the socket."""
-        if (status := client.loop_write()) != 0:
+        """Handle writing data to the socket.
+
+        Paho queues the packets and registers the socket for writing, so all
+        packets queued since the last write are flushed in one go.
+        """
+        self._publish_stats.write_batches += 1
+        status = client.loop_write()
+        if status != 0:
             self._async_on_disconnect(status)
 
     def _on_socket_register_write(
@@ -625,24 +779,110 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
-        )
+        return topic in self._simple_subscriptions or topic in self._wildcard_trie
 
     async def async_publish(
         self, topic: str, payload: PublishPayloadType, qos: int, retain: bool
     ) -> None:
-        """Publish a MQTT message."""
-        msg_info = self._mqttc.publish(topic, payload, qos, retain)
-        _LOGGER.debug(
-            "Transmitting%s message on %s: '%s', mid: %s, qos: %s",
-            " retained" if retain else "",
-            topic,
-            payload,
-            msg_info.mid,
-            qos,
+        """Publish a MQTT message.
+
+        At most max_inflight messages wait for an ACK at the same time,
+        later messages are queued until a slot is freed.
+        """
+        if self._publish_queue or self._publish_inflight >= self._max_inflight:
+            await asyncio.shield(self._async_queue_publish(topic, payload, qos, retain))
+            return
+        self._publish_inflight += 1
+        await self._async_publish_in_window(
+            topic, payload, qos, retain, time.monotonic()
+        )
+
+    @callback
+    def _async_queue_publish(
+        self, topic: str, payload: PublishPayloadType, qos: int, retain: bool
+    ) -> asyncio.Future[None]:
+        """Queue a publish until the in-flight window has a free slot."""
+        stats = self._publish_stats
+        key = (topic, qos, retain)
+        if self._coalesce_publish and (queued := self._coalescable_publishes.get(key)):
+            _LOGGER.debug("Coalescing queued message on %s: '%s'", topic, payload)
+            queued.payload = payload
+            stats.coalesced += 1
+            return queued.future
+        queued = _QueuedPublish(
+            topic, payload, qos, retain, self.loop.create_future(), time.monotonic()
         )
-        await self._async_wait_for_mid_or_raise(msg_info.mid, msg_info.rc)
+        self._publish_queue.append(queued)
+        if self._coalesce_publish:
+            self._coalescable_publishes[key] = queued
+        stats.queued += 1
+        stats.max_queue_size = max(stats.max_queue_size, len(self._publish_queue))
+        return queued.future
+
+    @callback
+    def _async_publish_next(self) -> None:
+        """Publish queued messages while the in-flight window has free slots."""
+        while self._publish_queue and self._publish_inflight < self._max_inflight:
+            queued = self._publish_queue.popleft()
+            key = (queued.topic, queued.qos, queued.retain)
+            if self._coalescable_publishes.get(key) is queued:
+                del self._coalescable_publishes[key]
+            self._publish_inflight += 1
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_publish_queued(queued), "mqtt publish"
+            )
+
+    async def _async_publish_queued(self, queued: _QueuedPublish) -> None:
+        """Publish a queued message and resolve its future."""
+        try:
+            await self._async_publish_in_window(
+                queued.topic,
+                queued.payload,
+                queued.qos,
+                queued.retain,
+                queued.queued_at,
+            )
+        except asyncio.CancelledError:
+            queued.future.cancel()
+            raise
+        except Exception as err:  # noqa: BLE001
+            # Paho raises ValueError or TypeError for an invalid publish,
+            # the caller waits on the future so it must always be resolved
+            queued.future.set_exception(err)
+        else:
+            queued.future.set_result(None)
+
+    async def _async_publish_in_window(
+        self,
+        topic: str,
+        payload: PublishPayloadType,
+        qos: int,
+        retain: bool,
+        requested_at: float,
+    ) -> None:
+        """Publish a MQTT message in a taken slot of the in-flight window."""
+        stats = self._publish_stats
+        try:
+            msg_info = self._mqttc.publish(topic, payload, qos, retain)
+            _LOGGER.debug(
+                "Transmitting%s message on %s: '%s', mid: %s, qos: %s",
+                " retained" if retain else "",
+                topic,
+                payload,
+                msg_info.mid,
+                qos,
+            )
+            await self._async_wait_for_mid_or_raise(msg_info.mid, msg_info.rc)
+        except Exception:
+            stats.failed += 1
+            raise
+        finally:
+            self._publish_inflight -= 1
+            self._async_publish_next()
+        latency = time.monotonic() - requested_at
+        stats.published += 1
+        stats.latency_total += latency
+        stats.latency_max = max(stats.latency_max, latency)
 
     async def async_connect(self, client_available: asyncio.Future[bool]) -> None:
         """Connect to the host. Does not process messages yet."""
@@ -725,6 +965,10 @@ class MQTT:
         # make sure the unsubscribes are processed
         await self._async_perform_unsubscribes()
 
+        # wait for queued messages to be published
+        if queued := [queued.future for queued in self._publish_queue]:
+            await asyncio.wait(queued)
+
         # wait for ACKs to be processed
         if pending := self._pending_operations.values():
             await asyncio.wait(pending)
@@ -745,28 +989,26 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
+            self._matching_subscriptions_cache.pop(subscription.topic, None)
         else:
             self._wildcard_subscriptions[subscription] = None
+            self._wildcard_trie.add(subscription)
+            self._matching_subscriptions_cache.clear()
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -775,8 +1017,11 @@ class MQTT:
                 simple_subscriptions[topic].remove(subscription)
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
+                self._matching_subscriptions_cache.pop(topic, None)
             else:
                 del self._wildcard_subscriptions[subscription]
+                self._wildcard_trie.remove(subscription)
+                self._matching_subscriptions_cache.clear()
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -847,11 +1092,9 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -863,7 +1106,6 @@ class MQTT:
     def _async_remove(self, subscription: Subscription) -> None:
         """Remove subscription."""
         self._async_untrack_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
         # Only unsubscribe if currently connected
@@ -1056,18 +1298,16 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        """Return the subscriptions matching a topic."""
+        if (subscriptions := self._matching_subscriptions_cache.get(topic)) is not None:
+            return subscriptions
+        subscriptions = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_trie.match(topic))
+        self._matching_subscriptions_cache[topic] = subscriptions
         return subscriptions
 
     @callback
@@ -1097,7 +1337,12 @@ class MQTT:
             msg.payload[0:8192],
         )
         subscriptions = self._matching_subscriptions(topic)
-        msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
+        # Decode the payload once per encoding, None if it can't be decoded.
+        # Subscribers with the same encoding receive the same payload object.
+        payload_by_encoding: dict[str, SubscribePayloadType | None] = {}
+        msg_cache_by_subscription_topic: dict[
+            tuple[str, str | None], ReceiveMessage
+        ] = {}
 
         for subscription in subscriptions:
             if msg.retain:
@@ -1108,21 +1353,29 @@ class MQTT:
                 # Remember the subscription had an initial retained message
                 self._retained_topics[subscription].add(topic)
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
+            encoding = subscription.encoding
+            payload: SubscribePayloadType | None
+            if encoding is None:
+                payload = msg.payload
+            elif encoding in payload_by_encoding:
+                payload = payload_by_encoding[encoding]
+            else:
                 try:
-                    payload = msg.payload.decode(subscription.encoding)
+                    payload = msg.payload.decode(encoding)
                 except (AttributeError, UnicodeDecodeError):
-                    _LOGGER.warning(
-                        "Can't decode payload %s on %s with encoding %s (for %s)",
-                        msg.payload[0:8192],
-                        topic,
-                        subscription.encoding,
-                        subscription.job,
-                    )
-                    continue
-            subscription_topic = subscription.topic
-            if subscription_topic not in msg_cache_by_subscription_topic:
+                    payload = None
+                payload_by_encoding[encoding] = payload
+            if payload is None:
+                _LOGGER.warning(
+                    "Can't decode payload %s on %s with encoding %s (for %s)",
+                    msg.payload[0:8192],
+                    topic,
+                    encoding,
+                    subscription.job,
+                )
+                continue
+            cache_key = (subscription.topic, encoding)
+            if cache_key not in msg_cache_by_subscription_topic:
                 # Only make one copy of the message
                 # per topic so we avoid storing a separate
                 # dataclass in memory for each subscriber
@@ -1132,12 +1385,12 @@ class MQTT:
                     payload,
                     msg.qos,
                     msg.retain,
-                    subscription_topic,
+                    subscription.topic,
                     msg.timestamp,
                 )
-                msg_cache_by_subscription_topic[subscription_topic] = receive_msg
+                msg_cache_by_subscription_topic[cache_key] = receive_msg
             else:
-                receive_msg = msg_cache_by_subscription_topic[subscription_topic]
+                receive_msg = msg_cache_by_subscription_topic[cache_key]
             job = subscription.job
             if job.job_type is HassJobType.Callback:
                 # We do not wrap Callback jobs in catch_log_exception since
@@ -1263,13 +1516,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
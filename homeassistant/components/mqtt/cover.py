@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from contextlib import suppress
 import logging
 from typing import Any
 
@@ -33,7 +32,6 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.service_info.mqtt import ReceivePayloadType
 from homeassistant.helpers.typing import ConfigType, VolSchemaType
-from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.percentage import (
     percentage_to_ranged_value,
     ranged_value_to_percentage,
@@ -63,7 +61,12 @@ from .const import (
     PAYLOAD_NONE,
 )
 from .entity import MqttEntity, async_setup_entity_entry_helper
-from .models import MqttCommandTemplate, MqttValueTemplate, ReceiveMessage
+from .models import (
+    MqttCommandTemplate,
+    MqttValueTemplate,
+    ReceiveMessage,
+    async_payload_json,
+)
 from .schemas import MQTT_ENTITY_COMMON_SCHEMA
 from .util import valid_publish_topic, valid_subscribe_topic
 
@@ -420,14 +423,12 @@ class MqttCover(MqttEntity, CoverEntity):
     def _position_message_received(self, msg: ReceiveMessage) -> None:
         """Handle new MQTT position messages."""
         payload: ReceivePayloadType = self._get_position_template(msg.payload)
-        payload_dict: Any = None
 
         if not payload:
             _LOGGER.debug("Ignoring empty position message from '%s'", msg.topic)
             return
 
-        with suppress(*JSON_DECODE_EXCEPTIONS):
-            payload_dict = json_loads(payload)
+        payload_dict = async_payload_json(payload)
 
         if payload_dict and isinstance(payload_dict, dict):
             if "position" not in payload_dict:
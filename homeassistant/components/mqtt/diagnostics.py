@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
 from homeassistant.components import device_tracker
@@ -18,6 +19,7 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntry
 
 from . import debug_info, is_connected
+from .models import DATA_MQTT
 
 REDACT_CONFIG = {CONF_PASSWORD, CONF_USERNAME}
 REDACT_STATE_DEVICE_TRACKER = {ATTR_LATITUDE, ATTR_LONGITUDE}
@@ -59,6 +61,7 @@ def _async_get_diagnostics(
         data["mqtt_debug_info"] = debug_info.info_for_device(hass, device.id)
     else:
         device_registry = dr.async_get(hass)
+        mqtt_data = hass.data[DATA_MQTT]
         data.update(
             devices=[
                 _async_device_as_dict(hass, device)
@@ -67,6 +70,8 @@ def _async_get_diagnostics(
                 )
             ],
             mqtt_debug_info=debug_info.info_for_config_entry(hass),
+            discovery=asdict(mqtt_data.discovery_stats),
+            publish=asdict(mqtt_data.publish_stats),
         )
 
     return data
@@ -95,8 +95,7 @@ class MQTTIntegrationDiscoveryConfig:
     msg: ReceiveMessage
 
 
-@callback
-def _async_process_discovery_migration(payload: MQTTDiscoveryPayload) -> bool:
+def _process_discovery_migration(payload: MQTTDiscoveryPayload) -> bool:
     """Process a discovery migration request in the discovery payload."""
     # Allow abbreviation
     if migr_discvry := (payload.pop("migr_discvry", None)):
@@ -169,7 +168,6 @@ def async_log_discovery_origin_info(
     )
 
 
-@callback
 def _replace_abbreviations(
     payload: dict[str, Any] | str,
     abbreviations: dict[str, str],
@@ -182,7 +180,6 @@ def _replace_abbreviations(
         payload[abbreviations[key]] = payload.pop(key)
 
 
-@callback
 def _replace_all_abbreviations(
     discovery_payload: dict[str, Any], component_only: bool = False
 ) -> None:
@@ -272,6 +269,7 @@ def _generate_device_config(
 def _parse_device_payload(
     hass: HomeAssistant,
     payload: ReceivePayloadType,
+    device_payload: MQTTDiscoveryPayload | None,
     object_id: str,
     node_id: str | None,
 ) -> MQTTDiscoveryPayload:
@@ -281,24 +279,20 @@ def _parse_device_payload(
     component inside the device based configuration.
     An empty payload is translated in a cleanup, which forwards an empty payload to all
     removed components.
+    The device_payload is the payload as loaded by _load_discovery_payload.
     """
-    device_payload = MQTTDiscoveryPayload()
     if payload == "":
-        if not (device_payload := _generate_device_config(hass, object_id, node_id)):
+        if not (cleanup_payload := _generate_device_config(hass, object_id, node_id)):
             _LOGGER.warning(
                 "No device components to cleanup for %s, node_id '%s'",
                 object_id,
                 node_id,
             )
-        return device_payload
-    try:
-        device_payload = MQTTDiscoveryPayload(json_loads_object(payload))
-    except ValueError:
-        _LOGGER.warning("Unable to parse JSON %s: '%s'", object_id, payload)
-        return device_payload
-    if _async_process_discovery_migration(device_payload):
+        return cleanup_payload
+    if device_payload is None:
+        return MQTTDiscoveryPayload()
+    if device_payload.migrate_discovery:
         return _generate_device_config(hass, object_id, node_id, migrate_discovery=True)
-    _replace_all_abbreviations(device_payload)
     try:
         DEVICE_DISCOVERY_SCHEMA(device_payload)
     except vol.Invalid as exc:
@@ -312,7 +306,6 @@ def _parse_device_payload(
     return device_payload
 
 
-@callback
 def _valid_origin_info(discovery_payload: MQTTDiscoveryPayload) -> bool:
     """Parse and validate origin info from a single component discovery payload."""
     if CONF_ORIGIN not in discovery_payload:
@@ -329,6 +322,43 @@ def _valid_origin_info(discovery_payload: MQTTDiscoveryPayload) -> bool:
     return True
 
 
+def _load_discovery_payload(
+    component: str, object_id: str, payload: ReceivePayloadType
+) -> MQTTDiscoveryPayload | None:
+    """Load a discovery payload.
+
+    Decodes the JSON, handles a discovery migration request, replaces the
+    abbreviations and validates the origin info of a component payload.
+    Returns None if the payload is invalid. Does not access hass, so it is
+    safe to call from a worker thread.
+    """
+    if component == CONF_DEVICE and payload == "":
+        return MQTTDiscoveryPayload()
+    try:
+        discovery_payload = MQTTDiscoveryPayload(
+            json_loads_object(payload) if payload else {}
+        )
+    except ValueError:
+        _LOGGER.warning("Unable to parse JSON %s: '%s'", object_id, payload)
+        return None
+    if _process_discovery_migration(discovery_payload):
+        return discovery_payload
+    _replace_all_abbreviations(discovery_payload)
+    if component != CONF_DEVICE and not _valid_origin_info(discovery_payload):
+        return None
+    return discovery_payload
+
+
+def _load_discovery_payloads(
+    batch: list[tuple[str, str, ReceivePayloadType]],
+) -> list[MQTTDiscoveryPayload | None]:
+    """Load a batch of (component, object_id, payload) discovery payloads."""
+    return [
+        _load_discovery_payload(component, object_id, payload)
+        for component, object_id, payload in batch
+    ]
+
+
 @callback
 def _merge_common_device_options(
     component_config: MQTTDiscoveryPayload, device_config: dict[str, Any]
@@ -358,8 +388,17 @@ async def async_start(  # noqa: C901
 ) -> None:
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
-    platform_setup_lock: dict[str, asyncio.Lock] = {}
+    discovery_stats = mqtt_data.discovery_stats
     integration_discovery_messages: dict[str, MQTTIntegrationDiscoveryConfig] = {}
+    # Payloads waiting for their platform to be set up, keyed by component
+    pending_setups: dict[str, list[MQTTDiscoveryPayload]] = {}
+    # Hash of the last processed payload and the discovery hashes
+    # it produced, keyed by discovery topic
+    payload_hashes: dict[str, tuple[int, tuple[tuple[str, str], ...]]] = {}
+    # Retained messages waiting to be loaded in a worker thread
+    bulk_messages: list[tuple[ReceiveMessage, str, str | None, str]] = []
+    bulk_task: asyncio.Task[None] | None = None
+    burst_start: float | None = None
 
     @callback
     def _async_add_component(discovery_payload: MQTTDiscoveryPayload) -> None:
@@ -373,22 +412,85 @@ async def async_start(  # noqa: C901
             hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payload
         )
 
-    async def _async_component_setup(
-        component: str, discovery_payload: MQTTDiscoveryPayload
-    ) -> None:
-        """Perform component set up."""
-        async with platform_setup_lock.setdefault(component, asyncio.Lock()):
+    async def _async_component_setup(component: str) -> None:
+        """Perform component set up and add the components queued meanwhile."""
+        try:
             if component not in mqtt_data.platforms_loaded:
                 await async_forward_entry_setup_and_setup_discovery(
                     hass, config_entry, {component}
                 )
-        _async_add_component(discovery_payload)
+        finally:
+            discovery_payloads = pending_setups.pop(component)
+        for discovery_payload in discovery_payloads:
+            _async_add_component(discovery_payload)
+
+    @callback
+    def _async_check_discovery_done() -> None:
+        """Report the time it took to make all entities of a burst available."""
+        nonlocal burst_start
+        if (
+            burst_start is None
+            or bulk_task is not None
+            or pending_setups
+            or mqtt_data.discovery_pending_discovered
+        ):
+            return
+        discovery_stats.time_to_available = time.monotonic() - burst_start
+        burst_start = None
+        _LOGGER.debug(
+            "Discovered components available after %.3f seconds",
+            discovery_stats.time_to_available,
+        )
+
+    @callback
+    def _async_skip_unchanged(topic: str, payload: ReceivePayloadType) -> bool:
+        """Return True if the payload is unchanged and already processed."""
+        if (
+            not (processed := payload_hashes.get(topic))
+            or processed[0] != hash(payload)
+            or any(
+                discovery_hash not in mqtt_data.discovery_already_discovered
+                or discovery_hash in mqtt_data.discovery_pending_discovered
+                for discovery_hash in processed[1]
+            )
+        ):
+            return False
+        discovery_stats.deduplicated += 1
+        _LOGGER.debug("Ignoring unchanged discovery payload on topic %s", topic)
+        return True
+
+    async def _async_process_bulk_discovery() -> None:
+        """Load buffered discovery payloads in batches in a worker thread."""
+        nonlocal bulk_task
+        try:
+            while bulk_messages:
+                batch = bulk_messages.copy()
+                bulk_messages.clear()
+                discovery_stats.bulk_batches += 1
+                discovery_stats.bulk_messages += len(batch)
+                loaded_payloads = await hass.async_add_executor_job(
+                    _load_discovery_payloads,
+                    [
+                        (component, object_id, msg.payload)
+                        for msg, component, _, object_id in batch
+                    ],
+                )
+                for (msg, component, node_id, object_id), discovery_payload in zip(
+                    batch, loaded_payloads, strict=True
+                ):
+                    if not _async_skip_unchanged(msg.topic, msg.payload):
+                        _async_process_discovery_message(
+                            msg, component, node_id, object_id, discovery_payload
+                        )
+        finally:
+            bulk_task = None
+        _async_check_discovery_done()
 
     @callback
     def async_discovery_message_received(msg: ReceiveMessage) -> None:
         """Process the received message."""
+        nonlocal bulk_task, burst_start
         mqtt_data.last_discovery = msg.timestamp
-        payload = msg.payload
         topic = msg.topic
         topic_trimmed = topic.replace(f"{discovery_topic}/", "", 1)
 
@@ -405,7 +507,45 @@ async def async_start(  # noqa: C901
             return
 
         component, node_id, object_id = match.groups()
+        discovery_stats.messages += 1
+        if burst_start is None:
+            burst_start = msg.timestamp
+
+        if msg.retain or bulk_task is not None:
+            # Retained messages arrive in a storm after (re)connecting.
+            # They are buffered and loaded in batches in a worker thread,
+            # later messages are buffered too, to keep them in order.
+            bulk_messages.append((msg, component, node_id, object_id))
+            if bulk_task is None:
+                bulk_task = config_entry.async_create_task(
+                    hass,
+                    _async_process_bulk_discovery(),
+                    "mqtt bulk discovery",
+                    eager_start=False,
+                )
+            return
+
+        if not _async_skip_unchanged(topic, msg.payload):
+            _async_process_discovery_message(
+                msg,
+                component,
+                node_id,
+                object_id,
+                _load_discovery_payload(component, object_id, msg.payload),
+            )
+        _async_check_discovery_done()
 
+    @callback
+    def _async_process_discovery_message(
+        msg: ReceiveMessage,
+        component: str,
+        node_id: str | None,
+        object_id: str,
+        loaded_payload: MQTTDiscoveryPayload | None,
+    ) -> None:
+        """Process a loaded discovery message."""
+        payload = msg.payload
+        topic = msg.topic
         discovered_components: list[MqttComponentConfig] = []
         if component == CONF_DEVICE:
             # Process device based discovery message and regenerate
@@ -415,9 +555,10 @@ async def async_start(  # noqa: C901
             # In that case this will regenerate a cleanup message for all every already
             # discovered components that were linked to the initial device discovery.
             device_discovery_payload = _parse_device_payload(
-                hass, payload, object_id, node_id
+                hass, payload, loaded_payload, object_id, node_id
             )
             if not device_discovery_payload:
+                payload_hashes.pop(topic, None)
                 return
             device_config: dict[str, Any]
             origin_config: dict[str, Any] | None
@@ -471,21 +612,32 @@ async def async_start(  # noqa: C901
 
         else:
             # Process component based discovery message
-            try:
-                discovery_payload = MQTTDiscoveryPayload(
-                    json_loads_object(payload) if payload else {}
-                )
-            except ValueError:
-                _LOGGER.warning("Unable to parse JSON %s: '%s'", object_id, payload)
+            if loaded_payload is None:
+                payload_hashes.pop(topic, None)
                 return
-            if not _async_process_discovery_migration(discovery_payload):
-                _replace_all_abbreviations(discovery_payload)
-                if not _valid_origin_info(discovery_payload):
-                    return
             discovered_components.append(
-                MqttComponentConfig(component, object_id, node_id, discovery_payload)
+                MqttComponentConfig(component, object_id, node_id, loaded_payload)
             )
 
+        if payload and not any(
+            component_config.discovery_payload.migrate_discovery
+            for component_config in discovered_components
+        ):
+            payload_hashes[topic] = (
+                hash(payload),
+                tuple(
+                    (
+                        component_config.component,
+                        f"{component_config.node_id} {component_config.object_id}"
+                        if component_config.node_id
+                        else component_config.object_id,
+                    )
+                    for component_config in discovered_components
+                ),
+            )
+        else:
+            payload_hashes.pop(topic, None)
+
         discovery_pending_discovered = mqtt_data.discovery_pending_discovered
         for component_config in discovered_components:
             component = component_config.component
@@ -541,6 +693,7 @@ async def async_start(  # noqa: C901
                 if not pending:
                     discovery_pending_discovered[discovery_hash]["unsub"]()
                     discovery_pending_discovered.pop(discovery_hash)
+                    _async_check_discovery_done()
                 else:
                     payload = pending.pop()
                     async_process_discovery_payload(component, discovery_id, payload)
@@ -554,11 +707,13 @@ async def async_start(  # noqa: C901
                 "pending": deque([]),
             }
 
-        if component not in mqtt_data.platforms_loaded and payload:
+        if component in pending_setups and payload:
+            # Platform set up is in progress, add the component when it is done
+            pending_setups[component].append(payload)
+        elif component not in mqtt_data.platforms_loaded and payload:
             # Load component first
-            config_entry.async_create_task(
-                hass, _async_component_setup(component, payload)
-            )
+            pending_setups[component] = [payload]
+            config_entry.async_create_task(hass, _async_component_setup(component))
         elif already_discovered:
             # Dispatch update
             message = f"Component has already been discovered: {component} {discovery_id}, sending update"
@@ -57,7 +57,6 @@ from homeassistant.helpers.typing import (
     UndefinedType,
     VolSchemaType,
 )
-from homeassistant.util.json import json_loads
 from homeassistant.util.yaml import dump as yaml_dump
 
 from . import debug_info, subscription
@@ -115,6 +114,7 @@ from .models import (
     MqttValueTemplateException,
     PublishPayloadType,
     ReceiveMessage,
+    async_payload_json_copy,
 )
 from .subscription import (
     EntitySubscription,
@@ -426,21 +426,21 @@ class MqttAttributesMixin(Entity):
         payload = (
             self._attr_tpl(msg.payload) if self._attr_tpl is not None else msg.payload
         )
-        try:
-            json_dict = json_loads(payload) if isinstance(payload, str) else None
-        except ValueError:
+        json_dict = (
+            async_payload_json_copy(payload) if isinstance(payload, str) else None
+        )
+        if json_dict is UNDEFINED:
             _LOGGER.warning("Erroneous JSON: %s", payload)
+        elif isinstance(json_dict, dict):
+            filtered_dict = {
+                k: v
+                for k, v in json_dict.items()
+                if k not in MQTT_ATTRIBUTES_BLOCKED
+                and k not in self._attributes_extra_blocked
+            }
+            self._attr_extra_state_attributes = filtered_dict
         else:
-            if isinstance(json_dict, dict):
-                filtered_dict = {
-                    k: v
-                    for k, v in json_dict.items()
-                    if k not in MQTT_ATTRIBUTES_BLOCKED
-                    and k not in self._attributes_extra_blocked
-                }
-                self._attr_extra_state_attributes = filtered_dict
-            else:
-                _LOGGER.warning("JSON result was not a dictionary")
+            _LOGGER.warning("JSON result was not a dictionary")
 
 
 class MqttAvailabilityMixin(Entity):
@@ -18,12 +18,14 @@ from homeassistant.helpers import template
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.service_info.mqtt import ReceivePayloadType
 from homeassistant.helpers.typing import (
+    UNDEFINED,
     ConfigType,
     DiscoveryInfoType,
     TemplateVarsType,
     VolSchemaType,
 )
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -95,6 +97,63 @@ class ReceiveMessage:
 type MessageCallbackType = Callable[[ReceiveMessage], None]
 
 
+class _PayloadJsonCache:
+    """Hold the last payload parsed as JSON."""
+
+    __slots__ = ("payload", "value_json")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.payload: ReceivePayloadType | None = None
+        self.value_json: Any = UNDEFINED
+
+
+_PAYLOAD_JSON_CACHE = _PayloadJsonCache()
+
+
+@callback
+def async_payload_json(payload: ReceivePayloadType) -> Any:
+    """Return a payload parsed as JSON, or UNDEFINED if it is not valid JSON.
+
+    All subscribers of a message with the same encoding receive the same
+    payload object, so the last parsed payload is kept to parse a message
+    only once. The result is shared by the subscribers and must be treated
+    as read-only, templates can't modify it as they render in an immutable
+    sandbox. Use async_payload_json_copy when the value is handed on.
+    """
+    cache = _PAYLOAD_JSON_CACHE
+    if payload is cache.payload:
+        return cache.value_json
+    try:
+        value_json: Any = json_loads(payload)
+    except JSON_DECODE_EXCEPTIONS:
+        value_json = UNDEFINED
+    # A bytearray can be modified, so it can't be cached by identity
+    if not isinstance(payload, bytearray):
+        cache.payload = payload
+        cache.value_json = value_json
+    return value_json
+
+
+def _json_copy(value: Any) -> Any:
+    """Return a copy of a JSON value that shares no containers with it."""
+    if isinstance(value, dict):
+        return {key: _json_copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_json_copy(item) for item in value]
+    return value
+
+
+@callback
+def async_payload_json_copy(payload: ReceivePayloadType) -> Any:
+    """Return a copy of a payload parsed as JSON, or UNDEFINED.
+
+    The copy is owned by the caller, for values that leave the template
+    sandbox such as trigger data or state attributes.
+    """
+    return _json_copy(async_payload_json(payload))
+
+
 class SubscriptionDebugInfo(TypedDict):
     """Class for holding subscription debug info."""
 
@@ -300,6 +359,10 @@ class MqttValueTemplate:
                 )
             values[ATTR_THIS] = self._template_state
 
+        value_json = (
+            UNDEFINED if self._value_template.is_static else async_payload_json(payload)
+        )
+
         if default is PayloadSentinel.NONE:
             _LOGGER.debug(
                 "Rendering incoming payload '%s' with variables %s and %s",
@@ -310,7 +373,7 @@ class MqttValueTemplate:
             try:
                 rendered_payload = (
                     self._value_template.async_render_with_possible_json_value(
-                        payload, variables=values
+                        payload, variables=values, value_json=value_json
                     )
                 )
             except TEMPLATE_ERRORS as exc:
@@ -336,7 +399,7 @@ class MqttValueTemplate:
         try:
             rendered_payload = (
                 self._value_template.async_render_with_possible_json_value(
-                    payload, default, variables=values
+                    payload, default, variables=values, value_json=value_json
                 )
             )
         except TEMPLATE_ERRORS as exc:
@@ -379,6 +442,35 @@ class EntityTopicState:
         self.subscribe_calls[entity.entity_id] = entity
 
 
+@dataclass(slots=True)
+class DiscoveryStats:
+    """Counters of the MQTT discovery."""
+
+    messages: int = 0
+    deduplicated: int = 0
+    bulk_batches: int = 0
+    bulk_messages: int = 0
+    # Seconds from the first message of the last discovery burst
+    # until all its discovered components were set up
+    time_to_available: float | None = None
+
+
+@dataclass(slots=True)
+class PublishStats:
+    """Counters of the outbound MQTT messages."""
+
+    published: int = 0
+    failed: int = 0
+    queued: int = 0
+    coalesced: int = 0
+    max_queue_size: int = 0
+    # Seconds from the publish request until the ACK of the broker
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    # Socket writes, each flushes all packets queued since the last one
+    write_batches: int = 0
+
+
 @dataclass
 class MqttData:
     """Keep the MQTT entry data."""
@@ -398,10 +490,12 @@ class MqttData:
     discovery_registry_hooks: dict[tuple[str, str], CALLBACK_TYPE] = field(
         default_factory=dict
     )
+    discovery_stats: DiscoveryStats = field(default_factory=DiscoveryStats)
     discovery_unsubscribe: list[CALLBACK_TYPE] = field(default_factory=list)
     integration_unsubscribe: dict[str, CALLBACK_TYPE] = field(default_factory=dict)
     last_discovery: float = 0.0
     platforms_loaded: set[Platform | str] = field(default_factory=set)
+    publish_stats: PublishStats = field(default_factory=PublishStats)
     reload_dispatchers: list[CALLBACK_TYPE] = field(default_factory=list)
     reload_handlers: dict[str, CALLBACK_TYPE] = field(default_factory=dict)
     reload_schema: dict[str, VolSchemaType] = field(default_factory=dict)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from contextlib import suppress
 import logging
 from typing import Any
 
@@ -21,8 +20,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.service_info.mqtt import ReceivePayloadType
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.trigger import TriggerActionType, TriggerData, TriggerInfo
-from homeassistant.helpers.typing import ConfigType, TemplateVarsType
-from homeassistant.util.json import json_loads
+from homeassistant.helpers.typing import UNDEFINED, ConfigType, TemplateVarsType
 
 from .client import async_subscribe_internal
 from .const import (
@@ -39,6 +37,7 @@ from .models import (
     PayloadSentinel,
     PublishPayloadType,
     ReceiveMessage,
+    async_payload_json_copy,
 )
 from .util import valid_subscribe_topic, valid_subscribe_topic_template
 
@@ -103,8 +102,10 @@ async def async_attach_trigger(
                 "description": f"mqtt topic {mqttmsg.topic}",
             }
 
-            with suppress(ValueError):
-                data["payload_json"] = json_loads(mqttmsg.payload)
+            if (
+                payload_json := async_payload_json_copy(mqttmsg.payload)
+            ) is not UNDEFINED:
+                data["payload_json"] = payload_json
 
             hass.async_run_hass_job(job, {"trigger": data})
 
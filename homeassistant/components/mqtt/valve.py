@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from contextlib import suppress
 import logging
 from typing import Any
 
@@ -26,7 +25,6 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, VolSchemaType
-from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.percentage import (
     percentage_to_ranged_value,
     ranged_value_to_percentage,
@@ -57,7 +55,12 @@ from .const import (
     PAYLOAD_NONE,
 )
 from .entity import MqttEntity, async_setup_entity_entry_helper
-from .models import MqttCommandTemplate, MqttValueTemplate, ReceiveMessage
+from .models import (
+    MqttCommandTemplate,
+    MqttValueTemplate,
+    ReceiveMessage,
+    async_payload_json,
+)
 from .schemas import MQTT_ENTITY_COMMON_SCHEMA
 from .util import valid_publish_topic, valid_subscribe_topic
 
@@ -298,7 +301,6 @@ class MqttValve(MqttEntity, ValveEntity):
     def _state_message_received(self, msg: ReceiveMessage) -> None:
         """Handle new MQTT state messages."""
         payload = self._value_template(msg.payload)
-        payload_dict: Any = None
         position_payload: Any = payload
         state_payload: Any = payload
 
@@ -306,27 +308,26 @@ class MqttValve(MqttEntity, ValveEntity):
             _LOGGER.debug("Ignoring empty state message from '%s'", msg.topic)
             return
 
-        with suppress(*JSON_DECODE_EXCEPTIONS):
-            payload_dict = json_loads(payload)
-            if isinstance(payload_dict, dict):
-                if self.reports_position and "position" not in payload_dict:
-                    _LOGGER.warning(
-                        "Missing required `position` attribute in json payload "
-                        "on topic '%s', got: %s",
-                        msg.topic,
-                        payload,
-                    )
-                    return
-                if not self.reports_position and "state" not in payload_dict:
-                    _LOGGER.warning(
-                        "Missing required `state` attribute in json payload "
-                        " on topic '%s', got: %s",
-                        msg.topic,
-                        payload,
-                    )
-                    return
-                position_payload = payload_dict.get("position")
-                state_payload = payload_dict.get("state")
+        payload_dict = async_payload_json(payload)
+        if isinstance(payload_dict, dict):
+            if self.reports_position and "position" not in payload_dict:
+                _LOGGER.warning(
+                    "Missing required `position` attribute in json payload "
+                    "on topic '%s', got: %s",
+                    msg.topic,
+                    payload,
+                )
+                return
+            if not self.reports_position and "state" not in payload_dict:
+                _LOGGER.warning(
+                    "Missing required `state` attribute in json payload "
+                    " on topic '%s', got: %s",
+                    msg.topic,
+                    payload,
+                )
+                return
+            position_payload = payload_dict.get("position")
+            state_payload = payload_dict.get("state")
 
         if self._config[CONF_REPORTS_POSITION]:
             self._process_position_valve_update(msg, position_payload, state_payload)
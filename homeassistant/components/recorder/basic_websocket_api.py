@@ -16,6 +16,9 @@ from .util import get_instance
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the recorder websocket API."""
     websocket_api.async_register_command(hass, ws_info)
+    websocket_api.async_register_command(hass, ws_read_queries)
+    websocket_api.async_register_command(hass, ws_purge_progress)
+    websocket_api.async_register_command(hass, ws_statistics_catch_up)
 
 
 @websocket_api.websocket_command(
@@ -54,3 +57,60 @@ def ws_info(
         "thread_running": is_running,
     }
     connection.send_result(msg["id"], recorder_info)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/read_queries",
+    }
+)
+@callback
+def ws_read_queries(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the duration, rows and queue wait of the read-only queries."""
+    if (instance := get_instance(hass)) and (
+        scheduler := instance.read_query_scheduler
+    ):
+        connection.send_result(msg["id"], scheduler.async_info())
+        return
+    connection.send_error(
+        msg["id"], websocket_api.ERR_NOT_FOUND, "Recorder is not running"
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/purge_progress",
+    }
+)
+@callback
+def ws_purge_progress(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the progress and throughput of the current or last purge."""
+    if instance := get_instance(hass):
+        connection.send_result(msg["id"], instance.purge_progress.as_dict())
+        return
+    connection.send_error(
+        msg["id"], websocket_api.ERR_NOT_FOUND, "Recorder is not running"
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/statistics_catch_up",
+    }
+)
+@callback
+def ws_statistics_catch_up(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the progress of compiling statistics missed while not running."""
+    if instance := get_instance(hass):
+        progress = instance.statistics_catch_up
+        connection.send_result(msg["id"], progress and progress.as_dict())
+        return
+    connection.send_error(
+        msg["id"], websocket_api.ERR_NOT_FOUND, "Recorder is not running"
+    )
@@ -0,0 +1,176 @@
+"""Bulk insert pending recorder rows with executemany."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm.session import Session
+
+from .db_schema import (
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+# Foreign keys are resolved from the relationship to a pending
+# row when the row was created in the same commit window.
+# (foreign key column, relationship, primary key of the related row)
+_FOREIGN_KEYS: dict[type[Base], tuple[tuple[str, str, str], ...]] = {
+    Events: (
+        ("event_type_id", "event_type_rel", "event_type_id"),
+        ("data_id", "event_data_rel", "data_id"),
+    ),
+    States: (
+        ("metadata_id", "states_meta_rel", "metadata_id"),
+        ("attributes_id", "state_attributes", "attributes_id"),
+        ("old_state_id", "old_state", "state_id"),
+    ),
+}
+
+# Rows are inserted in an order where every row
+# can reference the rows it depends on by id.
+_INSERT_ORDER: tuple[type[Base], ...] = (
+    EventTypes,
+    EventData,
+    StatesMeta,
+    StateAttributes,
+    Events,
+    States,
+)
+
+# The ids of events are never read back after they are written
+_NO_RETURNING = {Events}
+
+
+class BulkInserter:
+    """Insert the rows of a commit window with executemany.
+
+    The ORM unit of work inserts self-referencing States rows
+    one at a time. Instead the pending rows are kept out of the
+    session and inserted with one executemany per table and batch,
+    and the generated ids are copied back on to the pending objects
+    so the table managers can pick them up after the commit.
+
+    This class is not thread-safe and must only be used
+    from the recorder thread.
+    """
+
+    def __init__(self, batch_size: int) -> None:
+        """Initialize the bulk inserter."""
+        self.batch_size = batch_size
+        self._pending: dict[type[Base], list[Any]] = {
+            table: [] for table in _INSERT_ORDER
+        }
+        self._columns: dict[type[Base], tuple[str, ...]] = {
+            table: tuple(
+                column.key for column in _table(table).columns if not column.primary_key
+            )
+            for table in _INSERT_ORDER
+        }
+        self.pending_rows = 0
+        self.uncommitted_rows = 0
+
+    def add(self, obj: Base) -> None:
+        """Add a row to insert on the next flush."""
+        self._pending[type(obj)].append(obj)
+        self.pending_rows += 1
+        self.uncommitted_rows += 1
+
+    def flush(self, session: Session) -> None:
+        """Insert all pending rows.
+
+        The rows are only dropped once every table has been inserted
+        so they are inserted again when the commit is retried.
+        """
+        if not self.pending_rows:
+            return
+        for table in _INSERT_ORDER:
+            if not (pending := self._pending[table]):
+                continue
+            if table is States:
+                self._insert_states(session, pending)
+            else:
+                self._insert(session, table, pending)
+        for pending in self._pending.values():
+            pending.clear()
+        self.pending_rows = 0
+
+    def post_commit(self) -> None:
+        """Call after the rows have been committed."""
+        self.uncommitted_rows = 0
+
+    def reset(self) -> None:
+        """Drop all pending rows after the session was rolled back."""
+        for pending in self._pending.values():
+            pending.clear()
+        self.pending_rows = 0
+        self.uncommitted_rows = 0
+
+    def _insert_states(self, session: Session, pending: list[States]) -> None:
+        """Insert states in rounds so old_state_id is known before it is written."""
+        # The ids are not checked for None since a failed
+        # flush that is retried leaves the ids of the attempt
+        # before on the objects.
+        not_inserted = {id(dbstate) for dbstate in pending}
+        while pending:
+            ready: list[States] = []
+            deferred: list[States] = []
+            for dbstate in pending:
+                old_state = dbstate.__dict__.get("old_state")
+                if old_state is not None and id(old_state) in not_inserted:
+                    deferred.append(dbstate)
+                else:
+                    ready.append(dbstate)
+            self._insert(session, States, ready)
+            not_inserted.difference_update(id(dbstate) for dbstate in ready)
+            pending = deferred
+
+    def _insert(self, session: Session, table: type[Base], objs: list[Any]) -> None:
+        """Insert rows in batches and set the generated ids on the objects."""
+        sa_table = _table(table)
+        rows = _rows(objs, self._columns[table], _FOREIGN_KEYS.get(table, ()))
+        batch_size = self.batch_size
+        if table in _NO_RETURNING:
+            stmt = insert(sa_table)
+            for start in range(0, len(rows), batch_size):
+                session.execute(stmt, rows[start : start + batch_size])
+            return
+        (primary_key,) = sa_table.primary_key.columns
+        stmt_returning = insert(sa_table).returning(
+            primary_key, sort_by_parameter_order=True
+        )
+        key = primary_key.key
+        for start in range(0, len(rows), batch_size):
+            ids = session.execute(
+                stmt_returning, rows[start : start + batch_size]
+            ).scalars()
+            for obj, id_ in zip(objs[start : start + batch_size], ids, strict=True):
+                setattr(obj, key, id_)
+
+
+def _table(table: type[Base]) -> Table:
+    """Return the table of a mapped class."""
+    return table.__table__  # type: ignore[return-value]
+
+
+def _rows(
+    objs: Iterable[Any],
+    columns: tuple[str, ...],
+    foreign_keys: tuple[tuple[str, str, str], ...],
+) -> list[dict[str, Any]]:
+    """Build the parameters for each pending row."""
+    rows: list[dict[str, Any]] = []
+    for obj in objs:
+        values = obj.__dict__
+        row = {column: values.get(column) for column in columns}
+        for column, relationship, related_key in foreign_keys:
+            if (related := values.get(relationship)) is not None:
+                row[column] = related.__dict__.get(related_key)
+        rows.append(row)
+    return rows
@@ -28,13 +28,29 @@ DOMAIN = "recorder"
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
+
+# The number of commit intervals a commit can be deferred
+# for while the backlog is larger than a bulk insert batch
+BULK_INSERT_MAX_DEFERRED_COMMITS = 5
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
 # The maximum number of rows (events) we purge in one delete statement
 
 DEFAULT_MAX_BIND_VARS = 4000
 
+# The wall clock time in seconds a slice of the purge may
+# run for before it commits and yields to the recorder queue
+PURGE_SLICE_TIME_BUDGET = 10
+# The purge batch size is adapted so a batch takes about this
+# many seconds, but is never smaller than PURGE_MIN_BATCH_SIZE
+PURGE_BATCH_TARGET_LATENCY = 0.5
+PURGE_MIN_BATCH_SIZE = 100
+PURGE_CURSOR_STORAGE_KEY = "recorder.purge"
+PURGE_CURSOR_STORAGE_VERSION = 1
+PURGE_CURSOR_SAVE_DELAY = 30
+
 DB_WORKER_PREFIX = "DbWorker"
+DB_READ_WORKER_PREFIX = "DbReader"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
@@ -52,12 +68,14 @@ LAST_REPORTED_SCHEMA_VERSION = 43
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
 INTEGRATION_PLATFORM_COMPILE_STATISTICS = "compile_statistics"
+INTEGRATION_PLATFORM_COMPILE_STATISTICS_BATCH = "compile_statistics_batch"
 INTEGRATION_PLATFORM_LIST_STATISTIC_IDS = "list_statistic_ids"
 INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES = "update_statistics_issues"
 INTEGRATION_PLATFORM_VALIDATE_STATISTICS = "validate_statistics"
 
 INTEGRATION_PLATFORM_METHODS = {
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
+    INTEGRATION_PLATFORM_COMPILE_STATISTICS_BATCH,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
@@ -70,3 +88,11 @@ class SupportedDialect(StrEnum):
     SQLITE = "sqlite"
     MYSQL = "mysql"
     POSTGRESQL = "postgresql"
+
+
+class ReadQueryKind(StrEnum):
+    """Kinds of read-only queries scheduled on the read executor."""
+
+    HISTORY = "history"
+    LOGBOOK = "logbook"
+    STATISTICS = "statistics"
@@ -44,13 +44,17 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import BulkInserter
 from .const import (
+    BULK_INSERT_MAX_DEFERRED_COMMITS,
+    DB_READ_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DEFAULT_MAX_BIND_VARS,
     DOMAIN,
@@ -62,7 +66,11 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    PURGE_CURSOR_SAVE_DELAY,
+    PURGE_CURSOR_STORAGE_KEY,
+    PURGE_CURSOR_STORAGE_VERSION,
     SQLITE_URL_PREFIX,
+    ReadQueryKind,
     SupportedDialect,
 )
 from .db_schema import (
@@ -79,7 +87,9 @@ from .db_schema import (
 )
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
-from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .pool import POOL_SIZE, READ_POOL_SIZE, MutexPool, RecorderPool
+from .purge_progress import PurgeCursor, PurgeProgress
+from .read_pool import ReadQueryScheduler
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -143,7 +153,8 @@ QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
-# Pool size must accommodate Recorder thread + All db executors
+# Pool size must accommodate Recorder thread + All db executors,
+# the read executor has READ_POOL_SIZE connections of its own
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
 
 
@@ -164,6 +175,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        bulk_insert_batch_size: int | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -177,6 +189,10 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.bulk_insert_batch_size = bulk_insert_batch_size
+        self._bulk_inserter: BulkInserter | None = None
+        self._deferred_commits = 0
+        self._bulk_commit_queued = False
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -220,6 +236,8 @@ class Recorder(threading.Thread):
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self.read_query_scheduler: ReadQueryScheduler | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -234,6 +252,13 @@ class Recorder(threading.Thread):
         # and determine what is actually supported.
         self.max_bind_vars = DEFAULT_MAX_BIND_VARS
 
+        self.purge_progress = PurgeProgress(DEFAULT_MAX_BIND_VARS)
+        self.statistics_catch_up: statistics.StatisticsCatchUpProgress | None = None
+        self._purge_store: Store[dict[str, PurgeCursor | None]] = Store(
+            hass, PURGE_CURSOR_STORAGE_VERSION, PURGE_CURSOR_STORAGE_KEY
+        )
+        self._resume_purge: PurgeCursor | None = None
+
     @property
     def backlog(self) -> int:
         """Return the number of items in the recorder backlog."""
@@ -279,6 +304,15 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self._db_read_executor = DBInterruptibleThreadPoolExecutor(
+            self.recorder_and_worker_thread_ids,
+            thread_name_prefix=DB_READ_WORKER_PREFIX,
+            max_workers=READ_POOL_SIZE,
+            shutdown_hook=self._shutdown_pool,
+        )
+        self.read_query_scheduler = ReadQueryScheduler(
+            self.hass, self._db_read_executor, READ_POOL_SIZE
+        )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -343,9 +377,28 @@ class Recorder(threading.Thread):
             self._event_listener
             and not self._database_lock_task
             and self._event_session_has_pending_writes
+            and not self._async_defer_commit()
         ):
             self.queue_task(COMMIT_TASK)
 
+    @callback
+    def _async_defer_commit(self) -> bool:
+        """Return if the commit should wait for the next commit interval.
+
+        When inserting in bulk the commit window grows while the backlog
+        is larger than a batch so an event storm is written with fewer
+        and larger transactions.
+        """
+        if (
+            (bulk_inserter := self._bulk_inserter) is None
+            or self.backlog < bulk_inserter.batch_size
+            or self._deferred_commits >= BULK_INSERT_MAX_DEFERRED_COMMITS
+        ):
+            self._deferred_commits = 0
+            return False
+        self._deferred_commits += 1
+        return True
+
     @callback
     def async_add_executor_job[_T](
         self, target: Callable[..., _T], *args: Any
@@ -353,6 +406,19 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_job[_T](
+        self, kind: ReadQueryKind, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a read-only query from within the event loop.
+
+        Read-only queries run on their own executor and connections, and
+        history, logbook and statistics queries are scheduled in turn.
+        """
+        if self.read_query_scheduler is None:
+            return self.async_add_executor_job(target, *args)
+        return self.read_query_scheduler.async_add_job(kind, target, *args)
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -501,8 +567,43 @@ class Recorder(threading.Thread):
         Called after all migration steps are finished.
         """
         self._async_setup_periodic_tasks()
+        self._async_resume_purge()
         self.async_recorder_ready.set()
 
+    async def async_load_purge_cursor(self) -> None:
+        """Load the cursor of a purge that did not finish before the restart."""
+        if data := await self._purge_store.async_load():
+            self._resume_purge = data.get("cursor")
+
+    @callback
+    def _async_resume_purge(self) -> None:
+        """Resume a purge that did not finish before the restart."""
+        if not (cursor := self._resume_purge):
+            return
+        self._resume_purge = None
+        if not (purge_before := dt_util.parse_datetime(cursor["purge_before"])):
+            return
+        _LOGGER.debug("Resuming purge of data before %s", purge_before)
+        self.queue_task(
+            PurgeTask(
+                purge_before,
+                repack=cursor["repack"],
+                apply_filter=cursor["apply_filter"],
+            )
+        )
+
+    def save_purge_cursor(self) -> None:
+        """Save the cursor of the purge so it can resume after a restart.
+
+        Must be called from the recorder thread.
+        """
+        cursor = self.purge_progress.as_cursor()
+        self.hass.loop.call_soon_threadsafe(
+            self._purge_store.async_delay_save,
+            lambda: {"cursor": cursor},
+            PURGE_CURSOR_SAVE_DELAY,
+        )
+
     @callback
     def async_nightly_tasks(self, now: datetime) -> None:
         """Trigger the purge."""
@@ -682,10 +783,13 @@ class Recorder(threading.Thread):
             self.is_running = False
             self._shutdown()
 
-    def _add_to_session(self, session: Session, obj: object) -> None:
+    def _add_to_session(self, session: Session, obj: Base) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        if self._bulk_inserter is not None:
+            self._bulk_inserter.add(obj)
+        else:
+            session.add(obj)
 
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
@@ -788,6 +892,8 @@ class Recorder(threading.Thread):
             self._dismiss_migration_in_progress()
             self._setup_run()
 
+        self._setup_bulk_inserter()
+
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
@@ -795,6 +901,22 @@ class Recorder(threading.Thread):
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
         self._run_event_loop()
 
+    def _setup_bulk_inserter(self) -> None:
+        """Switch to bulk inserts once the schema is up to date."""
+        if not self.bulk_insert_batch_size:
+            return
+        assert self.engine is not None
+        if not self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+            _LOGGER.warning(
+                "The database does not support returning ids from bulk inserts, "
+                "the recorder will insert rows one at a time"
+            )
+            return
+        # Rows added to the session before now must
+        # have their ids before bulk rows refer to them
+        self._commit_event_session_or_retry()
+        self._bulk_inserter = BulkInserter(self.bulk_insert_batch_size)
+
     def _activate_and_set_db_ready(
         self, schema_status: migration.SchemaValidationStatus
     ) -> None:
@@ -1030,10 +1152,33 @@ class Recorder(threading.Thread):
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
+        if (bulk_inserter := self._bulk_inserter) is not None:
+            self._process_bulk_insert_window(bulk_inserter)
+            return
         # Commit if the commit interval is zero
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _process_bulk_insert_window(self, bulk_inserter: BulkInserter) -> None:
+        """Insert full batches and commit when the backlog allows it."""
+        if bulk_inserter.pending_rows >= bulk_inserter.batch_size:
+            assert self.event_session is not None
+            bulk_inserter.flush(self.event_session)
+        if self.commit_interval:
+            return
+        # With a zero commit interval the transaction stays open while
+        # there is a backlog so an event storm is committed per batch,
+        # or once the events already in the queue have been processed,
+        # instead of per event.
+        if (
+            not self.backlog
+            or bulk_inserter.uncommitted_rows >= bulk_inserter.batch_size
+        ):
+            self._commit_event_session_or_retry()
+        elif not self._bulk_commit_queued:
+            self._bulk_commit_queued = True
+            self.queue_task(COMMIT_TASK)
+
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
         session = self.event_session
@@ -1099,7 +1244,14 @@ class Recorder(threading.Thread):
         if pending_state := states_manager.pop_pending(entity_id):
             dbstate.old_state = pending_state
             if old_state:
-                pending_state.last_reported_ts = old_state.last_reported_timestamp
+                if self._bulk_inserter is not None and pending_state.state_id:
+                    # A full batch already inserted the pending state and
+                    # it is not in the session, so it needs an update.
+                    states_manager.update_pending_last_reported(
+                        pending_state.state_id, old_state.last_reported_timestamp
+                    )
+                else:
+                    pending_state.last_reported_ts = old_state.last_reported_timestamp
         elif old_state_id := states_manager.pop_committed(entity_id):
             dbstate.old_state_id = old_state_id
             if old_state:
@@ -1207,6 +1359,8 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        if self._bulk_inserter is not None:
+            self._bulk_inserter.flush(session)
 
         if (
             pending_last_reported
@@ -1226,6 +1380,9 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        if self._bulk_inserter is not None:
+            self._bulk_inserter.post_commit()
+            self._bulk_commit_queued = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1263,6 +1420,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self._bulk_inserter is not None:
+            self._bulk_inserter.reset()
 
         if not self.event_session:
             return
@@ -1480,13 +1639,18 @@ class Recorder(threading.Thread):
         try:
             self._end_session()
         finally:
-            if self._db_executor:
+            executors = [
+                executor
+                for executor in (self._db_executor, self._db_read_executor)
+                if executor
+            ]
+            for executor in executors:
                 # We shutdown the executor without forcefully
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
-                self._db_executor.shutdown(join_threads_or_timeout=False)
+                executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
-            if self._db_executor:
+            for executor in executors:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
-                self._db_executor.join_threads_or_timeout()
+                executor.join_threads_or_timeout()
@@ -5,11 +5,14 @@ from __future__ import annotations
 from collections.abc import Callable, Collection, Iterable
 from typing import Any
 
-from sqlalchemy import Column, Text, cast, not_, or_
+from sqlalchemy import Column, Text, and_, cast, not_, or_
 from sqlalchemy.sql.elements import ColumnElement
 
 from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
-from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
+from homeassistant.helpers.entityfilter import (
+    CONF_ENTITY_GLOBS,
+    combine_filter_matchers,
+)
 from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.typing import ConfigType
 
@@ -140,70 +143,25 @@ class Filters:
     ) -> ColumnElement:
         """Generate a filter from pre-computed sets and pattern lists.
 
-        This must match exactly how homeassistant.helpers.entityfilter works.
+        The matchers are combined by the entity filter helper so this
+        matches exactly how homeassistant.helpers.entityfilter works.
         """
-        i_domains = _domain_matcher(self._included_domains, columns, encoder)
-        i_entities = _entity_matcher(self._included_entities, columns, encoder)
-        i_entity_globs = _globs_to_like(self._included_entity_globs, columns, encoder)
-        includes = [i_domains, i_entities, i_entity_globs]
-
-        e_domains = _domain_matcher(self._excluded_domains, columns, encoder)
-        e_entities = _entity_matcher(self._excluded_entities, columns, encoder)
-        e_entity_globs = _globs_to_like(self._excluded_entity_globs, columns, encoder)
-        excludes = [e_domains, e_entities, e_entity_globs]
-
-        have_exclude = self._have_exclude
-        have_include = self._have_include
-
-        # Case 1 - No filter
-        # - All entities included
-        if not have_include and not have_exclude:
+        predicate = combine_filter_matchers(
+            _domain_matcher(self._included_domains, columns, encoder),
+            _entity_matcher(self._included_entities, columns, encoder),
+            _globs_to_like(self._included_entity_globs, columns, encoder),
+            _domain_matcher(self._excluded_domains, columns, encoder),
+            _entity_matcher(self._excluded_entities, columns, encoder),
+            _globs_to_like(self._excluded_entity_globs, columns, encoder),
+            any_of=_any_of,
+            all_of=and_,
+            negate=not_,
+        )
+        if predicate is None:
             raise RuntimeError(
                 "No filter configuration provided, check has_config before calling this method."
             )
-
-        # Case 2 - Only includes
-        # - Entity listed in entities include: include
-        # - Otherwise, entity matches domain include: include
-        # - Otherwise, entity matches glob include: include
-        # - Otherwise: exclude
-        if have_include and not have_exclude:
-            return or_(*includes).self_group()
-
-        # Case 3 - Only excludes
-        # - Entity listed in exclude: exclude
-        # - Otherwise, entity matches domain exclude: exclude
-        # - Otherwise, entity matches glob exclude: exclude
-        # - Otherwise: include
-        if not have_include and have_exclude:
-            return not_(or_(*excludes).self_group())
-
-        # Case 4 - Domain and/or glob includes (may also have excludes)
-        # - Entity listed in entities include: include
-        # - Otherwise, entity listed in entities exclude: exclude
-        # - Otherwise, entity matches glob include: include
-        # - Otherwise, entity matches glob exclude: exclude
-        # - Otherwise, entity matches domain include: include
-        # - Otherwise: exclude
-        if self._included_domains or self._included_entity_globs:
-            return or_(
-                i_entities,
-                (~e_entities & (i_entity_globs | (~e_entity_globs & i_domains))),
-            ).self_group()
-
-        # Case 5 - Domain and/or glob excludes (no domain and/or glob includes)
-        # - Entity listed in entities include: include
-        # - Otherwise, entity listed in exclude: exclude
-        # - Otherwise, entity matches glob exclude: exclude
-        # - Otherwise, entity matches domain exclude: exclude
-        # - Otherwise: include
-        if self._excluded_domains or self._excluded_entity_globs:
-            return (not_(or_(*excludes)) | i_entities).self_group()
-
-        # Case 6 - No Domain and/or glob includes or excludes
-        # - Entity listed in entities include: include
-        # - Otherwise: exclude
-        return i_entities
+        return predicate.self_group()
 
     def states_entity_filter(self) -> ColumnElement:
         """Generate the States.entity_id filter query.
@@ -251,9 +209,14 @@ class Filters:
         )
 
 
+def _any_of(*clauses: ColumnElement) -> ColumnElement:
+    """Match any of the clauses."""
+    return or_(*clauses).self_group()
+
+
 def _globs_to_like(
     glob_strs: Iterable[str], columns: Iterable[Column], encoder: Callable[[Any], Any]
-) -> ColumnElement:
+) -> ColumnElement | None:
     """Translate glob to sql."""
     matchers = [
         (
@@ -265,12 +228,16 @@ def _globs_to_like(
         for glob_str in glob_strs
         for column in columns
     ]
-    return or_(*matchers) if matchers else or_(False)
+    return or_(*matchers) if matchers else None
 
 
 def _entity_matcher(
-    entity_ids: Iterable[str], columns: Iterable[Column], encoder: Callable[[Any], Any]
-) -> ColumnElement:
+    entity_ids: Collection[str],
+    columns: Iterable[Column],
+    encoder: Callable[[Any], Any],
+) -> ColumnElement | None:
+    if not entity_ids:
+        return None
     matchers = [
         (
             column.is_not(None)
@@ -278,18 +245,18 @@ def _entity_matcher(
         )
         for column in columns
     ]
-    return or_(*matchers) if matchers else or_(False)
+    return or_(*matchers) if matchers else None
 
 
 def _domain_matcher(
     domains: Iterable[str], columns: Iterable[Column], encoder: Callable[[Any], Any]
-) -> ColumnElement:
+) -> ColumnElement | None:
     matchers = [
         (column.is_not(None) & cast(column, Text()).like(encoder(domain_matcher)))
         for domain_matcher in like_domain_matchers(domains)
         for column in columns
     ]
-    return or_(*matchers) if matchers else or_(False)
+    return or_(*matchers) if matchers else None
 
 
 def like_domain_matchers(domains: Iterable[str]) -> list[str]:
@@ -2,36 +2,103 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
 
 from ..filters import Filters
-from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS, STREAM_CHUNK_ROWS
+from .downsample import (
+    bucket_states,
+    get_downsampled_states_with_session as _modern_get_downsampled_states_with_session,
+)
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    stream_significant_states_with_session as _modern_stream_significant_states_with_session,
 )
 
 # These are the APIs of this package
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "get_downsampled_states_with_session",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "stream_significant_states_with_session",
 ]
 
 
+def get_downsampled_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+    points: int,
+) -> dict[str, list[dict[str, float]]]:
+    """Return numeric states during a time period in buckets."""
+    if get_instance(hass).states_meta_manager.active:
+        return _modern_get_downsampled_states_with_session(
+            hass, session, start_time, end_time, entity_ids, points
+        )
+
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states_with_session as _legacy_get_significant_states_with_session,
+    )
+
+    # The legacy schema is only used until the migration is
+    # done, so the states are bucketed without statistics.
+    start_time_ts = start_time.timestamp()
+    end_time_ts = end_time.timestamp()
+    states = _legacy_get_significant_states_with_session(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        False,
+        True,
+        True,
+        True,
+        True,
+    )
+    result: dict[str, list[dict[str, float]]] = {
+        entity_id: [] for entity_id in entity_ids
+    }
+    if end_time_ts <= start_time_ts:
+        return result
+    for entity_id, entity_states in states.items():
+        result[entity_id] = bucket_states(
+            (
+                (state[COMPRESSED_STATE_STATE], state[COMPRESSED_STATE_LAST_UPDATED])
+                for state in cast(list[dict[str, Any]], entity_states)
+            ),
+            start_time_ts,
+            end_time_ts,
+            points,
+        )
+    return result
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -152,6 +219,82 @@ def get_significant_states_with_session(
     )
 
 
+def stream_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+    chunk_size: int = STREAM_CHUNK_ROWS,
+) -> Iterator[dict[str, Any]]:
+    """Yield significant states during a time period in columnar chunks."""
+    if get_instance(hass).states_meta_manager.active:
+        yield from _modern_stream_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+            chunk_size,
+        )
+        return
+
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states_with_session as _legacy_get_significant_states_with_session,
+    )
+
+    # The legacy schema is only used until the migration is done,
+    # so all states are read at once and sent as a single chunk.
+    states = _legacy_get_significant_states_with_session(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        False,
+        no_attributes,
+        True,
+    )
+    if not any(states.values()):
+        return
+    chunk_states: dict[str, dict[str, list[Any]]] = {}
+    attributes: list[Any] = []
+    for entity_id, entity_states in states.items():
+        if not entity_states:
+            continue
+        columns = chunk_states[entity_id] = {
+            COMPRESSED_STATE_STATE: [],
+            COMPRESSED_STATE_LAST_UPDATED: [],
+        }
+        if not significant_changes_only:
+            columns[COMPRESSED_STATE_LAST_CHANGED] = []
+        if not no_attributes:
+            columns[COMPRESSED_STATE_ATTRIBUTES] = []
+        for state in entity_states:
+            assert isinstance(state, dict)
+            columns[COMPRESSED_STATE_STATE].append(state[COMPRESSED_STATE_STATE])
+            columns[COMPRESSED_STATE_LAST_UPDATED].append(
+                state[COMPRESSED_STATE_LAST_UPDATED]
+            )
+            if not significant_changes_only:
+                columns[COMPRESSED_STATE_LAST_CHANGED].append(
+                    state.get(COMPRESSED_STATE_LAST_CHANGED)
+                )
+            if not no_attributes:
+                columns[COMPRESSED_STATE_ATTRIBUTES].append(len(attributes))
+                attributes.append(state[COMPRESSED_STATE_ATTRIBUTES])
+    yield {"states": chunk_states, "attributes": attributes}
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
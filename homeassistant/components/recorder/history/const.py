@@ -19,3 +19,6 @@ NEED_ATTRIBUTE_DOMAINS = {
     "thermostat",
     "water_heater",
 }
+
+# The number of rows read from the cursor for each chunk of streamed history
+STREAM_CHUNK_ROWS = 5000
@@ -0,0 +1,375 @@
+"""Downsample numeric history into buckets."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from itertools import chain, groupby
+import math
+from operator import itemgetter
+
+from sqlalchemy import Select, lambda_stmt, select, union_all
+from sqlalchemy.engine.row import Row
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.recorder import get_instance
+from homeassistant.util import dt as dt_util
+
+from ..db_schema import States, StatisticsShortTerm
+from ..models import extract_metadata_ids
+from ..util import execute_stmt_lambda_element
+from .const import STREAM_CHUNK_ROWS
+from .modern import _get_start_time_state_stmt, _select_from_subquery
+
+# Short term statistics are only used when a bucket
+# spans at least one short term statistics period
+SHORT_TERM_PERIOD_SECONDS = StatisticsShortTerm.duration.total_seconds()
+
+
+class _Buckets:
+    """Reduce the values of one entity into time weighted buckets of equal width."""
+
+    __slots__ = (
+        "buckets",
+        "duration",
+        "end_ts",
+        "index",
+        "last",
+        "max",
+        "min",
+        "points",
+        "start_ts",
+        "total",
+        "width",
+    )
+
+    def __init__(self, start_ts: float, end_ts: float, points: int) -> None:
+        """Initialize the buckets."""
+        self.start_ts = start_ts
+        self.end_ts = end_ts
+        self.width = (end_ts - start_ts) / points
+        self.points = points
+        self.buckets: list[dict[str, float]] = []
+        self.index = -1
+        self.duration = 0.0
+        self.total = 0.0
+        self.min = self.max = self.last = 0.0
+
+    def _bucket_end(self, index: int) -> float:
+        """Return the end timestamp of a bucket."""
+        if index >= self.points - 1:
+            return self.end_ts
+        return self.start_ts + (index + 1) * self.width
+
+    def add(
+        self,
+        start: float,
+        end: float,
+        mean: float,
+        min_: float,
+        max_: float,
+        last: float,
+    ) -> None:
+        """Add a value that was in effect from start until end.
+
+        The value is split over the buckets it spans and weighted
+        by the time it was in effect in each of them.
+        """
+        start = max(start, self.start_ts)
+        end = min(end, self.end_ts)
+        while start < end:
+            index = min(int((start - self.start_ts) // self.width), self.points - 1)
+            if (bucket_end := self._bucket_end(index)) <= start:
+                # Rounding put the start in the previous bucket
+                index += 1
+                bucket_end = self._bucket_end(index)
+            if index != self.index:
+                self.close()
+                self.index = index
+                self.min = min_
+                self.max = max_
+            span_end = min(end, bucket_end)
+            self.duration += span_end - start
+            self.total += mean * (span_end - start)
+            self.min = min(min_, self.min)
+            self.max = max(max_, self.max)
+            self.last = last
+            start = span_end
+
+    def close(self) -> None:
+        """Close the current bucket."""
+        if self.duration > 0:
+            self.buckets.append(
+                {
+                    "start": self.start_ts + self.index * self.width,
+                    "mean": self.total / self.duration,
+                    "min": self.min,
+                    "max": self.max,
+                    "last": self.last,
+                }
+            )
+        self.duration = 0.0
+        self.total = 0.0
+
+
+def _add_states(
+    buckets: _Buckets,
+    states: Iterable[tuple[str | None, float | None]],
+    start_ts: float,
+    end_ts: float,
+) -> None:
+    """Add (state, last_updated_ts) pairs of one entity to its buckets.
+
+    Each state is in effect until the next one or end_ts, and a state
+    before start_ts is carried in as the value at start_ts. States that
+    are not numeric, such as unavailable, leave a gap until the next one.
+    """
+    value: float | None = None
+    value_ts = start_ts
+    for state, last_updated_ts in states:
+        if last_updated_ts is None:
+            continue
+        if value is not None:
+            buckets.add(value_ts, last_updated_ts, value, value, value, value)
+        value_ts = max(last_updated_ts, start_ts)
+        try:
+            value = float(state) if state is not None else None
+        except ValueError:
+            value = None
+        if value is not None and not math.isfinite(value):
+            value = None
+    if value is not None:
+        buckets.add(value_ts, end_ts, value, value, value, value)
+
+
+def bucket_states(
+    states: Iterable[tuple[str | None, float | None]],
+    start_ts: float,
+    end_ts: float,
+    points: int,
+) -> list[dict[str, float]]:
+    """Reduce (state, last_updated_ts) pairs of one entity into buckets.
+
+    The last state is in effect until end_ts or now, whichever is first.
+    """
+    buckets = _Buckets(start_ts, end_ts, points)
+    _add_states(buckets, states, start_ts, min(end_ts, dt_util.utcnow().timestamp()))
+    buckets.close()
+    return buckets.buckets
+
+
+def _bucket_statistics(buckets: _Buckets, rows: Iterable[Row], end_ts: float) -> float:
+    """Add the short term statistics of one entity to its buckets.
+
+    Each 5 minute mean is in effect for its whole period and the last
+    value of a bucket is the mean of its last period. Returns the end
+    of the last period.
+    """
+    period_end_ts = buckets.start_ts
+    for _, period_start_ts, mean, min_, max_ in rows:
+        period_end_ts = period_start_ts + SHORT_TERM_PERIOD_SECONDS
+        if mean is None or min_ is None or max_ is None:
+            continue
+        buckets.add(period_start_ts, min(period_end_ts, end_ts), mean, min_, max_, mean)
+    return period_end_ts
+
+
+def _downsampled_states_stmt(
+    metadata_ids: list[int], start_time_ts: float, end_time_ts: float
+) -> StatementLambdaElement:
+    """Return the statement to find the state changes to downsample.
+
+    The state in effect at start_time_ts is included first.
+    """
+    return lambda_stmt(
+        lambda: _downsampled_states_union_stmt(metadata_ids, start_time_ts, end_time_ts)
+    )
+
+
+def _downsampled_states_union_stmt(
+    metadata_ids: list[int], start_time_ts: float, end_time_ts: float
+) -> Select:
+    """Return the state at start_time_ts followed by the state changes."""
+    unioned_subquery = union_all(
+        _select_from_subquery(
+            _get_start_time_state_stmt(
+                start_time_ts, None, metadata_ids, True, False
+            ).subquery(),
+            True,
+            False,
+            False,
+        ),
+        select(States.metadata_id, States.state, States.last_updated_ts)
+        .filter(
+            (States.last_changed_ts == States.last_updated_ts)
+            | States.last_changed_ts.is_(None)
+        )
+        .filter(States.metadata_id.in_(metadata_ids))
+        .filter(States.last_updated_ts >= start_time_ts)
+        .filter(States.last_updated_ts < end_time_ts),
+    ).subquery()
+    return _select_from_subquery(unioned_subquery, True, False, False).order_by(
+        unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts
+    )
+
+
+def _downsampled_statistics_stmt(
+    metadata_ids: list[int], start_time_ts: float, end_time_ts: float
+) -> StatementLambdaElement:
+    """Return the statement to find the short term statistics to downsample."""
+    return lambda_stmt(
+        lambda: select(
+            StatisticsShortTerm.metadata_id,
+            StatisticsShortTerm.start_ts,
+            StatisticsShortTerm.mean,
+            StatisticsShortTerm.min,
+            StatisticsShortTerm.max,
+        )
+        .filter(StatisticsShortTerm.metadata_id.in_(metadata_ids))
+        .filter(StatisticsShortTerm.start_ts >= start_time_ts)
+        .filter(StatisticsShortTerm.start_ts < end_time_ts)
+        .order_by(StatisticsShortTerm.metadata_id, StatisticsShortTerm.start_ts)
+    )
+
+
+def _get_downsampled_statistics(
+    hass: HomeAssistant,
+    session: Session,
+    start_time_ts: float,
+    end_time_ts: float,
+    entity_ids: list[str],
+    points: int,
+) -> dict[str, tuple[_Buckets, float]]:
+    """Return buckets from the short term statistics of the entities.
+
+    Only entities with short term statistics that cover the start of
+    the period are returned, along with the end of their last period
+    so the tail that is not compiled yet can be read from the states.
+    """
+    width = (end_time_ts - start_time_ts) / points
+    statistics_meta = get_instance(hass).statistics_meta_manager.get_many(
+        session, statistic_ids=set(entity_ids)
+    )
+    metadata_id_to_entity_id = {
+        metadata_id: statistic_id
+        for statistic_id, (metadata_id, metadata) in statistics_meta.items()
+        if metadata["has_mean"]
+    }
+    if not metadata_id_to_entity_id:
+        return {}
+    rows = execute_stmt_lambda_element(
+        session,
+        _downsampled_statistics_stmt(
+            list(metadata_id_to_entity_id), start_time_ts, end_time_ts
+        ),
+        orm_rows=False,
+    )
+    result: dict[str, tuple[_Buckets, float]] = {}
+    for metadata_id, group in groupby(rows, itemgetter(0)):
+        first = next(group)
+        if first[1] >= start_time_ts + max(width, SHORT_TERM_PERIOD_SECONDS):
+            # The statistics start later than the period, the
+            # states may still have the start of the period
+            continue
+        buckets = _Buckets(start_time_ts, end_time_ts, points)
+        statistics_end_ts = _bucket_statistics(
+            buckets, chain((first,), group), end_time_ts
+        )
+        result[metadata_id_to_entity_id[metadata_id]] = (buckets, statistics_end_ts)
+    return result
+
+
+def get_downsampled_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+    points: int,
+) -> dict[str, list[dict[str, float]]]:
+    """Return numeric states during UTC period start_time - end_time in buckets.
+
+    The period is split into points buckets of equal width and every
+    bucket that has values holds the start timestamp of the bucket
+    and the min, max, time weighted mean and last value in it. The
+    state in effect at the start of the period is carried in.
+
+    When the buckets are at least as wide as a short term statistics
+    period, the short term statistics are used for the entities that
+    have them instead of reading every state change, and the states
+    after the last compiled period fill the tail.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    start_time_ts = start_time.timestamp()
+    end_time_ts = end_time.timestamp()
+    result: dict[str, list[dict[str, float]]] = {
+        entity_id: [] for entity_id in entity_ids
+    }
+    if end_time_ts <= start_time_ts:
+        return result
+    # States are not carried into the future
+    values_end_ts = min(end_time_ts, dt_util.utcnow().timestamp())
+    buckets_by_entity_id = {
+        entity_id: _Buckets(start_time_ts, end_time_ts, points)
+        for entity_id in entity_ids
+    }
+    states_start_ts = dict.fromkeys(entity_ids, start_time_ts)
+    if (end_time_ts - start_time_ts) / points >= SHORT_TERM_PERIOD_SECONDS:
+        for entity_id, (buckets, statistics_end_ts) in _get_downsampled_statistics(
+            hass, session, start_time_ts, end_time_ts, entity_ids, points
+        ).items():
+            buckets_by_entity_id[entity_id] = buckets
+            states_start_ts[entity_id] = statistics_end_ts
+    entity_ids_by_start_ts: dict[float, list[str]] = {}
+    for entity_id, tail_start_ts in states_start_ts.items():
+        if tail_start_ts < values_end_ts:
+            entity_ids_by_start_ts.setdefault(tail_start_ts, []).append(entity_id)
+    for tail_start_ts, states_entity_ids in entity_ids_by_start_ts.items():
+        _add_downsampled_states(
+            hass,
+            session,
+            buckets_by_entity_id,
+            tail_start_ts,
+            values_end_ts,
+            states_entity_ids,
+        )
+    for entity_id, buckets in buckets_by_entity_id.items():
+        buckets.close()
+        result[entity_id] = buckets.buckets
+    return result
+
+
+def _add_downsampled_states(
+    hass: HomeAssistant,
+    session: Session,
+    buckets_by_entity_id: dict[str, _Buckets],
+    start_time_ts: float,
+    end_time_ts: float,
+    entity_ids: list[str],
+) -> None:
+    """Add the states of the entities from start_time_ts to their buckets."""
+    entity_id_to_metadata_id = get_instance(hass).states_meta_manager.get_many(
+        entity_ids, session, False
+    )
+    if not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+        return
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    rows = (
+        session.connection()
+        .execute(_downsampled_states_stmt(metadata_ids, start_time_ts, end_time_ts))
+        .yield_per(STREAM_CHUNK_ROWS)
+    )
+    for metadata_id, group in groupby(rows, itemgetter(0)):
+        _add_states(
+            buckets_by_entity_id[metadata_id_to_entity_id[metadata_id]],
+            ((row[1], row[2]) for row in group),
+            start_time_ts,
+            end_time_ts,
+        )
@@ -21,9 +21,16 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.helpers.json import json_fragment
 from homeassistant.helpers.recorder import get_instance
 from homeassistant.util import dt as dt_util
 
@@ -47,6 +54,7 @@ from .const import (
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
     STATE_KEY,
+    STREAM_CHUNK_ROWS,
 )
 
 _FIELD_MAP = {
@@ -204,32 +212,24 @@ def _significant_states_stmt(
     ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
 
 
-def get_significant_states_with_session(
+def _significant_states_query(
     hass: HomeAssistant,
     session: Session,
     start_time: datetime,
-    end_time: datetime | None = None,
-    entity_ids: list[str] | None = None,
-    filters: Filters | None = None,
-    include_start_time_state: bool = True,
-    significant_changes_only: bool = True,
-    minimal_response: bool = False,
-    no_attributes: bool = False,
-    compressed_state_format: bool = False,
-) -> dict[str, list[State | dict[str, Any]]]:
-    """Return states changes during UTC period start_time - end_time.
-
-    entity_ids is an optional iterable of entities to include in the results.
-
-    filters is an optional SQLAlchemy filter which will be applied to the database
-    queries unless entity_ids is given, in which case its ignored.
-
-    Significant states are all states where there is a state change,
-    as well as all states from certain domains (for instance
-    thermostat so that we get current temperature in our graphs).
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> (
+    tuple[StatementLambdaElement, float | None, list[str], dict[str, int | None]] | None
+):
+    """Return the statement to find significant states.
+
+    Also returns the start time to use for the start time states,
+    the entity_ids and the metadata_id of every entity_id.
+    Returns None when none of the entities have been recorded.
     """
-    if filters is not None:
-        raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
@@ -240,7 +240,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -278,9 +278,57 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
+    return (
+        stmt,
+        start_time_ts if include_start_time_state else None,
+        entity_ids,
+        entity_id_to_metadata_id,
+    )
+
+
+def get_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> dict[str, list[State | dict[str, Any]]]:
+    """Return states changes during UTC period start_time - end_time.
+
+    entity_ids is an optional iterable of entities to include in the results.
+
+    filters is an optional SQLAlchemy filter which will be applied to the database
+    queries unless entity_ids is given, in which case its ignored.
+
+    Significant states are all states where there is a state change,
+    as well as all states from certain domains (for instance
+    thermostat so that we get current temperature in our graphs).
+    """
+    if filters is not None:
+        raise NotImplementedError("Filters are no longer supported")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, start_time_ts, entity_ids, entity_id_to_metadata_id = query
     return _sorted_states_to_dict(
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
+        start_time_ts,
         entity_ids,
         entity_id_to_metadata_id,
         minimal_response,
@@ -289,6 +337,90 @@ def get_significant_states_with_session(
     )
 
 
+def stream_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+    chunk_size: int = STREAM_CHUNK_ROWS,
+) -> Iterator[dict[str, Any]]:
+    """Yield significant states during UTC period start_time - end_time in chunks.
+
+    The rows are read from the cursor chunk_size at a time and every
+    chunk is yielded as soon as it is read, so memory use does not grow
+    with the length of the period and the first chunk can be sent
+    before the query has been read to the end.
+
+    Each chunk holds columnar arrays per entity_id:
+    {'states': {'entity_id': {'s': [states], 'lu': [timestamps], 'a': [refs]}},
+     'attributes': [attributes of this chunk]}
+
+    Attributes are sent once per chunk as pre-serialized json and
+    referenced by their index in the attributes of the same chunk.
+    When significant_changes_only is False, 'lc' holds the last_changed
+    timestamp of the states where it differs from last_updated, else None.
+    """
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return
+    stmt, start_time_ts, _, entity_id_to_metadata_id = query
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    include_last_changed = not significant_changes_only
+    result = session.connection().execute(stmt).yield_per(chunk_size)
+    for partition in result.partitions():
+        chunk_states: dict[str, dict[str, list[Any]]] = {}
+        chunk_attributes: list[json_fragment] = []
+        attribute_refs: dict[str | None, int] = {}
+        for metadata_id, rows in groupby(partition, itemgetter(0)):
+            entity_id = metadata_id_to_entity_id[metadata_id]
+            if (columns := chunk_states.get(entity_id)) is None:
+                columns = chunk_states[entity_id] = {
+                    COMPRESSED_STATE_STATE: [],
+                    COMPRESSED_STATE_LAST_UPDATED: [],
+                }
+                if include_last_changed:
+                    columns[COMPRESSED_STATE_LAST_CHANGED] = []
+                if not no_attributes:
+                    columns[COMPRESSED_STATE_ATTRIBUTES] = []
+            for row in rows:
+                last_updated_ts = row.last_updated_ts or start_time_ts
+                columns[COMPRESSED_STATE_STATE].append(row.state)
+                columns[COMPRESSED_STATE_LAST_UPDATED].append(last_updated_ts)
+                if include_last_changed:
+                    last_changed_ts = row.last_changed_ts
+                    columns[COMPRESSED_STATE_LAST_CHANGED].append(
+                        last_changed_ts
+                        if last_changed_ts and last_changed_ts != last_updated_ts
+                        else None
+                    )
+                if no_attributes:
+                    continue
+                shared_attrs = row.attributes
+                if (ref := attribute_refs.get(shared_attrs)) is None:
+                    ref = attribute_refs[shared_attrs] = len(attribute_refs)
+                    chunk_attributes.append(json_fragment(shared_attrs or "{}"))
+                columns[COMPRESSED_STATE_ATTRIBUTES].append(ref)
+        yield {"states": chunk_states, "attributes": chunk_attributes}
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -26,6 +26,8 @@ DEBUG_MUTEX_POOL = True
 DEBUG_MUTEX_POOL_TRACE = False
 
 POOL_SIZE = 5
+# Connections for the workers of the read executor
+READ_POOL_SIZE = 4
 
 ADVISE_MSG = (
     "Use homeassistant.components.recorder.get_instance(hass).async_add_executor_job()"
@@ -46,7 +48,7 @@ class RecorderPool(SingletonThreadPool, NullPool):
         **kw: Any,
     ) -> None:
         """Create the pool."""
-        kw["pool_size"] = POOL_SIZE
+        kw["pool_size"] = POOL_SIZE + READ_POOL_SIZE
         assert recorder_and_worker_thread_ids is not None, (
             "recorder_and_worker_thread_ids is required"
         )
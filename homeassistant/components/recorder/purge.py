@@ -12,6 +12,7 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
+from .const import PURGE_SLICE_TIME_BUDGET
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -61,11 +62,45 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    time_budget: float = PURGE_SLICE_TIME_BUDGET,
 ) -> bool:
     """Purge events and states older than purge_before.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Every call purges one slice, which stops starting new batches
+    once time_budget seconds have passed. Returns False if the purge
+    needs to be rescheduled to continue with the next slice.
     """
+    progress = instance.purge_progress
+    progress.start(purge_before, repack, apply_filter)
+    progress.set_max_batch_size(instance.max_bind_vars)
+    started = time.monotonic()
+    finished = False
+    try:
+        finished = _purge_old_data_slice(
+            instance,
+            purge_before,
+            repack,
+            apply_filter,
+            events_batch_size,
+            states_batch_size,
+            started + time_budget,
+        )
+    finally:
+        progress.add_slice(time.monotonic() - started, finished)
+        instance.save_purge_cursor()
+    return finished
+
+
+def _purge_old_data_slice(
+    instance: Recorder,
+    purge_before: datetime,
+    repack: bool,
+    apply_filter: bool,
+    events_batch_size: int,
+    states_batch_size: int,
+    deadline: float,
+) -> bool:
+    """Purge a slice of the events and states older than purge_before."""
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
@@ -86,10 +121,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, deadline
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, deadline
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -179,6 +214,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    deadline: float | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -192,16 +228,21 @@ def _purge_states_and_attributes_ids(
     # size batch of attributes_ids that will be around the size
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
-    max_bind_vars = instance.max_bind_vars
-    for _ in range(states_batch_size):
+    progress = instance.purge_progress
+    for batch in range(states_batch_size):
+        if batch and deadline is not None and time.monotonic() >= deadline:
+            _LOGGER.debug("Purge slice is out of time after %s state batches", batch)
+            break
+        batch_started = time.monotonic()
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, progress.batch_size
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        progress.add_batch(len(state_ids), 0, time.monotonic() - batch_started)
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -216,6 +257,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    deadline: float | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -227,16 +269,21 @@ def _purge_events_and_data_ids(
     # size batch of data_ids that will be around the size
     # max_bind_vars
     data_ids_batch: set[int] = set()
-    max_bind_vars = instance.max_bind_vars
-    for _ in range(events_batch_size):
+    progress = instance.purge_progress
+    for batch in range(events_batch_size):
+        if batch and deadline is not None and time.monotonic() >= deadline:
+            _LOGGER.debug("Purge slice is out of time after %s event batches", batch)
+            break
+        batch_started = time.monotonic()
         event_ids, data_ids = _select_event_data_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, progress.batch_size
         )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        progress.add_batch(0, len(event_ids), time.monotonic() - batch_started)
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
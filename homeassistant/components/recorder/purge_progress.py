@@ -0,0 +1,131 @@
+"""Track the progress of an incremental purge."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, TypedDict
+
+from homeassistant.util import dt as dt_util
+
+from .const import PURGE_BATCH_TARGET_LATENCY, PURGE_MIN_BATCH_SIZE
+
+
+class PurgeCursor(TypedDict):
+    """The persisted cursor of an unfinished purge."""
+
+    purge_before: str
+    repack: bool
+    apply_filter: bool
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress and throughput of the current or last purge.
+
+    The purge runs in slices on the recorder thread. Every slice
+    gets a time budget and the number of rows selected and deleted
+    per batch adapts to the measured latency of the batches so a
+    slow database is not locked for long at a time.
+    """
+
+    max_batch_size: int
+    batch_size: int = 0
+    purge_before: datetime | None = None
+    repack: bool = False
+    apply_filter: bool = False
+    started: datetime | None = None
+    finished: datetime | None = None
+    slices: int = 0
+    batches: int = 0
+    states: int = 0
+    events: int = 0
+    duration: float = 0.0
+    last_batch_latency: float = 0.0
+    last_slice_duration: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Start with the largest batch size."""
+        self.batch_size = self.batch_size or self.max_batch_size
+
+    @property
+    def in_progress(self) -> bool:
+        """Return if a purge was started and has not finished."""
+        return self.purge_before is not None and self.finished is None
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the number of rows purged per second of purge time."""
+        if not self.duration:
+            return 0.0
+        return (self.states + self.events) / self.duration
+
+    def start(self, purge_before: datetime, repack: bool, apply_filter: bool) -> None:
+        """Start tracking a purge if it is not the one being tracked."""
+        if self.purge_before == purge_before and self.finished is None:
+            return
+        self.purge_before = purge_before
+        self.repack = repack
+        self.apply_filter = apply_filter
+        self.started = dt_util.utcnow()
+        self.finished = None
+        self.slices = self.batches = self.states = self.events = 0
+        self.duration = self.last_slice_duration = 0.0
+
+    def set_max_batch_size(self, max_batch_size: int) -> None:
+        """Set the largest batch size the database supports."""
+        self.max_batch_size = max_batch_size
+        self.batch_size = min(self.batch_size, max_batch_size)
+
+    def add_batch(self, states: int, events: int, latency: float) -> None:
+        """Add a purged batch and adapt the batch size to its latency."""
+        self.batches += 1
+        self.states += states
+        self.events += events
+        self.last_batch_latency = latency
+        if not states + events:
+            return
+        if latency > PURGE_BATCH_TARGET_LATENCY:
+            self.batch_size = max(
+                PURGE_MIN_BATCH_SIZE,
+                int(self.batch_size * PURGE_BATCH_TARGET_LATENCY / latency),
+            )
+        elif latency < PURGE_BATCH_TARGET_LATENCY / 2:
+            self.batch_size = min(self.max_batch_size, self.batch_size * 2)
+
+    def add_slice(self, duration: float, finished: bool) -> None:
+        """Add a finished slice of the purge."""
+        self.slices += 1
+        self.duration += duration
+        self.last_slice_duration = duration
+        if finished:
+            self.finished = dt_util.utcnow()
+
+    def as_cursor(self) -> PurgeCursor | None:
+        """Return the cursor to persist to resume the purge after a restart."""
+        if not self.in_progress:
+            return None
+        assert self.purge_before is not None
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "repack": self.repack,
+            "apply_filter": self.apply_filter,
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        return {
+            "in_progress": self.in_progress,
+            "purge_before": self.purge_before,
+            "started": self.started,
+            "finished": self.finished,
+            "slices": self.slices,
+            "batches": self.batches,
+            "batch_size": self.batch_size,
+            "states": self.states,
+            "events": self.events,
+            "duration": self.duration,
+            "rows_per_second": self.rows_per_second,
+            "last_batch_latency": self.last_batch_latency,
+            "last_slice_duration": self.last_slice_duration,
+        }
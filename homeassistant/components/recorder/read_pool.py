@@ -0,0 +1,226 @@
+"""Schedule read-only queries fairly on the read executor."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Mapping, Sized
+from concurrent.futures import Executor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import partial
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import ReadQueryKind
+
+# The number of recent queries kept for diagnostics
+RECENT_READ_QUERIES = 25
+
+
+@dataclass(slots=True)
+class ReadQueryStats:
+    """Statistics for the read queries of one kind."""
+
+    queries: int = 0
+    failed: int = 0
+    rows: int = 0
+    duration: float = 0.0
+    max_duration: float = 0.0
+    queue_wait: float = 0.0
+    max_queue_wait: float = 0.0
+
+    def add(self, job: ReadJob) -> None:
+        """Add a finished query."""
+        self.queries += 1
+        if job.failed:
+            self.failed += 1
+        if job.rows is not None:
+            self.rows += job.rows
+        self.duration += job.duration
+        self.max_duration = max(self.max_duration, job.duration)
+        self.queue_wait += job.queue_wait
+        self.max_queue_wait = max(self.max_queue_wait, job.queue_wait)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        queries = self.queries or 1
+        return {
+            "queries": self.queries,
+            "failed": self.failed,
+            "rows": self.rows,
+            "mean_duration": self.duration / queries,
+            "max_duration": self.max_duration,
+            "mean_queue_wait": self.queue_wait / queries,
+            "max_queue_wait": self.max_queue_wait,
+        }
+
+
+@dataclass(slots=True)
+class ReadJob:
+    """A read-only query waiting for or running on the read executor."""
+
+    kind: ReadQueryKind
+    target: Callable[..., Any]
+    args: tuple[Any, ...]
+    future: asyncio.Future[Any]
+    queued: float = field(default_factory=time.monotonic)
+    queue_wait: float = 0.0
+    duration: float = 0.0
+    rows: int | None = None
+    failed: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the query as a dict."""
+        return {
+            "kind": self.kind,
+            "name": getattr(self.target, "__name__", repr(self.target)),
+            "duration": self.duration,
+            "queue_wait": self.queue_wait,
+            "rows": self.rows,
+            "failed": self.failed,
+        }
+
+
+_CURRENT_READ_JOB: ContextVar[ReadJob | None] = ContextVar(
+    "current_read_job", default=None
+)
+
+
+def add_read_rows(rows: int) -> None:
+    """Count rows read by the query running in this thread.
+
+    Queries that return their rows already serialized or reduced
+    report them here since they cannot be counted from the result.
+    """
+    if (job := _CURRENT_READ_JOB.get()) is not None:
+        job.rows = (job.rows or 0) + rows
+
+
+def _count_rows(result: Any) -> int | None:
+    """Return the number of rows in a query result if it can be known.
+
+    Results that are already serialized do not
+    expose their rows and are not counted.
+    """
+    if isinstance(result, (str, bytes, bytearray)) or not isinstance(result, Sized):
+        return None
+    if isinstance(result, Mapping):
+        # History style results are rows grouped by entity or statistic
+        count = 0
+        for value in result.values():
+            if isinstance(value, (str, bytes)) or not isinstance(value, Sized):
+                return len(result)
+            count += len(value)
+        return count
+    return len(result)
+
+
+class ReadQueryScheduler:
+    """Run read-only queries on the read executor with fair scheduling.
+
+    Every kind of query has its own queue and the queues are served in
+    turn, so a dashboard that requests a lot of history does not delay
+    the logbook or statistics queries that arrive after it. No more
+    queries than the executor has workers are submitted at a time so
+    the waiting happens here and not in the FIFO of the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant, executor: Executor, workers: int) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._executor = executor
+        self._workers = workers
+        self._running = 0
+        self._queues: dict[ReadQueryKind, deque[ReadJob]] = {
+            kind: deque() for kind in ReadQueryKind
+        }
+        self._next_kinds: deque[ReadQueryKind] = deque(ReadQueryKind)
+        self.stats: dict[ReadQueryKind, ReadQueryStats] = {
+            kind: ReadQueryStats() for kind in ReadQueryKind
+        }
+        self.recent: deque[ReadJob] = deque(maxlen=RECENT_READ_QUERIES)
+
+    @property
+    def queued(self) -> int:
+        """Return the number of queries waiting for a worker."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @callback
+    def async_add_job[_T](
+        self, kind: ReadQueryKind, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a read-only query."""
+        future: asyncio.Future[_T] = self.hass.loop.create_future()
+        self._queues[kind].append(ReadJob(kind, target, args, future))
+        self._async_submit()
+        return future
+
+    @callback
+    def async_info(self) -> dict[str, Any]:
+        """Return diagnostics about the read queries."""
+        return {
+            "workers": self._workers,
+            "running": self._running,
+            "queued": self.queued,
+            "kinds": {kind: stats.as_dict() for kind, stats in self.stats.items()},
+            "recent": [job.as_dict() for job in self.recent],
+        }
+
+    @callback
+    def _async_submit(self) -> None:
+        """Submit queued queries while there are idle workers."""
+        while self._running < self._workers and (job := self._async_next_job()):
+            self._running += 1
+            self.hass.loop.run_in_executor(
+                self._executor, self._run_job, job
+            ).add_done_callback(partial(self._async_job_done, job))
+
+    @callback
+    def _async_next_job(self) -> ReadJob | None:
+        """Return the next query, taking the kinds in turn."""
+        next_kinds = self._next_kinds
+        for _ in range(len(next_kinds)):
+            kind = next_kinds[0]
+            next_kinds.rotate(-1)
+            queue = self._queues[kind]
+            while queue:
+                job = queue.popleft()
+                # The caller went away while the query was waiting
+                if not job.future.cancelled():
+                    return job
+        return None
+
+    def _run_job(self, job: ReadJob) -> Any:
+        """Run a query in the read executor and measure it."""
+        started = time.monotonic()
+        job.queue_wait = started - job.queued
+        token = _CURRENT_READ_JOB.set(job)
+        try:
+            result = job.target(*job.args)
+        except BaseException:
+            job.failed = True
+            raise
+        finally:
+            job.duration = time.monotonic() - started
+            _CURRENT_READ_JOB.reset(token)
+        if job.rows is None:
+            job.rows = _count_rows(result)
+        return result
+
+    @callback
+    def _async_job_done(self, job: ReadJob, executor_future: asyncio.Future) -> None:
+        """Record a finished query and pass on its result."""
+        self._running -= 1
+        self.stats[job.kind].add(job)
+        self.recent.append(job)
+        if not job.future.cancelled():
+            if executor_future.cancelled():
+                job.future.cancel()
+            elif (exc := executor_future.exception()) is not None:
+                job.future.set_exception(exc)
+            else:
+                job.future.set_result(executor_future.result())
+        self._async_submit()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
@@ -11,7 +11,7 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
-from time import time as time_time
+from time import monotonic, time as time_time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
@@ -54,9 +54,11 @@ from .const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
+    INTEGRATION_PLATFORM_COMPILE_STATISTICS_BATCH,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
+    ReadQueryKind,
     SupportedDialect,
 )
 from .db_schema import (
@@ -166,6 +168,10 @@ UNIT_CLASSES = {
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
 
+# Missed periods are read in batches of one hour so the history
+# held in memory does not grow with the commit interval
+CATCH_UP_BATCH_PERIODS = 12
+
 
 def mean(values: list[float]) -> float | None:
     """Return the mean of the values.
@@ -322,6 +328,38 @@ class PlatformCompiledStatistics:
     current_metadata: dict[str, tuple[int, StatisticMetaData]]
 
 
+@dataclasses.dataclass(slots=True)
+class StatisticsCatchUpProgress:
+    """Progress of compiling the statistics missed while not running."""
+
+    first_period: datetime
+    periods: int
+    compiled: int = 0
+    started: float = dataclasses.field(default_factory=monotonic)
+    duration: float = 0.0
+
+    def add(self, periods: int) -> None:
+        """Add compiled periods."""
+        self.compiled += periods
+        self.duration = monotonic() - self.started
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        periods_per_second = self.compiled / self.duration if self.duration else 0.0
+        return {
+            "first_period": self.first_period,
+            "periods": self.periods,
+            "compiled": self.compiled,
+            "duration": self.duration,
+            "periods_per_second": periods_per_second,
+            "remaining_seconds": (
+                (self.periods - self.compiled) / periods_per_second
+                if periods_per_second
+                else None
+            ),
+        }
+
+
 def split_statistic_id(entity_id: str) -> list[str]:
     """Split a state entity ID into domain and object ID."""
     return entity_id.split(":", 1)
@@ -465,7 +503,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
     start = now - timedelta(days=instance.keep_days)
     start = start.replace(minute=0, second=0, microsecond=0)
     # Commit every 12 hours of data
-    commit_interval = 60 / period_size * 12
+    commit_interval = 60 // period_size * 12
 
     with session_scope(
         session=instance.get_session(),
@@ -479,23 +517,64 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 start, process_timestamp(last_run) + StatisticsShortTerm.duration
             )
 
-        periods_without_commit = 0
+        periods: list[datetime] = []
         while start < last_period:
-            periods_without_commit += 1
-            end = start + timedelta(minutes=period_size)
-            _LOGGER.debug("Compiling missing statistics for %s-%s", start, end)
-            modified_statistic_ids = _compile_statistics(
-                instance, session, start, end >= last_period
+            periods.append(start)
+            start += timedelta(minutes=period_size)
+        if not periods:
+            return True
+
+        progress = instance.statistics_catch_up = StatisticsCatchUpProgress(
+            periods[0], len(periods)
+        )
+        periods_without_commit = 0
+        for batch_start in range(0, len(periods), CATCH_UP_BATCH_PERIODS):
+            batch = periods[batch_start : batch_start + CATCH_UP_BATCH_PERIODS]
+            batch_compilers = _batch_compilers(
+                instance, session, batch[0], batch[-1] + StatisticsShortTerm.duration
+            )
+            for start in batch:
+                periods_without_commit += 1
+                end = start + StatisticsShortTerm.duration
+                _LOGGER.debug("Compiling missing statistics for %s-%s", start, end)
+                modified_statistic_ids = _compile_statistics(
+                    instance, session, start, end >= last_period, batch_compilers
+                )
+                if periods_without_commit == commit_interval or modified_statistic_ids:
+                    session.commit()
+                    session.expunge_all()
+                    periods_without_commit = 0
+            progress.add(len(batch))
+            _LOGGER.debug(
+                "Compiled missing statistics for %s of %s periods",
+                progress.compiled,
+                progress.periods,
             )
-            if periods_without_commit == commit_interval or modified_statistic_ids:
-                session.commit()
-                session.expunge_all()
-                periods_without_commit = 0
-            start = end
 
     return True
 
 
+def _batch_compilers(
+    instance: Recorder, session: Session, start: datetime, end: datetime
+) -> dict[str, Iterator[PlatformCompiledStatistics]]:
+    """Return the batch compilers of the platforms that support them.
+
+    A batch compiler is a generator that yields the compiled statistics of
+    every 5-minute period between start and end in order. Statistics for a
+    period are compiled lazily, after the statistics of the previous period
+    have been added to the session.
+    """
+    return {
+        domain: platform_compile_statistics_batch(instance.hass, session, start, end)
+        for domain, platform in instance.hass.data[DOMAIN].recorder_platforms.items()
+        if (
+            platform_compile_statistics_batch := getattr(
+                platform, INTEGRATION_PLATFORM_COMPILE_STATISTICS_BATCH, None
+            )
+        )
+    }
+
+
 @retryable_database_job("compile statistics")
 def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -> bool:
     """Compile 5-minute statistics for all integrations with a recorder platform.
@@ -536,13 +615,20 @@ def _get_first_id_stmt(start: datetime) -> StatementLambdaElement:
 
 
 def _compile_statistics(
-    instance: Recorder, session: Session, start: datetime, fire_events: bool
+    instance: Recorder,
+    session: Session,
+    start: datetime,
+    fire_events: bool,
+    batch_compilers: dict[str, Iterator[PlatformCompiledStatistics]] | None = None,
 ) -> set[str]:
     """Compile 5-minute statistics for all integrations with a recorder platform.
 
     This is a helper function for compile_statistics and compile_missing_statistics
     that does not retry on database errors since both callers already retry.
 
+    If batch_compilers is given, the statistics of the platforms in it are
+    taken from their batch compiler instead of compiled for the period alone.
+
     returns a set of modified statistic_ids if any were modified.
     """
     assert start.tzinfo == dt_util.UTC, "start must be in UTC"
@@ -553,6 +639,10 @@ def _compile_statistics(
     # Return if we already have 5-minute statistics for the requested period
     if execute_stmt_lambda_element(session, _get_first_id_stmt(start)):
         _LOGGER.debug("Statistics already compiled for %s-%s", start, end)
+        if batch_compilers:
+            # The batch compilers are out of step with the periods,
+            # the rest of the batch is compiled one period at a time
+            batch_compilers.clear()
         return modified_statistic_ids
 
     _LOGGER.debug("Compiling statistics for %s-%s", start, end)
@@ -560,15 +650,15 @@ def _compile_statistics(
     current_metadata: dict[str, tuple[int, StatisticMetaData]] = {}
     # Collect statistics from all platforms implementing support
     for domain, platform in instance.hass.data[DOMAIN].recorder_platforms.items():
-        if not (
-            platform_compile_statistics := getattr(
-                platform, INTEGRATION_PLATFORM_COMPILE_STATISTICS, None
-            )
+        compiled: PlatformCompiledStatistics
+        if batch_compilers and (batch_compiler := batch_compilers.get(domain)):
+            compiled = next(batch_compiler)
+        elif platform_compile_statistics := getattr(
+            platform, INTEGRATION_PLATFORM_COMPILE_STATISTICS, None
         ):
+            compiled = platform_compile_statistics(instance.hass, session, start, end)
+        else:
             continue
-        compiled: PlatformCompiledStatistics = platform_compile_statistics(
-            instance.hass, session, start, end
-        )
         _LOGGER.debug(
             "Statistics for %s during %s-%s: %s",
             domain,
@@ -805,7 +895,8 @@ async def async_list_statistic_ids(
             result = _statistic_by_id_from_metadata(hass, metadata)
             return _flatten_list_statistic_ids_metadata_result(result)
 
-    return await instance.async_add_executor_job(
+    return await instance.async_add_read_job(
+        ReadQueryKind.STATISTICS,
         list_statistic_ids,
         hass,
         statistic_ids,
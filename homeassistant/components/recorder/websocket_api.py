@@ -36,7 +36,9 @@ from homeassistant.util.unit_conversion import (
     VolumeFlowRateConverter,
 )
 
+from .const import ReadQueryKind
 from .models import StatisticPeriod
+from .read_pool import add_read_rows
 from .statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
     async_add_external_statistics,
@@ -106,14 +108,12 @@ def _ws_get_statistic_during_period(
     units: dict[str, str],
 ) -> bytes:
     """Fetch statistics and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            statistic_during_period(
-                hass, start_time, end_time, statistic_id, types, units=units
-            ),
-        )
+    result = statistic_during_period(
+        hass, start_time, end_time, statistic_id, types, units=units
     )
+    # The statistics are reduced in the database to one value per type
+    add_read_rows(len(result))
+    return json_bytes(messages.result_message(msg_id, result))
 
 
 @websocket_api.websocket_command(
@@ -140,7 +140,8 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_job(
+            ReadQueryKind.STATISTICS,
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -173,6 +174,7 @@ def _ws_get_statistics_during_period(
         units,
         types,
     )
+    add_read_rows(sum(map(len, result.values())))
     include_last_reset = "last_reset" in types
     for statistic_rows in result.values():
         for row in statistic_rows:
@@ -208,7 +210,8 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_job(
+            ReadQueryKind.STATISTICS,
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -253,9 +256,9 @@ def _ws_get_list_statistic_ids(
 
     Runs in the executor.
     """
-    return json_bytes(
-        messages.result_message(msg_id, list_statistic_ids(hass, None, statistic_type))
-    )
+    statistic_ids = list_statistic_ids(hass, None, statistic_type)
+    add_read_rows(len(statistic_ids))
+    return json_bytes(messages.result_message(msg_id, statistic_ids))
 
 
 async def ws_handle_list_statistic_ids(
@@ -263,7 +266,8 @@ async def ws_handle_list_statistic_ids(
 ) -> None:
     """Fetch a list of available statistic_id."""
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_job(
+            ReadQueryKind.STATISTICS,
             _ws_get_list_statistic_ids,
             hass,
             msg["id"],
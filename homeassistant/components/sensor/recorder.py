@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import suppress
 import datetime
 import itertools
 import logging
 import math
+import operator
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -100,41 +102,27 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
 
 
 def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    timestamps: list[float], values: list[float], start_ts: float, end_ts: float
 ) -> float:
     """Calculate a time weighted average.
 
-    The average is calculated by weighting the states by duration in seconds between
-    state changes.
+    The average is calculated by weighting the values by duration in seconds between
+    state changes. The timestamps are those of the state changes in order.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    accumulated = 0.0
-
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
-
-    period_seconds = (end - start).total_seconds()
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics. If there was no
+    # last known state, the period starts with the first state change.
+    times = list(map(max, timestamps, itertools.repeat(start_ts)))
+    # Weight every value by the duration until the next state change
+    # or the end of the period
+    durations = map(
+        operator.sub,
+        itertools.chain(itertools.islice(times, 1, None), (end_ts,)),
+        times,
+    )
+    accumulated: float = sum(map(operator.mul, values, durations))
+    period_seconds = end_ts - times[0]
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
@@ -402,18 +390,15 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
-def compile_statistics(  # noqa: C901
+def _get_history(
     hass: HomeAssistant,
     session: Session,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
     start: datetime.datetime,
     end: datetime.datetime,
-) -> statistics.PlatformCompiledStatistics:
-    """Compile statistics for all entities during start-end."""
-    result: list[StatisticResult] = []
-
-    sensor_states = _get_sensor_states(hass)
-    wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
+) -> dict[str, list[State]]:
+    """Get the history of the sensors between start and end."""
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
@@ -441,6 +426,97 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_significant_history,
         )
         history_list = {**history_list, **_history_list}
+    return history_list
+
+
+def _history_during_period(
+    history_list: dict[str, list[State]],
+    timestamps: dict[str, list[float]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, list[State]]:
+    """Return the history of the sensors during start-end from a longer history.
+
+    Like the history of the period itself, the history of
+    every sensor starts with its last state before start.
+    """
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+    result: dict[str, list[State]] = {}
+    for entity_id, entity_history in history_list.items():
+        entity_timestamps = timestamps[entity_id]
+        first = bisect_left(entity_timestamps, start_ts)
+        last = bisect_left(entity_timestamps, end_ts, first)
+        result[entity_id] = entity_history[max(first - 1, 0) : last]
+    return result
+
+
+def compile_statistics(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for all entities during start-end."""
+    sensor_states = _get_sensor_states(hass)
+    wanted_statistics = _wanted_statistics(sensor_states)
+    history_list = _get_history(
+        hass, session, sensor_states, wanted_statistics, start, end
+    )
+    return _compile_statistics(
+        hass, session, sensor_states, wanted_statistics, history_list, start, end
+    )
+
+
+def compile_statistics_batch(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> Iterator[statistics.PlatformCompiledStatistics]:
+    """Compile statistics for all entities for every 5-minute period in start-end.
+
+    The history of the whole batch is read with one query per kind of
+    history instead of one per period and split into the periods.
+    """
+    sensor_states = _get_sensor_states(hass)
+    wanted_statistics = _wanted_statistics(sensor_states)
+    history_list = _get_history(
+        hass, session, sensor_states, wanted_statistics, start, end
+    )
+    timestamps = {
+        entity_id: [state.last_updated_timestamp for state in entity_history]
+        for entity_id, entity_history in history_list.items()
+    }
+    period = statistics.StatisticsShortTerm.duration
+    period_start = start
+    while period_start < end:
+        period_end = period_start + period
+        yield _compile_statistics(
+            hass,
+            session,
+            sensor_states,
+            wanted_statistics,
+            _history_during_period(history_list, timestamps, period_start, period_end),
+            period_start,
+            period_end,
+        )
+        period_start = period_end
+
+
+def _compile_statistics(  # noqa: C901
+    hass: HomeAssistant,
+    session: Session,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+    history_list: dict[str, list[State]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for all entities during start-end from their history."""
+    result: list[StatisticResult] = []
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
@@ -525,17 +601,20 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+        if wanted_statistics[entity_id] & {"max", "mean", "min"}:
+            # Calculate in bulk from the values and timestamps
+            values = [fstate for fstate, _ in valid_float_states]
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(values)
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(values)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(
+                    [state.last_updated_timestamp for _, state in valid_float_states],
+                    values,
+                    start_ts,
+                    end_ts,
+                )
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
@@ -39,6 +39,7 @@ from .messages import (  # noqa: F401
     event_message,
     result_message,
 )
+from .stream import async_stream_batches  # noqa: F401
 
 DOMAIN: Final = const.DOMAIN
 
@@ -43,6 +43,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_template_render_scheduler,
     async_track_template_result,
 )
 from homeassistant.helpers.json import (
@@ -60,6 +61,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +69,9 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ENTITIES_SNAPSHOT: HassKey[EntitiesSnapshot] = HassKey(
+    "websocket_api_entities_snapshot"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -89,6 +94,7 @@ def async_register_commands(
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_render_template_load)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
@@ -98,6 +104,7 @@ def async_register_commands(
     async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_supported_features)
     async_reg(hass, handle_integration_descriptions)
+    async_reg(hass, handle_connection_writer_stats)
 
 
 def pong_message(iden: int) -> dict[str, Any]:
@@ -394,6 +401,63 @@ def _forward_entity_changes(
     send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
+class EntitiesSnapshot:
+    """A versioned snapshot of the compressed states of all entities.
+
+    The snapshot follows the state machine with a state changed listener
+    and the joined compressed states JSON is built at most once per
+    version, so connections that subscribe to all entities between
+    two state changes share the same buffer.
+    """
+
+    __slots__ = ("_buffer", "_buffer_version", "_states", "version")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot from the state machine."""
+        self._states: dict[str, State] = {
+            state.entity_id: state for state in hass.states.async_all()
+        }
+        self._buffer = b""
+        self._buffer_version = -1
+        self.version = 0
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the snapshot with a state change."""
+        if (new_state := event.data["new_state"]) is None:
+            self._states.pop(event.data["entity_id"], None)
+        else:
+            self._states[new_state.entity_id] = new_state
+        self.version += 1
+
+    @callback
+    def async_get_states(self) -> list[State]:
+        """Return the states in the snapshot."""
+        return list(self._states.values())
+
+    @callback
+    def async_get_buffer(self) -> bytes:
+        """Return the joined compressed states JSON of the current version.
+
+        Raises ValueError or TypeError if a state cannot be serialized.
+        """
+        if self._buffer_version != self.version:
+            self._buffer = b",".join(
+                state.as_compressed_state_json for state in self._states.values()
+            )
+            self._buffer_version = self.version
+        return self._buffer
+
+
+@callback
+def _async_get_entities_snapshot(hass: HomeAssistant) -> EntitiesSnapshot:
+    """Return the snapshot of the compressed states of all entities."""
+    if (snapshot := hass.data.get(ENTITIES_SNAPSHOT)) is None:
+        snapshot = hass.data[ENTITIES_SNAPSHOT] = EntitiesSnapshot(hass)
+    return snapshot
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -412,7 +476,19 @@ def handle_subscribe_entities(
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
+    user = connection.user
+    snapshot: EntitiesSnapshot | None = None
+    states: list[State]
+    if (
+        not entity_ids
+        and not entity_filter
+        and (user.is_admin or user.permissions.access_all_entities(POLICY_READ))
+    ):
+        # Subscribers to all entities share the pre-serialized snapshot
+        snapshot = _async_get_entities_snapshot(hass)
+        states = snapshot.async_get_states()
+    else:
+        states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
     connection.subscriptions[msg_id] = hass.bus.async_listen(
@@ -432,6 +508,11 @@ def handle_subscribe_entities(
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
     try:
+        if snapshot is not None:
+            _send_handle_entities_init_response(
+                connection, message_id_as_bytes, [snapshot.async_get_buffer()]
+            )
+            return
         if entity_ids or entity_filter:
             serialized_states = [
                 state.as_compressed_state_json
@@ -579,6 +660,33 @@ def handle_ping(
     connection.send_message(pong_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "connection/writer_stats"})
+def handle_connection_writer_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle getting the outgoing message counters of the connection."""
+    connection.send_result(
+        msg["id"],
+        {
+            "queue_depth": connection.pending_messages(),
+            **connection.writer_stats.as_dict(),
+        },
+    )
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "render_template/load"})
+def handle_render_template_load(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle getting the render load of the tracked templates."""
+    connection.send_result(
+        msg["id"], async_template_render_scheduler(hass).async_render_load()
+    )
+
+
 @lru_cache
 def _cached_template(template_str: str, hass: HomeAssistant) -> template.Template:
     """Return a cached template."""
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Coroutine, Hashable
 from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING, Any, Literal
 
 from aiohttp import web
@@ -36,21 +37,53 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+def _no_pending_messages() -> int:
+    """Return no pending messages for connections without a writer."""
+    return 0
+
+
+async def _async_no_pending_messages_drained() -> None:
+    """Return at once for connections without a writer."""
+
+
+@dataclass(slots=True)
+class WriterStats:
+    """Counters for the outgoing messages of a connection."""
+
+    messages: int = 0
+    frames: int = 0
+    bytes: int = 0
+    queue_bytes: int = 0
+    peak_queue_depth: int = 0
+    peak_queue_bytes: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
+    total_flush_latency: float = 0.0
+    writability_waits: int = 0
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the counters as a dictionary."""
+        return asdict(self)
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
     __slots__ = (
+        "async_drained",
         "binary_handlers",
         "can_coalesce",
         "handlers",
         "hass",
         "last_id",
         "logger",
+        "pending_messages",
         "refresh_token_id",
         "send_message",
         "subscriptions",
         "supported_features",
         "user",
+        "writer_stats",
     )
 
     def __init__(
@@ -65,6 +98,12 @@ class ActiveConnection:
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # Replaced by the websocket handler once the writer is running
+        self.pending_messages: Callable[[], int] = _no_pending_messages
+        self.async_drained: Callable[[], Coroutine[Any, Any, None]] = (
+            _async_no_pending_messages_drained
+        )
+        self.writer_stats = WriterStats()
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
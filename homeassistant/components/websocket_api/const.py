@@ -29,11 +29,26 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # but since chrome will lock up with too many messages we need to
 # limit it to a lower number.
 MAX_PENDING_MSG: Final = 4096
+# Maximum number of bytes that can be pending at any given time.
+# A handful of large messages (the entity registry is ~1MiB) can
+# use far more memory than thousands of state changes.
+MAX_PENDING_MSG_BYTES: Final = 64 * 2**20
 
 # Maximum number of messages that are pending before we force
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Longest time the writer holds back messages while the socket is not
+# writable, so the messages queued meanwhile are sent as one frame, and
+# how often it checks if the socket became writable
+WRITE_BUFFER_MAX_WAIT: Final = 0.05
+WRITE_BUFFER_POLL_INTERVAL: Final = 0.005
+
+# Number of pending messages at which live streams send their
+# batches less often, and the longest time they wait to send one
+STREAM_BACKPRESSURE_PENDING_MSG: Final = 256
+STREAM_MAX_COALESCE_TIME: Final = 5.0
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -22,15 +22,19 @@ from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
+from .connection import WriterStats
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    MAX_PENDING_MSG_BYTES,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
     URL,
+    WRITE_BUFFER_MAX_WAIT,
+    WRITE_BUFFER_POLL_INTERVAL,
 )
 from .error import Disconnect
 from .messages import message_to_json_bytes
@@ -73,6 +77,7 @@ class WebSocketHandler:
         "_authenticated",
         "_closing",
         "_connection",
+        "_drained_futures",
         "_handle_task",
         "_hass",
         "_logger",
@@ -82,6 +87,7 @@ class WebSocketHandler:
         "_ready_future",
         "_release_ready_queue_size",
         "_request",
+        "_stats",
         "_writer_task",
         "_wsock",
     )
@@ -107,6 +113,8 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        self._drained_futures: list[asyncio.Future[None]] = []
+        self._stats = WriterStats()
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -137,9 +145,11 @@ class WebSocketHandler:
         logger = self._logger
         wsock = self._wsock
         loop = self._loop
+        stats = self._stats
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        transport = self._request.transport
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
@@ -155,18 +165,53 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = connection.can_coalesce
 
+                if (
+                    can_coalesce
+                    and transport is not None
+                    and transport.get_write_buffer_size()
+                ):
+                    # The socket is not writable, hold the messages back so
+                    # the ones queued meanwhile are coalesced into one frame
+                    stats.writability_waits += 1
+                    wait_until = loop.time() + WRITE_BUFFER_MAX_WAIT
+                    while (
+                        transport.get_write_buffer_size()
+                        and not transport.is_closing()
+                        and loop.time() < wait_until
+                    ):
+                        await asyncio.sleep(WRITE_BUFFER_POLL_INTERVAL)
+                    ready_message_count = len(message_queue)
+
+                flush_start = loop.time()
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
+                    message_count = 1
+                    length = len(message)
+                    stats.queue_bytes -= length
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
-                    continue
-
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
-                if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                else:
+                    message_count = len(message_queue)
+                    coalesced_messages = b"".join(
+                        (b"[", b",".join(message_queue), b"]")
+                    )
+                    message_queue.clear()
+                    stats.queue_bytes = 0
+                    length = len(coalesced_messages)
+                    if is_debug_log_enabled():
+                        debug("%s: Sending %s", self.description, coalesced_messages)
+                    await send_bytes_text(coalesced_messages)
+
+                flush_latency = loop.time() - flush_start
+                stats.messages += message_count
+                stats.frames += 1
+                stats.bytes += length
+                stats.last_flush_latency = flush_latency
+                stats.total_flush_latency += flush_latency
+                stats.max_flush_latency = max(flush_latency, stats.max_flush_latency)
+                if not message_queue and self._drained_futures:
+                    self._release_drained_futures()
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -176,6 +221,39 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            # Nothing more will be written, don't keep producers waiting
+            self._release_drained_futures()
+
+    @callback
+    def _release_drained_futures(self) -> None:
+        """Release the producers waiting for the queue to be written."""
+        drained_futures = self._drained_futures
+        self._drained_futures = []
+        for future in drained_futures:
+            if not future.done():
+                future.set_result(None)
+
+    async def _async_drained(self) -> None:
+        """Wait until the queued messages have been written to the socket.
+
+        The writer only takes the next messages once the transport has
+        accepted the previous frame, so this waits while the client is
+        not reading.
+        """
+        if (
+            self._closing
+            or (writer_task := self._writer_task) is None
+            or writer_task.done()
+            or (
+                not self._message_queue
+                and (ready_future := self._ready_future) is not None
+                and not ready_future.done()
+            )
+        ):
+            return
+        future: asyncio.Future[None] = self._loop.create_future()
+        self._drained_futures.append(future)
+        await future
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -184,6 +262,11 @@ class WebSocketHandler:
             self._peak_checker_unsub()
             self._peak_checker_unsub = None
 
+    @callback
+    def _pending_messages(self) -> int:
+        """Return the number of messages waiting to be written."""
+        return len(self._message_queue or ())
+
     @callback
     def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
         """Queue sending a message to the client.
@@ -205,7 +288,12 @@ class WebSocketHandler:
 
         message_queue = self._message_queue
         message_queue.append(message)
-        if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
+        stats = self._stats
+        stats.queue_bytes += len(message)
+        queue_size_after_add = len(message_queue)
+        stats.peak_queue_depth = max(queue_size_after_add, stats.peak_queue_depth)
+        stats.peak_queue_bytes = max(stats.queue_bytes, stats.peak_queue_bytes)
+        if queue_size_after_add >= MAX_PENDING_MSG:
             self._logger.error(
                 (
                     "%s: Client unable to keep up with pending messages. Reached %s pending"
@@ -219,6 +307,20 @@ class WebSocketHandler:
             self._cancel()
             return
 
+        if stats.queue_bytes >= MAX_PENDING_MSG_BYTES:
+            self._logger.error(
+                (
+                    "%s: Client unable to keep up with pending messages. Reached %s"
+                    " pending bytes. The system's load is too high or an integration"
+                    " is misbehaving; Last message was: %s"
+                ),
+                self.description,
+                MAX_PENDING_MSG_BYTES,
+                message[:1024],
+            )
+            self._cancel()
+            return
+
         if self._release_ready_queue_size == 0:
             # Try to coalesce more messages to reduce the number of writes
             self._release_ready_queue_size = queue_size_after_add
@@ -410,6 +512,9 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
+        connection.pending_messages = self._pending_messages
+        connection.async_drained = self._async_drained
+        connection.writer_stats = self._stats
         self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -0,0 +1,47 @@
+"""Deliver live streams to websocket connections in batches."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+from .connection import ActiveConnection
+from .const import STREAM_BACKPRESSURE_PENDING_MSG, STREAM_MAX_COALESCE_TIME
+
+
+async def async_stream_batches[_T](
+    connection: ActiveConnection,
+    stream_queue: asyncio.Queue[_T],
+    is_stale: Callable[[_T], bool],
+    build_message: Callable[[list[_T]], bytes | None],
+    coalesce_time: float,
+) -> None:
+    """Send the items of a live stream to the connection in batches.
+
+    A batch starts with the first item that is not stale and collects
+    the items that arrive in the next coalesce_time seconds, so an
+    event storm results in a few larger messages instead of one
+    message per item.
+
+    When the client does not read its messages as fast as they are
+    sent, the time to collect a batch is doubled up to
+    STREAM_MAX_COALESCE_TIME until the client catches up. If the
+    client falls behind further the stream queue fills up and the
+    owner of the queue cancels the subscription.
+    """
+    window = coalesce_time
+    while True:
+        items: list[_T] = [await stream_queue.get()]
+        if is_stale(items[0]):
+            continue
+        await asyncio.sleep(window)
+        while not stream_queue.empty():
+            items.append(stream_queue.get_nowait())
+
+        if message := build_message(items):
+            connection.send_message(message)
+
+        if connection.pending_messages() >= STREAM_BACKPRESSURE_PENDING_MSG:
+            window = min(window * 2, STREAM_MAX_COALESCE_TIME)
+        else:
+            window = coalesce_time
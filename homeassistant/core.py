@@ -15,6 +15,7 @@ from collections.abc import (
     Iterable,
     KeysView,
     Mapping,
+    Sequence,
     ValuesView,
 )
 import concurrent.futures
@@ -24,7 +25,9 @@ import enum
 import functools
 import inspect
 import logging
+import math
 import re
+import sys
 import threading
 import time
 from time import monotonic
@@ -40,6 +43,7 @@ from typing import (
     cast,
     overload,
 )
+from weakref import WeakValueDictionary
 
 from propcache.api import cached_property, under_cached_property
 import voluptuous as vol
@@ -1445,10 +1449,108 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
+@dataclass(slots=True)
+class _BatchListener(Generic[_DataT]):
+    hass: HomeAssistant
+    listener_job: HassJob[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None]
+
+    @callback
+    def __call__(self, event: Event[_DataT]) -> None:
+        """Fire listener with a batch of a single event."""
+        self.hass.async_run_hass_job(self.listener_job, [event])
+
+    @callback
+    def async_run_batch(self, events: list[Event[_DataT]]) -> None:
+        """Fire listener with a batch of events."""
+        self.hass.async_run_hass_job(self.listener_job, events)
+
+    def __repr__(self) -> str:
+        """Return the representation of the listener and source module."""
+        module = inspect.getmodule(self.listener_job.target)
+        if module:
+            return f"<_BatchListener {module.__name__}:{self.listener_job.target}>"
+        return f"<_BatchListener {self.listener_job.target}>"
+
+
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
 
+@dataclass(slots=True, frozen=True)
+class EventIndex(Generic[_DataT]):
+    """Describe how listeners for an event type are indexed by key.
+
+    key_getter returns the key of an event or None if the event should not
+    be dispatched to any listener of the index. If match_all is set, listeners
+    for MATCH_ALL receive every event that has a key. If dispatch_soon is set,
+    listeners are called after one more iteration of the event loop.
+    """
+
+    event_type: EventType[_DataT] | str
+    key_getter: Callable[[_DataT], str | None]
+    match_all: bool = False
+    dispatch_soon: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class _IndexedListeners(Generic[_DataT]):
+    """Listeners of an index and the bus listener dispatching to them."""
+
+    remove: CALLBACK_TYPE
+    jobs: defaultdict[str, list[HassJob[[Event[_DataT]], Any]]]
+
+
+@callback
+def _async_indexed_filter(
+    index: EventIndex[_DataT],
+    jobs: dict[str, list[HassJob[[Event[_DataT]], Any]]],
+    event_data: _DataT,
+) -> bool:
+    """Filter events by the keys of an index."""
+    if (key := index.key_getter(event_data)) is None:
+        return False
+    return key in jobs or (index.match_all and MATCH_ALL in jobs)
+
+
+@callback
+def _async_dispatch_indexed(
+    hass: HomeAssistant,
+    index: EventIndex[_DataT],
+    jobs: dict[str, list[HassJob[[Event[_DataT]], Any]]],
+    event: Event[_DataT],
+) -> None:
+    """Dispatch an event to the listeners of its key."""
+    if (key := index.key_getter(event.data)) is None:
+        return
+    if index.match_all:
+        jobs_list = jobs.get(key, EMPTY_LIST) + jobs.get(MATCH_ALL, EMPTY_LIST)
+    elif key_jobs_list := jobs.get(key):
+        jobs_list = key_jobs_list.copy()
+    else:
+        return
+    for job in jobs_list:
+        try:
+            hass.async_run_hass_job(job, event)
+        except Exception:
+            _LOGGER.exception("Error while dispatching event for %s to %s", key, job)
+
+
+@callback
+def _async_dispatch_indexed_soon(
+    hass: HomeAssistant,
+    index: EventIndex[_DataT],
+    jobs: dict[str, list[HassJob[[Event[_DataT]], Any]]],
+    event: Event[_DataT],
+) -> None:
+    """Dispatch soon to ensure one event loop runs before dispatch."""
+    hass.loop.call_soon(_async_dispatch_indexed, hass, index, jobs, event)
+
+
+@callback
+def _async_remove_nothing() -> None:
+    """Remove a listener that was never added."""
+
+
 @functools.lru_cache
 def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> None:
     """Verify the length of the event type and raise if too long."""
@@ -1459,7 +1561,13 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_indexed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1576,7 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._indexed_listeners: dict[EventIndex[Any], _IndexedListeners[Any]] = {}
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1578,6 +1687,81 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    @callback
+    def async_fire_many_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        events_data: Sequence[_DataT],
+        origin: EventOrigin = EventOrigin.local,
+        context: Context | None = None,
+        time_fired: float | None = None,
+    ) -> None:
+        """Fire a batch of events of the same type, for internal use only.
+
+        Listeners registered with async_listen_batch receive all events that
+        pass their filter in a single call, other listeners receive the events
+        one at a time. Each listener sees all events of the batch before the
+        next listener runs.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        if self._debug:
+            for event_data in events_data:
+                _LOGGER.debug(
+                    "Bus:Handling %s", _event_repr(event_type, origin, event_data)
+                )
+
+        listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            match_all_listeners = self._match_all_listeners
+        else:
+            match_all_listeners = EMPTY_LIST
+
+        # Events are created lazily and shared between listeners
+        events: list[Event[_DataT] | None] = [None] * len(events_data)
+        for job, event_filter in listeners + match_all_listeners:
+            batch: list[Event[_DataT]] = []
+            for idx, event_data in enumerate(events_data):
+                if event_filter is not None:
+                    try:
+                        if not event_filter(event_data):
+                            continue
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
+                        continue
+
+                if (event := events[idx]) is None:
+                    event = events[idx] = Event(
+                        event_type,
+                        event_data,
+                        origin,
+                        time_fired,
+                        context,
+                    )
+                batch.append(event)
+
+            if not batch:
+                continue
+
+            target = job.target
+            if type(target) is _BatchListener:
+                try:
+                    target.async_run_batch(batch)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+                continue
+
+            for event in batch:
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1641,6 +1825,126 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_batch(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for batches of events of a specific type.
+
+        The listener is called with a list of events. Events fired
+        one at a time are delivered as a list with a single event, batches
+        fired by bulk operations like StateMachine.async_set_many are
+        delivered in a single call.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if an event
+        is included in the batch.
+
+        This method must be run in the event loop.
+        """
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        if event_type == EVENT_STATE_REPORTED and not event_filter:
+            raise HomeAssistantError(f"Event filter is required for event {event_type}")
+        batch_listener: _BatchListener[_DataT] = _BatchListener(
+            self._hass, HassJob(listener, f"listen batch {event_type}")
+        )
+        return self._async_listen_filterable_job(
+            event_type,
+            (
+                HassJob(
+                    batch_listener,
+                    f"listen batch {event_type} {listener}",
+                    job_type=HassJobType.Callback,
+                ),
+                event_filter,
+            ),
+        )
+
+    @callback
+    def async_listen_indexed(
+        self,
+        index: EventIndex[_DataT],
+        keys: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Any],
+        job_type: HassJobType | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of an index that match any of the keys.
+
+        All listeners of an index share a single listener on the bus that
+        routes events with a dict lookup on the key of the event, so firing
+        an event only touches the listeners of its key instead of running
+        a filter for every listener.
+
+        Keys are used as is and are not lower cased.
+
+        This method must be run in the event loop.
+        """
+        if not keys:
+            return _async_remove_nothing
+
+        if (indexed := self._indexed_listeners.get(index)) is None:
+            jobs: defaultdict[str, list[HassJob[[Event[_DataT]], Any]]] = defaultdict(
+                list
+            )
+            dispatcher = (
+                _async_dispatch_indexed_soon
+                if index.dispatch_soon
+                else _async_dispatch_indexed
+            )
+            remove = self._async_listen_filterable_job(
+                index.event_type,
+                (
+                    HassJob(
+                        functools.partial(dispatcher, self._hass, index, jobs),
+                        f"indexed listen {index.event_type}",
+                        job_type=HassJobType.Callback,
+                    ),
+                    functools.partial(_async_indexed_filter, index, jobs),
+                ),
+            )
+            indexed = self._indexed_listeners[index] = _IndexedListeners(remove, jobs)
+
+        job = HassJob(
+            listener, f"track {index.event_type} event {keys}", job_type=job_type
+        )
+        jobs = indexed.jobs
+        if isinstance(keys, str):
+            # Almost all calls use a single key so we optimize for that case.
+            # We don't use setdefault here because this gets called ~20000 times
+            # during startup, and we want to avoid the overhead of creating
+            # empty lists and throwing them away.
+            jobs[keys].append(job)
+            keys = (keys,)
+        else:
+            for key in keys:
+                jobs[key].append(job)
+
+        return functools.partial(self._async_remove_indexed_listener, index, keys, job)
+
+    @callback
+    def _async_remove_indexed_listener(
+        self,
+        index: EventIndex[_DataT],
+        keys: Iterable[str],
+        job: HassJob[[Event[_DataT]], Any],
+    ) -> None:
+        """Remove a listener of an index.
+
+        This method must be run in the event loop.
+        """
+        jobs = self._indexed_listeners[index].jobs
+        for key in keys:
+            jobs[key].remove(job)
+            if not jobs[key]:
+                del jobs[key]
+
+        if not jobs:
+            self._indexed_listeners.pop(index).remove()
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -1993,6 +2297,15 @@ class State:
             context=context,
         )
 
+    def evict_caches(self) -> None:
+        """Drop the cached dict and JSON representations of the state.
+
+        They are built again the next time they are accessed.
+        """
+        cache = self._cache
+        for key in _STATE_REPRESENTATION_CACHE_KEYS:
+            cache.pop(key, None)
+
     def expire(self) -> None:
         """Mark the state as old.
 
@@ -2021,6 +2334,60 @@ class State:
         )
 
 
+_STATE_REPRESENTATION_CACHE_KEYS = (
+    "_as_dict",
+    "_as_read_only_dict",
+    "as_dict_json",
+    "json_fragment",
+    "as_compressed_state",
+    "as_compressed_state_json",
+)
+
+# Only values of these types are interned. Equal values of other
+# types may serialize differently, like containers holding items of
+# different types or datetimes of the same instant in other time zones.
+_INTERNABLE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _intern_attributes(
+    interned: WeakValueDictionary[int, ReadOnlyDict[str, Any]],
+    attributes: Mapping[str, Any],
+) -> Mapping[str, Any]:
+    """Return a shared read only copy of attributes if one exists.
+
+    The table is keyed by a hash of the attributes so it holds no
+    copy of them, a match is compared item by item before it is shared.
+    The type of each value is part of the comparison since values that
+    compare equal like 1, 1.0 and True serialize differently.
+    Negative zero is equal to zero, so it is not interned either.
+    """
+    for value in attributes.values():
+        value_type = value.__class__
+        if value_type not in _INTERNABLE_TYPES or (
+            value_type is float and not value and math.copysign(1.0, value) < 0
+        ):
+            return attributes
+    key = hash(
+        tuple((name, value.__class__, value) for name, value in attributes.items())
+    )
+    if (existing := interned.get(key)) is not None:
+        if len(existing) == len(attributes) and all(
+            name == existing_name
+            and value.__class__ is existing_value.__class__
+            and value == existing_value
+            for (name, value), (existing_name, existing_value) in zip(
+                attributes.items(), existing.items(), strict=True
+            )
+        ):
+            return existing
+        # Hash collision, keep the attributes that are already shared
+        return attributes
+    if type(attributes) is not ReadOnlyDict:
+        attributes = ReadOnlyDict(attributes)
+    interned[key] = attributes
+    return attributes
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
@@ -2066,7 +2433,14 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_bus", "_loop", "_reservations", "_states", "_states_data")
+    __slots__ = (
+        "_bus",
+        "_interned_attributes",
+        "_loop",
+        "_reservations",
+        "_states",
+        "_states_data",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2077,6 +2451,96 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Shared attributes when compact storage is enabled
+        self._interned_attributes: (
+            WeakValueDictionary[int, ReadOnlyDict[str, Any]] | None
+        ) = None
+
+    @property
+    def compact_storage(self) -> bool:
+        """Return if compact storage is enabled."""
+        return self._interned_attributes is not None
+
+    @callback
+    def async_enable_compact_storage(self) -> None:
+        """Share identical attributes between states to save memory.
+
+        Attributes of states that are already in the state machine are
+        interned as well, which drops their cached representations.
+
+        This method must be run in the event loop.
+        """
+        if self._interned_attributes is not None:
+            return
+        interned = self._interned_attributes = WeakValueDictionary()
+        for state in self._states_data.values():
+            attributes = _intern_attributes(interned, state.attributes)
+            if attributes is not state.attributes:
+                state.attributes = attributes  # type: ignore[assignment]
+                state.evict_caches()
+
+    @callback
+    def async_evict_caches(self) -> None:
+        """Drop the cached dict and JSON representations of all states.
+
+        This can be used to free memory on large installs, the
+        representations are built again on next access.
+
+        This method must be run in the event loop.
+        """
+        for state in self._states_data.values():
+            state.evict_caches()
+
+    @callback
+    def async_memory_usage(self) -> dict[str, Any]:
+        """Estimate the memory used by the states in the state machine.
+
+        Attributes shared between states are only counted once, the
+        table used to share them is counted as well.
+
+        This method must be run in the event loop.
+        """
+        getsizeof = sys.getsizeof
+        seen_attributes: set[int] = set()
+        state_bytes = attributes_bytes = cache_bytes = 0
+        for state in self._states_data.values():
+            state_bytes += (
+                getsizeof(state)
+                + getsizeof(state.entity_id)
+                + getsizeof(state.state)
+                + getsizeof(state._cache)  # noqa: SLF001
+            )
+            attributes = state.attributes
+            if id(attributes) not in seen_attributes:
+                seen_attributes.add(id(attributes))
+                attributes_bytes += getsizeof(attributes) + sum(
+                    getsizeof(value) for value in attributes.values()
+                )
+            for key in _STATE_REPRESENTATION_CACHE_KEYS:
+                if (value := state._cache.get(key)) is not None:  # noqa: SLF001
+                    cache_bytes += getsizeof(value)
+        intern_bytes = 0
+        if (interned := self._interned_attributes) is not None:
+            # The weak references to the shared attributes by hash
+            refs: dict[int, Any] = interned.data  # type: ignore[attr-defined]
+            intern_bytes = (
+                getsizeof(interned)
+                + getsizeof(refs)
+                + sum(getsizeof(key) + getsizeof(ref) for key, ref in refs.items())
+            )
+        entities = len(self._states_data)
+        total_bytes = state_bytes + attributes_bytes + cache_bytes + intern_bytes
+        return {
+            "compact_storage": self.compact_storage,
+            "entities": entities,
+            "unique_attributes": len(seen_attributes),
+            "state_bytes": state_bytes,
+            "attributes_bytes": attributes_bytes,
+            "cache_bytes": cache_bytes,
+            "intern_bytes": intern_bytes,
+            "total_bytes": total_bytes,
+            "bytes_per_entity": total_bytes // entities if entities else 0,
+        }
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2282,6 +2746,58 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the states of many entities at once.
+
+        States is an iterable of (entity_id, new_state, attributes) tuples.
+        All states share the same timestamp and context. The resulting
+        state_changed and state_reported events are fired in the order of
+        the states, consecutive events of the same type as one batch so
+        listeners registered with EventBus.async_listen_batch are called
+        once per batch.
+
+        This method must be run in the event loop.
+        """
+        timestamp = timestamp or time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+
+        # Consecutive events of the same type, fired when the type changes
+        batch_type: EventType[Any] = EVENT_STATE_CHANGED
+        batch: list[EventStateChangedData | EventStateReportedData] = []
+        for entity_id, new_state, attributes in states:
+            event_type, event_data = self._async_apply_state(
+                entity_id.lower(),
+                str(new_state),
+                attributes or {},
+                force_update,
+                context,
+                None,
+                timestamp,
+                now,
+            )
+            if event_type is not batch_type:
+                if batch:
+                    self._bus.async_fire_many_internal(
+                        batch_type, batch, context=context, time_fired=timestamp
+                    )
+                batch_type = event_type
+                batch = []
+            batch.append(event_data)
+
+        if batch:
+            self._bus.async_fire_many_internal(
+                batch_type, batch, context=context, time_fired=timestamp
+            )
+
     @callback
     def async_set_internal(
         self,
@@ -2300,6 +2816,58 @@ class StateMachine:
         breaking changes to this function in the future and it
         should not be used in integrations.
 
+        This method must be run in the event loop.
+        """
+        # It is much faster to convert a timestamp to a utc datetime object
+        # than converting a utc datetime object to a timestamp since cpython
+        # does not have a fast path for handling the UTC timezone and has to do
+        # multiple local timezone conversions.
+        #
+        # from_timestamp implementation:
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
+        #
+        # timestamp implementation:
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
+        now = dt_util.utc_from_timestamp(timestamp)
+
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+
+        event_type, event_data = self._async_apply_state(
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+            timestamp,
+            now,
+        )
+        self._bus.async_fire_internal(  # type: ignore[misc]
+            event_type,
+            event_data,
+            context=context,
+            time_fired=timestamp,
+        )
+
+    @callback
+    def _async_apply_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context,
+        state_info: StateInfo | None,
+        timestamp: float,
+        now: datetime.datetime,
+    ) -> tuple[
+        EventType[EventStateChangedData] | EventType[EventStateReportedData],
+        EventStateChangedData | EventStateReportedData,
+    ]:
+        """Apply a new state and return the event to fire for it.
+
         This method must be run in the event loop.
         """
         # Most cases the key will be in the dict
@@ -2319,44 +2887,24 @@ class StateMachine:
             same_attr = old_state.attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
-        # It is much faster to convert a timestamp to a utc datetime object
-        # than converting a utc datetime object to a timestamp since cpython
-        # does not have a fast path for handling the UTC timezone and has to do
-        # multiple local timezone conversions.
-        #
-        # from_timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-        #
-        # timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
-
-        if context is None:
-            context = Context(id=ulid_at_time(timestamp))
-
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
             old_state.last_reported = now  # type: ignore[union-attr]
             old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
             # Avoid creating an EventStateReportedData
-            self._bus.async_fire_internal(  # type: ignore[misc]
-                EVENT_STATE_REPORTED,
-                {
-                    "entity_id": entity_id,
-                    "old_last_reported": old_last_reported,
-                    "new_state": old_state,
-                },
-                context=context,
-                time_fired=timestamp,
-            )
-            return
+            return EVENT_STATE_REPORTED, {
+                "entity_id": entity_id,
+                "old_last_reported": old_last_reported,
+                "new_state": old_state,
+            }
 
         if same_attr:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        elif (interned := self._interned_attributes) is not None:
+            attributes = _intern_attributes(interned, attributes)  # type: ignore[arg-type]
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2380,12 +2928,7 @@ class StateMachine:
             "old_state": old_state,
             "new_state": state,
         }
-        self._bus.async_fire_internal(
-            EVENT_STATE_CHANGED,
-            state_changed_data,
-            context=context,
-            time_fired=timestamp,
-        )
+        return EVENT_STATE_CHANGED, state_changed_data
 
 
 class SupportsResponse(enum.StrEnum):
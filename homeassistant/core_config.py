@@ -83,6 +83,7 @@ _LOGGER = logging.getLogger(__name__)
 
 DATA_CUSTOMIZE: HassKey[EntityValues] = HassKey("hass_customize")
 
+CONF_COMPACT_STATES: Final = "compact_states"
 CONF_CREDENTIAL: Final = "credential"
 CONF_ICE_SERVERS: Final = "ice_servers"
 CONF_WEBRTC: Final = "webrtc"
@@ -324,6 +325,7 @@ CORE_CONFIG_SCHEMA = vol.All(
             vol.Optional(CONF_COUNTRY): cv.country,
             vol.Optional(CONF_LANGUAGE): cv.language,
             vol.Optional(CONF_DEBUG): cv.boolean,
+            vol.Optional(CONF_COMPACT_STATES): cv.boolean,
             vol.Optional(CONF_WEBRTC): vol.Schema(
                 {
                     vol.Required(CONF_ICE_SERVERS): vol.All(
@@ -416,6 +418,9 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
     if config.get(CONF_DEBUG):
         hac.debug = True
 
+    if config.get(CONF_COMPACT_STATES):
+        hass.states.async_enable_compact_storage()
+
     if CONF_WEBRTC in config:
         hac.webrtc.ice_servers = [
             RTCIceServer(
@@ -609,6 +614,10 @@ class Config:
         # If Home Assistant is running in safe mode
         self.safe_mode: bool = False
 
+        # If Home Assistant defers importing lazy integration platforms
+        # until they are first used
+        self.lazy_platforms: bool = False
+
         self.webrtc = RTCConfiguration()
 
     def async_initialize(self) -> None:
@@ -181,22 +181,53 @@ def generate_filter(
     )
 
 
-def _generate_filter_from_sets_and_pattern_lists(
-    include_d: set[str],
-    include_e: set[str],
-    exclude_d: set[str],
-    exclude_e: set[str],
-    include_eg: re.Pattern[str] | None,
-    exclude_eg: re.Pattern[str] | None,
-) -> Callable[[str], bool]:
-    """Generate a filter from pre-comuted sets and pattern lists."""
-    have_exclude = bool(exclude_e or exclude_d or exclude_eg)
-    have_include = bool(include_e or include_d or include_eg)
+def combine_filter_matchers[_T](
+    include_domains: _T | None,
+    include_entities: _T | None,
+    include_entity_globs: _T | None,
+    exclude_domains: _T | None,
+    exclude_entities: _T | None,
+    exclude_entity_globs: _T | None,
+    *,
+    any_of: Callable[..., _T],
+    all_of: Callable[..., _T],
+    negate: Callable[[_T], _T],
+) -> _T | None:
+    """Combine the matchers of a filter into a single predicate.
+
+    A matcher is None when nothing is configured for it. This is the only
+    place that defines how includes and excludes interact; the entity filter
+    combines functions and the recorder combines SQL expressions with it,
+    so the two can not diverge.
+
+    Returns None when all entities are included.
+    """
+    have_include = any(
+        matcher is not None
+        for matcher in (include_entities, include_domains, include_entity_globs)
+    )
+    have_exclude = any(
+        matcher is not None
+        for matcher in (exclude_entities, exclude_domains, exclude_entity_globs)
+    )
+
+    def _any(*matchers: _T | None) -> _T | None:
+        """Match any of the configured matchers."""
+        configured = [matcher for matcher in matchers if matcher is not None]
+        if len(configured) > 1:
+            return any_of(*configured)
+        return configured[0] if configured else None
+
+    def _and_not(matcher: _T | None, excluded: _T | None) -> _T | None:
+        """Match the matcher unless excluded matches."""
+        if matcher is None or excluded is None:
+            return matcher
+        return all_of(negate(excluded), matcher)
 
     # Case 1 - No filter
     # - All entities included
     if not have_include and not have_exclude:
-        return bool
+        return None
 
     # Case 2 - Only includes
     # - Entity listed in entities include: include
@@ -204,36 +235,17 @@ def _generate_filter_from_sets_and_pattern_lists(
     # - Otherwise, entity matches glob include: include
     # - Otherwise: exclude
     if have_include and not have_exclude:
-
-        @lru_cache(maxsize=MAX_EXPECTED_ENTITY_IDS)
-        def entity_included(entity_id: str) -> bool:
-            """Return true if entity matches inclusion filters."""
-            return (
-                entity_id in include_e
-                or split_entity_id(entity_id)[0] in include_d
-                or (bool(include_eg and include_eg.match(entity_id)))
-            )
-
-        # Return filter function for case 2
-        return entity_included
+        return _any(include_entities, include_domains, include_entity_globs)
 
     # Case 3 - Only excludes
     # - Entity listed in exclude: exclude
     # - Otherwise, entity matches domain exclude: exclude
     # - Otherwise, entity matches glob exclude: exclude
     # - Otherwise: include
-    if not have_include and have_exclude:
-
-        @lru_cache(maxsize=MAX_EXPECTED_ENTITY_IDS)
-        def entity_not_excluded(entity_id: str) -> bool:
-            """Return true if entity matches exclusion filters."""
-            return not (
-                entity_id in exclude_e
-                or split_entity_id(entity_id)[0] in exclude_d
-                or (exclude_eg and exclude_eg.match(entity_id))
-            )
-
-        return entity_not_excluded
+    if not have_include:
+        excludes = _any(exclude_entities, exclude_domains, exclude_entity_globs)
+        assert excludes is not None
+        return negate(excludes)
 
     # Case 4 - Domain and/or glob includes (may also have excludes)
     # - Entity listed in entities include: include
@@ -242,23 +254,17 @@ def _generate_filter_from_sets_and_pattern_lists(
     # - Otherwise, entity matches glob exclude: exclude
     # - Otherwise, entity matches domain include: include
     # - Otherwise: exclude
-    if include_d or include_eg:
-
-        @lru_cache(maxsize=MAX_EXPECTED_ENTITY_IDS)
-        def entity_filter_4a(entity_id: str) -> bool:
-            """Return filter function for case 4a."""
-            return entity_id in include_e or (
-                entity_id not in exclude_e
-                and (
-                    bool(include_eg and include_eg.match(entity_id))
-                    or (
-                        split_entity_id(entity_id)[0] in include_d
-                        and not (exclude_eg and exclude_eg.match(entity_id))
-                    )
-                )
-            )
-
-        return entity_filter_4a
+    if include_domains is not None or include_entity_globs is not None:
+        return _any(
+            include_entities,
+            _and_not(
+                _any(
+                    include_entity_globs,
+                    _and_not(include_domains, exclude_entity_globs),
+                ),
+                exclude_entities,
+            ),
+        )
 
     # Case 5 - Domain and/or glob excludes (no domain and/or glob includes)
     # - Entity listed in entities include: include
@@ -266,19 +272,79 @@ def _generate_filter_from_sets_and_pattern_lists(
     # - Otherwise, entity matches glob exclude: exclude
     # - Otherwise, entity matches domain exclude: exclude
     # - Otherwise: include
-    if exclude_d or exclude_eg:
-
-        @lru_cache(maxsize=MAX_EXPECTED_ENTITY_IDS)
-        def entity_filter_4b(entity_id: str) -> bool:
-            """Return filter function for case 4b."""
-            domain = split_entity_id(entity_id)[0]
-            if domain in exclude_d or bool(exclude_eg and exclude_eg.match(entity_id)):
-                return entity_id in include_e
-            return entity_id not in exclude_e
-
-        return entity_filter_4b
+    if exclude_domains is not None or exclude_entity_globs is not None:
+        excludes = _any(exclude_entities, exclude_domains, exclude_entity_globs)
+        assert excludes is not None
+        return _any(include_entities, negate(excludes))
 
     # Case 6 - No Domain and/or glob includes or excludes
     # - Entity listed in entities include: include
     # - Otherwise: exclude
-    return partial(operator.contains, include_e)
+    return include_entities
+
+
+def _any_of(*matchers: Callable[[str], bool]) -> Callable[[str], bool]:
+    """Return a function matching if any of the matchers match."""
+    return lambda entity_id: any(matcher(entity_id) for matcher in matchers)
+
+
+def _all_of(*matchers: Callable[[str], bool]) -> Callable[[str], bool]:
+    """Return a function matching if all of the matchers match."""
+    return lambda entity_id: all(matcher(entity_id) for matcher in matchers)
+
+
+def _negate(matcher: Callable[[str], bool]) -> Callable[[str], bool]:
+    """Return a function matching if the matcher does not match."""
+    return lambda entity_id: not matcher(entity_id)
+
+
+def _domain_matcher(domains: set[str]) -> Callable[[str], bool] | None:
+    """Return a function matching entities in the domains."""
+    if not domains:
+        return None
+    return lambda entity_id: split_entity_id(entity_id)[0] in domains
+
+
+def _glob_matcher(pattern: re.Pattern[str] | None) -> Callable[[str], bool] | None:
+    """Return a function matching entities matching the glob pattern."""
+    if pattern is None:
+        return None
+    return lambda entity_id: pattern.match(entity_id) is not None
+
+
+def _generate_filter_from_sets_and_pattern_lists(
+    include_d: set[str],
+    include_e: set[str],
+    exclude_d: set[str],
+    exclude_e: set[str],
+    include_eg: re.Pattern[str] | None,
+    exclude_eg: re.Pattern[str] | None,
+) -> Callable[[str], bool]:
+    """Generate a filter from pre-computed sets and pattern lists.
+
+    The decision for each entity_id is memoized, a filter is replaced
+    together with its cache when the configuration is reloaded.
+    """
+    include_entities: Callable[[str], bool] | None = (
+        partial(operator.contains, include_e) if include_e else None
+    )
+    exclude_entities: Callable[[str], bool] | None = (
+        partial(operator.contains, exclude_e) if exclude_e else None
+    )
+    predicate = combine_filter_matchers(
+        _domain_matcher(include_d),
+        include_entities,
+        _glob_matcher(include_eg),
+        _domain_matcher(exclude_d),
+        exclude_entities,
+        _glob_matcher(exclude_eg),
+        any_of=_any_of,
+        all_of=_all_of,
+        negate=_negate,
+    )
+    if predicate is None:
+        return bool
+    # A set lookup is as fast as the cache
+    if predicate is include_entities:
+        return predicate
+    return lru_cache(maxsize=MAX_EXPECTED_ENTITY_IDS)(predicate)
@@ -3,16 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
-from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from collections.abc import Callable, Coroutine, Iterable, Sequence
 import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial, wraps
 import logging
+from operator import itemgetter
 from random import randint
 import time
-from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Concatenate
 
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
@@ -25,22 +25,20 @@ from homeassistant.const import (
 from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
+    EventIndex,
     # Explicit reexport of 'EventStateChangedData' for backwards compatibility
     EventStateChangedData as EventStateChangedData,  # noqa: PLC0414
-    EventStateEventData,
     EventStateReportedData,
     HassJob,
     HassJobType,
     HomeAssistant,
     State,
     callback,
-    split_entity_id,
 )
 from homeassistant.exceptions import TemplateError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
-from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
 
 from . import frame
@@ -52,30 +50,11 @@ from .entity_registry import (
     EVENT_ENTITY_REGISTRY_UPDATED,
     EventEntityRegistryUpdatedData,
 )
-from .ratelimit import KeyedRateLimit
+from .ratelimit import KeyedRateLimit, RateLimitScheduler
 from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import TemplateVarsType
 
-_TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
-    "track_state_change_data"
-)
-_TRACK_STATE_REPORT_DATA: HassKey[_KeyedEventData[EventStateReportedData]] = HassKey(
-    "track_state_report_data"
-)
-_TRACK_STATE_ADDED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_added_domain_data")
-)
-_TRACK_STATE_REMOVED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_removed_domain_data")
-)
-_TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
-    _KeyedEventData[EventEntityRegistryUpdatedData]
-] = HassKey("track_entity_registry_updated_data")
-_TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
-    _KeyedEventData[EventDeviceRegistryUpdatedData]
-] = HassKey("track_device_registry_updated_data")
-
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -89,39 +68,9 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
-_TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
-
-
-@dataclass(slots=True, frozen=True)
-class _KeyedEventTracker(Generic[_TypedDictT]):
-    """Class to track events by key."""
-
-    key: HassKey[_KeyedEventData[_TypedDictT]]
-    event_type: EventType[_TypedDictT] | str
-    dispatcher_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            Event[_TypedDictT],
-        ],
-        None,
-    ]
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            _TypedDictT,
-        ],
-        bool,
-    ]
-
-
-@dataclass(slots=True, frozen=True)
-class _KeyedEventData(Generic[_TypedDictT]):
-    """Class to track data for events by key."""
-
-    listener: CALLBACK_TYPE
-    callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+_TEMPLATE_RENDER_SCHEDULER: HassKey[TemplateRenderScheduler] = HassKey(
+    "template_render_scheduler"
+)
 
 
 @dataclass(slots=True)
@@ -331,51 +280,8 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action, job_type)
 
 
-@callback
-def _async_dispatch_entity_id_event_soon[_StateEventDataT: EventStateEventData](
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
-    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
-
-
-@callback
-def _async_dispatch_entity_id_event[_StateEventDataT: EventStateEventData](
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_filter[_StateEventDataT: EventStateEventData](
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
-
-
-_KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
-    key=_TRACK_STATE_CHANGE_DATA,
-    event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
+_INDEX_STATE_CHANGE: EventIndex[EventStateChangedData] = EventIndex(
+    EVENT_STATE_CHANGED, itemgetter("entity_id"), dispatch_soon=True
 )
 
 
@@ -390,16 +296,13 @@ def _async_track_state_change_event(
 
     The passed in entity_ids will not be automatically lower cased.
     """
-    return _async_track_event(
-        _KEYED_TRACK_STATE_CHANGE, hass, entity_ids, action, job_type
+    return hass.bus.async_listen_indexed(
+        _INDEX_STATE_CHANGE, entity_ids, action, job_type
     )
 
 
-_KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
-    key=_TRACK_STATE_REPORT_DATA,
-    event_type=EVENT_STATE_REPORTED,
-    dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
+_INDEX_STATE_REPORT: EventIndex[EventStateReportedData] = EventIndex(
+    EVENT_STATE_REPORTED, itemgetter("entity_id")
 )
 
 
@@ -414,8 +317,8 @@ def async_track_state_report_event(
     EVENT_STATE_REPORTED is fired on each occasion the state is updated
     but not changed, opposite of EVENT_STATE_CHANGED.
     """
-    return _async_track_event(
-        _KEYED_TRACK_STATE_REPORT, hass, entity_ids, action, job_type
+    return hass.bus.async_listen_indexed(
+        _INDEX_STATE_REPORT, entity_ids, action, job_type
     )
 
 
@@ -424,111 +327,13 @@ def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
 
 
-@callback
-def _remove_listener(
-    hass: HomeAssistant,
-    tracker: _KeyedEventTracker[_TypedDictT],
-    keys: Iterable[str],
-    job: HassJob[[Event[_TypedDictT]], Any],
-    callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-) -> None:
-    """Remove listener."""
-    for key in keys:
-        callbacks[key].remove(job)
-        if not callbacks[key]:
-            del callbacks[key]
-
-    if not callbacks:
-        hass.data.pop(tracker.key).listener()
-
-
-# tracker, not hass is intentionally the first argument here since its
-# constant and may be used in a partial in the future
-def _async_track_event(
-    tracker: _KeyedEventTracker[_TypedDictT],
-    hass: HomeAssistant,
-    keys: str | Iterable[str],
-    action: Callable[[Event[_TypedDictT]], None],
-    job_type: HassJobType | None,
-) -> CALLBACK_TYPE:
-    """Track an event by a specific key.
-
-    This function is intended for internal use only.
-    """
-    if not keys:
-        return _remove_empty_listener
-
-    hass_data = hass.data
-    tracker_key = tracker.key
-    if tracker_key in hass_data:
-        event_data = hass_data[tracker_key]
-        callbacks = event_data.callbacks
-    else:
-        callbacks = defaultdict(list)
-        listener = hass.bus.async_listen(
-            tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=partial(tracker.filter_callable, hass, callbacks),
-        )
-        event_data = _KeyedEventData(listener, callbacks)
-        hass_data[tracker_key] = event_data
-
-    job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
-
-    if isinstance(keys, str):
-        # Almost all calls to this function use a single key
-        # so we optimize for that case. We don't use setdefault
-        # here because this function gets called ~20000 times
-        # during startup, and we want to avoid the overhead of
-        # creating empty lists and throwing them away.
-        callbacks[keys].append(job)
-        keys = (keys,)
-    else:
-        for key in keys:
-            callbacks[key].append(job)
-
-    return partial(_remove_listener, hass, tracker, keys, job, callbacks)
-
-
-@callback
-def _async_dispatch_old_entity_id_or_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
-    event: Event[EventEntityRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (
-        callbacks_list := callbacks.get(  # type: ignore[call-overload]  # mypy bug?
-            event.data.get("old_entity_id", event.data["entity_id"])
-        )
-    ):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data.get("old_entity_id", event.data["entity_id"]),
-                job,
-            )
+def _old_entity_id_or_entity_id(event_data: EventEntityRegistryUpdatedData) -> str:
+    """Return the entity_id an entity registry update is keyed on."""
+    return event_data.get("old_entity_id", event_data["entity_id"])  # type: ignore[return-value]
 
 
-@callback
-def _async_entity_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
-    event_data: EventEntityRegistryUpdatedData,
-) -> bool:
-    """Filter entity registry updates by entity_id."""
-    return event_data.get("old_entity_id", event_data["entity_id"]) in callbacks
-
-
-_KEYED_TRACK_ENTITY_REGISTRY_UPDATED = _KeyedEventTracker(
-    key=_TRACK_ENTITY_REGISTRY_UPDATED_DATA,
-    event_type=EVENT_ENTITY_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_old_entity_id_or_entity_id_event,
-    filter_callable=_async_entity_registry_updated_filter,
+_INDEX_ENTITY_REGISTRY_UPDATED: EventIndex[EventEntityRegistryUpdatedData] = EventIndex(
+    EVENT_ENTITY_REGISTRY_UPDATED, _old_entity_id_or_entity_id
 )
 
 
@@ -546,46 +351,13 @@ def async_track_entity_registry_updated_event(
 
     Similar to async_track_state_change_event.
     """
-    return _async_track_event(
-        _KEYED_TRACK_ENTITY_REGISTRY_UPDATED, hass, entity_ids, action, job_type
+    return hass.bus.async_listen_indexed(
+        _INDEX_ENTITY_REGISTRY_UPDATED, entity_ids, action, job_type
     )
 
 
-@callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event_data: EventDeviceRegistryUpdatedData,
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event_data["device_id"] in callbacks
-
-
-@callback
-def _async_dispatch_device_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event: Event[EventDeviceRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["device_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["device_id"],
-                job,
-            )
-
-
-_KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
-    key=_TRACK_DEVICE_REGISTRY_UPDATED_DATA,
-    event_type=EVENT_DEVICE_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_device_id_event,
-    filter_callable=_async_device_registry_updated_filter,
+_INDEX_DEVICE_REGISTRY_UPDATED: EventIndex[EventDeviceRegistryUpdatedData] = EventIndex(
+    EVENT_DEVICE_REGISTRY_UPDATED, itemgetter("device_id")
 )
 
 
@@ -600,42 +372,23 @@ def async_track_device_registry_updated_event(
 
     Similar to async_track_entity_registry_updated_event.
     """
-    return _async_track_event(
-        _KEYED_TRACK_DEVICE_REGISTRY_UPDATED, hass, device_ids, action, job_type
+    return hass.bus.async_listen_indexed(
+        _INDEX_DEVICE_REGISTRY_UPDATED, device_ids, action, job_type
     )
 
 
-@callback
-def _async_dispatch_domain_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event: Event[EventStateChangedData],
-) -> None:
-    """Dispatch domain event listeners."""
-    domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while processing event %s for domain %s", event, domain
-            )
+def _added_domain(event_data: EventStateChangedData) -> str | None:
+    """Return the domain of an added entity."""
+    if event_data["old_state"] is not None:
+        return None
+    # If old_state is None, new_state must be set but
+    # mypy doesn't know that
+    return event_data["new_state"].domain  # type: ignore[union-attr]
 
 
-@callback
-def _async_domain_added_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["old_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If old_state is None, new_state must be set but
-        # mypy doesn't know that
-        event_data["new_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+_INDEX_STATE_ADDED_DOMAIN: EventIndex[EventStateChangedData] = EventIndex(
+    EVENT_STATE_CHANGED, _added_domain, match_all=True
+)
 
 
 @bind_hass
@@ -651,14 +404,6 @@ def async_track_state_added_domain(
     return _async_track_state_added_domain(hass, domains, action, job_type)
 
 
-_KEYED_TRACK_STATE_ADDED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_ADDED_DOMAIN_DATA,
-    event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_added_filter,
-)
-
-
 @bind_hass
 def _async_track_state_added_domain(
     hass: HomeAssistant,
@@ -667,32 +412,22 @@ def _async_track_state_added_domain(
     job_type: HassJobType | None,
 ) -> CALLBACK_TYPE:
     """Track state change events when an entity is added to domains."""
-    return _async_track_event(
-        _KEYED_TRACK_STATE_ADDED_DOMAIN, hass, domains, action, job_type
+    return hass.bus.async_listen_indexed(
+        _INDEX_STATE_ADDED_DOMAIN, domains, action, job_type
     )
 
 
-@callback
-def _async_domain_removed_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["new_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If new_state is None, old_state must be set but
-        # mypy doesn't know that
-        event_data["old_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _removed_domain(event_data: EventStateChangedData) -> str | None:
+    """Return the domain of a removed entity."""
+    if event_data["new_state"] is not None:
+        return None
+    # If new_state is None, old_state must be set but
+    # mypy doesn't know that
+    return event_data["old_state"].domain  # type: ignore[union-attr]
 
 
-_KEYED_TRACK_STATE_REMOVED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_REMOVED_DOMAIN_DATA,
-    event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_removed_filter,
+_INDEX_STATE_REMOVED_DOMAIN: EventIndex[EventStateChangedData] = EventIndex(
+    EVENT_STATE_CHANGED, _removed_domain, match_all=True
 )
 
 
@@ -704,8 +439,8 @@ def async_track_state_removed_domain(
     job_type: HassJobType | None = None,
 ) -> CALLBACK_TYPE:
     """Track state change events when an entity is removed from domains."""
-    return _async_track_event(
-        _KEYED_TRACK_STATE_REMOVED_DOMAIN, hass, domains, action, job_type
+    return hass.bus.async_listen_indexed(
+        _INDEX_STATE_REMOVED_DOMAIN, domains, action, job_type
     )
 
 
@@ -971,6 +706,113 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class TemplateRenderScheduler:
+    """Schedule the renders of all tracked templates.
+
+    The refreshes of all trackers that hit their rate limit run together
+    in the shared ticks of one scheduler. Equal templates without variables
+    share a render while the states it read did not change, and the render
+    load is tracked per template and for all templates.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.rate_limits = RateLimitScheduler(hass)
+        self.trackers: set[TrackTemplateResultInfo] = set()
+        self._shared: dict[Template, RenderInfo] = {}
+        self.renders = 0
+        self.shared_renders = 0
+        self.render_time = 0.0
+
+    @callback
+    def async_reuse_render(
+        self, template: Template, variables: TemplateVarsType, info: RenderInfo
+    ) -> RenderInfo | None:
+        """Return a render of the template that is still valid, if there is one."""
+        # Equal templates of a tracker share their render info, only
+        # reuse it when it was rendered by this template
+        if (
+            info.template is template
+            and template.async_reuse_render_info(info) is not None
+        ):
+            return info
+        if (
+            variables is None
+            and (shared := self._shared.get(template)) is not None
+            and shared is not info
+            and (reused := template.async_reuse_render_info(shared)) is not None
+        ):
+            self.shared_renders += 1
+            return reused
+        return None
+
+    @callback
+    def async_render_to_info(
+        self,
+        template: Template,
+        variables: TemplateVarsType,
+        strict: bool = False,
+        log_fn: Callable[[int, str], None] | None = None,
+    ) -> RenderInfo:
+        """Render a template and share the render with equal templates."""
+        start = time.perf_counter()
+        info = template.async_render_to_info(variables, strict=strict, log_fn=log_fn)
+        render_time = time.perf_counter() - start
+        template.async_add_render_time(render_time)
+        self.render_time += render_time
+        self.renders += 1
+        if variables is None and info.state_reads is not None:
+            # Shared renders are only kept for the current iteration
+            # of the event loop, which renders the templates of all
+            # trackers for a state change or a tick
+            if not self._shared:
+                self.hass.loop.call_soon(self._shared.clear)
+            self._shared[template] = info
+        return info
+
+    @callback
+    def async_render_load(self) -> dict[str, Any]:
+        """Return the render load of all tracked templates."""
+        templates: dict[str, dict[str, float]] = {}
+        for tracker in self.trackers:
+            for template in tracker.templates:
+                stats = templates.setdefault(
+                    template.template, dict.fromkeys(template.render_stats, 0)
+                )
+                for key, value in template.render_stats.items():
+                    if key == "max_render_time":
+                        stats[key] = max(stats[key], value)
+                    else:
+                        stats[key] += value
+        return {
+            "trackers": len(self.trackers),
+            "renders": self.renders,
+            "shared_renders": self.shared_renders,
+            "render_time": self.render_time,
+            "rate_limit_ticks": self.rate_limits.ticks,
+            "rate_limited_renders": self.rate_limits.actions,
+            "deferred_renders": self.rate_limits.deferred_actions,
+            "templates": dict(
+                sorted(
+                    templates.items(),
+                    key=lambda item: item[1]["render_time"],
+                    reverse=True,
+                )
+            ),
+        }
+
+
+@callback
+def async_template_render_scheduler(hass: HomeAssistant) -> TemplateRenderScheduler:
+    """Return the scheduler for the renders of tracked templates."""
+    if (scheduler := hass.data.get(_TEMPLATE_RENDER_SCHEDULER)) is None:
+        scheduler = hass.data[_TEMPLATE_RENDER_SCHEDULER] = TemplateRenderScheduler(
+            hass
+        )
+    return scheduler
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -1001,7 +843,8 @@ class TrackTemplateResultInfo:
             )
             track_template_.template.hass = hass
 
-        self._rate_limit = KeyedRateLimit(hass)
+        self._scheduler = async_template_render_scheduler(hass)
+        self._rate_limit = KeyedRateLimit(hass, self._scheduler.rate_limits)
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -1023,8 +866,8 @@ class TrackTemplateResultInfo:
         if super_template is not None:
             template = super_template.template
             variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._scheduler.async_render_to_info(
+                template, variables, strict=strict, log_fn=log_fn
             )
 
             # If the super template did not render to True, don't update other templates
@@ -1044,8 +887,8 @@ class TrackTemplateResultInfo:
                 continue
             template = track_template_.template
             variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._scheduler.async_render_to_info(
+                template, variables, strict=strict, log_fn=log_fn
             )
 
             if info.exception:
@@ -1061,6 +904,7 @@ class TrackTemplateResultInfo:
         self._track_state_changes = async_track_state_change_filtered(
             self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
         )
+        self._scheduler.trackers.add(self)
         self._update_time_listeners()
         _LOGGER.debug(
             (
@@ -1072,6 +916,11 @@ class TrackTemplateResultInfo:
             block_render,
         )
 
+    @property
+    def templates(self) -> list[Template]:
+        """Return the tracked templates."""
+        return [track_template_.template for track_template_ in self._track_templates]
+
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
         """State changes that will cause a re-render."""
@@ -1117,6 +966,7 @@ class TrackTemplateResultInfo:
         assert self._track_state_changes
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
+        self._scheduler.trackers.discard(self)
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
@@ -1130,9 +980,13 @@ class TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: float,
         event: Event[EventStateChangedData] | None,
+        replayed: bool | None = False,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
+        Templates are not rendered again for an event when none of the
+        states they read changed in a way they could see.
+
         Returns False if the template was not re-rendered.
 
         Returns True if the template re-rendered and did not
@@ -1169,9 +1023,30 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+
+        variables = track_template_.variables
+        if (
+            event
+            and (
+                reused := self._scheduler.async_reuse_render(
+                    template, variables, self._info[template]
+                )
+            )
+            is not None
+        ):
+            if reused is self._info[template]:
+                _LOGGER.debug(
+                    "Template update %s skipped, states it read did not change",
+                    template.template,
+                )
+                # A replayed event must update the listeners that were
+                # suppressed while the rate limit was active
+                return bool(replayed)
+            self._info[template] = info = reused
+        else:
+            self._info[template] = info = self._scheduler.async_render_to_info(
+                template, variables
+            )
 
         try:
             result: str | TemplateError = info.result()
@@ -1245,7 +1120,9 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template, now, event, replayed
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1276,7 +1153,9 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_, now, event, replayed
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -4,18 +4,19 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import partial
 import logging
 from types import ModuleType
 from typing import Any
 
-from homeassistant.const import EVENT_COMPONENT_LOADED
-from homeassistant.core import Event, HassJob, HomeAssistant, callback
+from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, Event, HassJob, HomeAssistant, callback
 from homeassistant.loader import (
     Integration,
     async_get_integrations,
     async_get_loaded_integration,
+    async_register_lazy_platform,
     async_register_preload_platform,
     bind_hass,
 )
@@ -29,6 +30,14 @@ DATA_INTEGRATION_PLATFORMS: HassKey[list[IntegrationPlatform]] = HassKey(
 )
 
 
+@dataclass(slots=True)
+class DeferredComponents:
+    """Components whose lazy integration platform was not processed yet."""
+
+    components: set[str] = field(default_factory=set)
+    task: asyncio.Task[None] | None = None
+
+
 @dataclass(slots=True, frozen=True)
 class IntegrationPlatform:
     """An integration platform."""
@@ -36,6 +45,7 @@ class IntegrationPlatform:
     platform_name: str
     process_job: HassJob[[HomeAssistant, str, Any], Awaitable[None] | None]
     seen_components: set[str]
+    deferred: DeferredComponents | None = None
 
 
 @callback
@@ -55,6 +65,10 @@ def _async_integration_platform_component_loaded(
         if component_name in integration_platform.seen_components:
             continue
         integration_platform.seen_components.add(component_name)
+        if _async_defer(hass, integration_platform):
+            assert integration_platform.deferred is not None
+            integration_platform.deferred.components.add(component_name)
+            continue
         integration_platforms_by_name[integration_platform.platform_name] = (
             integration_platform
         )
@@ -160,8 +174,15 @@ async def async_process_integration_platforms(
     # Any = platform.
     process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None] | None],
     wait_for_platforms: bool = False,
+    lazy: bool = False,
 ) -> None:
-    """Process a specific platform for all current and future loaded integrations."""
+    """Process a specific platform for all current and future loaded integrations.
+
+    A lazy platform is only needed when the integration providing it is used.
+    When Home Assistant is started with lazy platforms, it is not imported
+    during startup until async_process_lazy_integration_platforms is called,
+    and the remaining ones are processed once startup has finished.
+    """
     if DATA_INTEGRATION_PLATFORMS not in hass.data:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS] = []
         hass.bus.async_listen(
@@ -172,13 +193,23 @@ async def async_process_integration_platforms(
                 integration_platforms,
             ),
         )
+        if hass.config.lazy_platforms and hass.state is not CoreState.running:
+            hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STARTED,
+                partial(_async_process_all_lazy_platforms, hass, integration_platforms),
+            )
     else:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS]
 
-    # Tell the loader that it should try to pre-load the integration
-    # for any future components that are loaded so we can reduce the
-    # amount of import executor usage.
-    async_register_preload_platform(hass, platform_name)
+    deferred: DeferredComponents | None = None
+    if lazy and hass.config.lazy_platforms:
+        async_register_lazy_platform(hass, platform_name)
+        deferred = DeferredComponents()
+    else:
+        # Tell the loader that it should try to pre-load the integration
+        # for any future components that are loaded so we can reduce the
+        # amount of import executor usage.
+        async_register_preload_platform(hass, platform_name)
     top_level_components = hass.config.top_level_components.copy()
     process_job = HassJob(
         catch_log_exception(
@@ -188,12 +219,17 @@ async def async_process_integration_platforms(
         f"process_platform {platform_name}",
     )
     integration_platform = IntegrationPlatform(
-        platform_name, process_job, top_level_components
+        platform_name, process_job, top_level_components, deferred
     )
     integration_platforms.append(integration_platform)
     if not top_level_components:
         return
 
+    if _async_defer(hass, integration_platform):
+        assert deferred is not None
+        deferred.components.update(top_level_components)
+        return
+
     # We create a task here for two reasons:
     #
     # 1. We want the integration that provides the integration platform to
@@ -255,3 +291,68 @@ async def _async_process_integration_platforms(
 
     if futures:
         await asyncio.gather(*futures)
+
+
+@callback
+def _async_defer(
+    hass: HomeAssistant, integration_platform: IntegrationPlatform
+) -> bool:
+    """Return if processing a lazy integration platform is deferred."""
+    return (
+        integration_platform.deferred is not None
+        and hass.state is not CoreState.running
+    )
+
+
+@callback
+def _async_process_deferred(
+    hass: HomeAssistant, integration_platform: IntegrationPlatform
+) -> list[asyncio.Task[None]]:
+    """Start processing the deferred components of an integration platform.
+
+    Returns the tasks that process the components.
+    """
+    if (deferred := integration_platform.deferred) is None:
+        return []
+    tasks = [deferred.task] if deferred.task and not deferred.task.done() else []
+    if deferred.components:
+        deferred.task = hass.async_create_background_task(
+            _async_process_integration_platforms(
+                hass,
+                integration_platform.platform_name,
+                deferred.components.copy(),
+                integration_platform.process_job,
+            ),
+            f"process lazy platform {integration_platform.platform_name}",
+            eager_start=True,
+        )
+        deferred.components.clear()
+        tasks.append(deferred.task)
+    return tasks
+
+
+async def async_process_lazy_integration_platforms(
+    hass: HomeAssistant, platform_name: str
+) -> None:
+    """Process a lazy integration platform before it is first used.
+
+    Integrations that pass lazy to async_process_integration_platforms
+    must call this before using what the platforms registered.
+    """
+    tasks = [
+        task
+        for integration_platform in hass.data.get(DATA_INTEGRATION_PLATFORMS, ())
+        if integration_platform.platform_name == platform_name
+        for task in _async_process_deferred(hass, integration_platform)
+    ]
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+@callback
+def _async_process_all_lazy_platforms(
+    hass: HomeAssistant, integration_platforms: list[IntegrationPlatform], _: Event
+) -> None:
+    """Process the lazy integration platforms that were not used during startup."""
+    for integration_platform in integration_platforms:
+        _async_process_deferred(hass, integration_platform)
@@ -6,11 +6,153 @@ import asyncio
 from collections.abc import Callable, Hashable
 import logging
 import time
+from typing import Any
 
 from homeassistant.core import HomeAssistant, callback
 
 _LOGGER = logging.getLogger(__name__)
 
+RATE_LIMIT_TICK = 0.25
+RATE_LIMIT_TICK_BUDGET = 0.05
+
+
+class ScheduledAction:
+    """An action scheduled to run in a tick of a RateLimitScheduler."""
+
+    __slots__ = ("_action", "_args", "_tick", "done")
+
+    def __init__(
+        self, tick: _Tick, action: Callable[..., None], args: tuple[Any, ...]
+    ) -> None:
+        """Initialize the scheduled action."""
+        self._tick = tick
+        self._action = action
+        self._args = args
+        self.done = False
+
+    def cancel(self) -> None:
+        """Cancel the action unless it already ran."""
+        if not self.done:
+            self.done = True
+            self._tick.async_action_cancelled()
+
+    def run(self) -> None:
+        """Run the action."""
+        self.done = True
+        self._action(*self._args)
+
+
+class _Tick:
+    """A tick running the actions that are due close together."""
+
+    __slots__ = ("actions", "first_due", "pending", "run_at", "scheduler", "timer")
+
+    def __init__(self, scheduler: RateLimitScheduler, when: float) -> None:
+        """Initialize the tick."""
+        self.scheduler = scheduler
+        self.first_due = when
+        self.run_at = when
+        self.actions: list[ScheduledAction] = []
+        self.pending = 0
+        self.timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_action_cancelled(self) -> None:
+        """Stop the tick once all its actions were cancelled."""
+        self.pending -= 1
+        if not self.pending:
+            self.scheduler.async_remove_tick(self)
+
+
+class RateLimitScheduler:
+    """Run the deferred actions of many rate limits together in shared ticks.
+
+    Actions that become due within one tick of each other run together
+    when the last of them is due, instead of each scheduling a timer.
+    Once the actions of a tick took longer than the budget, the remaining
+    ones are moved to the next tick so they can not starve the event loop.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        tick: float = RATE_LIMIT_TICK,
+        budget: float = RATE_LIMIT_TICK_BUDGET,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._tick = tick
+        self._budget = budget
+        self._ticks: list[_Tick] = []
+        self.ticks = 0
+        self.actions = 0
+        self.deferred_actions = 0
+
+    @callback
+    def async_call_later(
+        self, delay: float, action: Callable[..., None], *args: Any
+    ) -> ScheduledAction:
+        """Run an action in a tick at least delay seconds from now."""
+        when = self.hass.loop.time() + delay
+        for tick in self._ticks:
+            if max(tick.run_at, when) - min(tick.first_due, when) <= self._tick:
+                break
+        else:
+            tick = _Tick(self, when)
+            self._ticks.append(tick)
+        tick.first_due = min(tick.first_due, when)
+        handle = ScheduledAction(tick, action, args)
+        self._async_add_actions(tick, [handle], max(tick.run_at, when))
+        return handle
+
+    @callback
+    def _async_add_actions(
+        self, tick: _Tick, actions: list[ScheduledAction], run_at: float
+    ) -> None:
+        """Add actions to a tick and schedule it to run at run_at."""
+        tick.actions.extend(actions)
+        tick.pending += len(actions)
+        if tick.timer is not None and run_at == tick.run_at:
+            return
+        if tick.timer is not None:
+            tick.timer.cancel()
+        tick.run_at = run_at
+        tick.timer = self.hass.loop.call_at(run_at, self._async_run_tick, tick)
+
+    @callback
+    def async_remove_tick(self, tick: _Tick) -> None:
+        """Remove a tick that has no actions left to run."""
+        if tick.timer is not None:
+            tick.timer.cancel()
+        self._ticks.remove(tick)
+
+    @callback
+    def _async_run_tick(self, tick: _Tick) -> None:
+        """Run the actions of a tick until the budget is used up."""
+        self._ticks.remove(tick)
+        self.ticks += 1
+        actions = [action for action in tick.actions if not action.done]
+        start = time.perf_counter()
+        for idx, handle in enumerate(actions):
+            if idx and time.perf_counter() - start > self._budget:
+                remaining = actions[idx:]
+                self.deferred_actions += len(remaining)
+                _LOGGER.debug(
+                    "Rate limited actions exceeded the tick budget of %ss,"
+                    " deferring %s actions",
+                    self._budget,
+                    len(remaining),
+                )
+                when = self.hass.loop.time() + self._tick
+                next_tick = _Tick(self, when)
+                self._ticks.append(next_tick)
+                for action in remaining:
+                    action._tick = next_tick  # noqa: SLF001
+                self._async_add_actions(next_tick, remaining, when)
+                return
+            self.actions += 1
+            handle.run()
+
 
 class KeyedRateLimit:
     """Class to track rate limits."""
@@ -18,11 +160,18 @@ class KeyedRateLimit:
     def __init__(
         self,
         hass: HomeAssistant,
+        scheduler: RateLimitScheduler | None = None,
     ) -> None:
-        """Initialize ratelimit tracker."""
+        """Initialize ratelimit tracker.
+
+        When a scheduler is passed, deferred actions run in its shared ticks.
+        """
         self.hass = hass
+        self._scheduler = scheduler
         self._last_triggered: dict[Hashable, float] = {}
-        self._rate_limit_timers: dict[Hashable, asyncio.TimerHandle] = {}
+        self._rate_limit_timers: dict[
+            Hashable, asyncio.TimerHandle | ScheduledAction
+        ] = {}
 
     @callback
     def async_has_timer(self, key: Hashable) -> bool:
@@ -89,7 +238,14 @@ class KeyedRateLimit:
             next_call_time,
         )
 
-        if key not in self._rate_limit_timers:
+        if key in self._rate_limit_timers:
+            return next_call_time
+
+        if self._scheduler is not None:
+            self._rate_limit_timers[key] = self._scheduler.async_call_later(
+                next_call_time - now, action, *args
+            )
+        else:
             self._rate_limit_timers[key] = self.hass.loop.call_later(
                 next_call_time - now,
                 action,
@@ -6,7 +6,10 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from difflib import SequenceMatcher
+from functools import partial
 import inspect
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
@@ -33,6 +36,7 @@ from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, json as json_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -48,6 +52,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# A journal is compacted into a new snapshot after this many records,
+# or when it grows larger than the snapshot.
+JOURNAL_MAX_RECORDS = 1000
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -226,6 +235,284 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+def _json_equal(old: Any, new: Any) -> bool:
+    """Return if two JSON values are equal.
+
+    Python considers 1, 1.0 and True equal, their JSON is not.
+    """
+    return bool(
+        old == new and json_helper.json_bytes(old) == json_helper.json_bytes(new)
+    )
+
+
+def _journal_diff(
+    old: Any, new: Any, path: list[str | int], ops: list[dict[str, Any]]
+) -> None:
+    """Append the journal operations which turn old into new to ops."""
+    if _json_equal(old, new):
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        # Added keys are appended on replay, replace the whole dict
+        # if that would not result in the same order of the keys
+        kept = [key for key in old if key in new]
+        if list(new)[: len(kept)] == kept:
+            for key, value in new.items():
+                if key in old:
+                    _journal_diff(old[key], value, [*path, key], ops)
+                else:
+                    ops.append({"op": "set", "path": [*path, key], "value": value})
+            ops.extend(
+                {"op": "del", "path": [*path, key]} for key in old if key not in new
+            )
+            return
+    elif isinstance(old, list) and isinstance(new, list):
+        old_len = len(old)
+        new_len = len(new)
+        shortest = min(old_len, new_len)
+        start = 0
+        while start < shortest and _json_equal(old[start], new[start]):
+            start += 1
+        end = 0
+        while end < shortest - start and _json_equal(
+            old[old_len - end - 1], new[new_len - end - 1]
+        ):
+            end += 1
+        # Match the items in between to find the inserted and removed items.
+        # The changes are emitted from the end, so the indices of the
+        # changes before them are not shifted.
+        json_bytes = json_helper.json_bytes
+        matcher = SequenceMatcher(
+            None,
+            [json_bytes(item) for item in old[start : old_len - end]],
+            [json_bytes(item) for item in new[start : new_len - end]],
+            autojunk=False,
+        )
+        for tag, old_start, old_end, new_start, new_end in reversed(
+            matcher.get_opcodes()
+        ):
+            if tag == "equal":
+                continue
+            if tag == "replace" and old_end - old_start == new_end - new_start:
+                for offset in range(old_end - old_start):
+                    index = start + old_start + offset
+                    _journal_diff(
+                        old[index],
+                        new[start + new_start + offset],
+                        [*path, index],
+                        ops,
+                    )
+                continue
+            ops.append(
+                {
+                    "op": "splice",
+                    "path": path,
+                    "start": start + old_start,
+                    "delete": old_end - old_start,
+                    "insert": new[start + new_start : start + new_end],
+                }
+            )
+        return
+    ops.append({"op": "set", "path": path, "value": new})
+
+
+def _journal_apply(data: Any, ops: list[dict[str, Any]]) -> Any:
+    """Apply journal operations to data and return the result."""
+    for op in ops:
+        path = op["path"]
+        if op["op"] == "splice":
+            target = data
+            for key in path:
+                target = target[key]
+            start = op["start"]
+            target[start : start + op["delete"]] = op["insert"]
+            continue
+        if not path:
+            data = op["value"]
+            continue
+        parent = data
+        for key in path[:-1]:
+            parent = parent[key]
+        if op["op"] == "set":
+            parent[path[-1]] = op["value"]
+        else:
+            del parent[path[-1]]
+    return data
+
+
+class _StoreJournal:
+    """Write-ahead journal of a store.
+
+    The storage file holds a snapshot, the journal next to it holds one JSON
+    line per save with the operations to apply to the snapshot data. Each
+    snapshot gets a new generation, journal records of another generation are
+    left over from before the last snapshot and are ignored on load.
+    """
+
+    def __init__(self, key: str, path: str, private: bool) -> None:
+        """Initialize the journal."""
+        self.key = key
+        self.path = f"{path}{JOURNAL_SUFFIX}"
+        self._private = private
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the written data, the next write will be a snapshot."""
+        self.generation: str | None = None
+        self.envelope: tuple[int, int] | None = None
+        self.data: Any = None
+        self.records = 0
+        self.size = 0
+        self.snapshot_size = 0
+
+    def replay(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the journal records of the snapshot generation to data."""
+        try:
+            with open(self.path, "rb") as file:
+                lines = file.read().splitlines()
+        except FileNotFoundError:
+            return data
+        generation = data.get("journal_generation")
+        stored = data["data"]
+        replayed = 0
+        for line in lines:
+            try:
+                record = json_util.json_loads_object(line)
+            except ValueError:
+                # A crash while appending leaves an incomplete last record
+                _LOGGER.warning("Ignoring incomplete journal record for %s", self.key)
+                break
+            if record.get("generation") != generation:
+                continue
+            try:
+                stored = _journal_apply(stored, record["ops"])  # type: ignore[arg-type]
+            except (KeyError, IndexError, TypeError) as err:
+                _LOGGER.error(
+                    "Error replaying journal for %s, ignoring the remaining "
+                    "records: %s",
+                    self.key,
+                    err,
+                )
+                break
+            replayed += 1
+        _LOGGER.debug("Replayed %s journal records for %s", replayed, self.key)
+        data["data"] = stored
+        return data
+
+    def write(
+        self,
+        path: str,
+        data: dict[str, Any],
+        encoder: type[JSONEncoder] | None,
+        atomic_writes: bool,
+    ) -> None:
+        """Write the data as a journal record or as a new snapshot."""
+        dump: Callable[[Any], str]
+        if encoder and encoder is not JSONEncoder:
+            dump = partial(json.dumps, cls=encoder)
+        else:
+            dump = json_helper.json_dumps
+        try:
+            serialized = dump(data["data"])
+        except TypeError as err:
+            formatted_data = json_util.format_unserializable_data(
+                json_helper.find_paths_unserializable_data(data["data"], dump=dump)
+            )
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {path}. Bad data at {formatted_data}"
+            ) from err
+        new = json_util.json_loads(serialized)
+        envelope = (data["version"], data["minor_version"])
+        if self.generation is not None and envelope == self.envelope:
+            ops: list[dict[str, Any]] = []
+            _journal_diff(self.data, new, [], ops)
+            if not ops:
+                _LOGGER.debug("Skipping unchanged data for %s", self.key)
+                return
+            record = json_helper.json_bytes({"generation": self.generation, "ops": ops})
+            if (
+                self.records < JOURNAL_MAX_RECORDS
+                and self.size + len(record) < self.snapshot_size
+            ):
+                self._append(record, atomic_writes)
+                self.data = new
+                return
+
+        self._write_snapshot(
+            path, envelope, new, len(serialized), encoder, atomic_writes
+        )
+
+    def compact(
+        self, path: str, encoder: type[JSONEncoder] | None, atomic_writes: bool
+    ) -> None:
+        """Fold the journal records into a new snapshot."""
+        if not self.records or self.envelope is None:
+            return
+        self._write_snapshot(
+            path,
+            self.envelope,
+            self.data,
+            len(json_helper.json_bytes(self.data)),
+            encoder,
+            atomic_writes,
+        )
+
+    def _write_snapshot(
+        self,
+        path: str,
+        envelope: tuple[int, int],
+        new: Any,
+        size: int,
+        encoder: type[JSONEncoder] | None,
+        atomic_writes: bool,
+    ) -> None:
+        """Write the data as a snapshot of a new generation."""
+        generation = ulid_now()
+        _LOGGER.debug("Writing snapshot for %s to %s", self.key, path)
+        json_helper.save_json(
+            path,
+            {
+                "version": envelope[0],
+                "minor_version": envelope[1],
+                "key": self.key,
+                "journal_generation": generation,
+                "data": new,
+            },
+            self._private,
+            encoder=encoder,
+            atomic_writes=atomic_writes,
+        )
+        with suppress(FileNotFoundError):
+            os.unlink(self.path)
+        self.generation = generation
+        self.envelope = envelope
+        self.data = new
+        self.records = 0
+        self.size = 0
+        self.snapshot_size = size
+
+    def _append(self, record: bytes, atomic_writes: bool) -> None:
+        """Append a record to the journal."""
+        _LOGGER.debug("Appending journal record for %s to %s", self.key, self.path)
+        try:
+            fd = os.open(
+                self.path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fd, record + b"\n")
+                if atomic_writes:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as err:
+            # Start over with a new snapshot at the next write
+            self.reset()
+            raise WriteError(err) from err
+        self.records += 1
+        self.size += len(record) + 1
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -241,8 +528,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With journal, saves are appended as deltas to a journal which is
+        compacted into the storage file from time to time.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,6 +550,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = _StoreJournal(key, self.path, private) if journal else None
 
     @cached_property
     def path(self):
@@ -387,6 +680,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        # Only snapshots written by the journal have journal records
+        if self._journal and "journal_generation" in data:
+            data = await self.hass.async_add_executor_job(self._journal.replay, data)
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -518,6 +815,25 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
         await self._async_handle_write_data()
+        if self._journal:
+            await self._async_compact_journal(self._journal)
+
+    async def _async_compact_journal(self, journal: _StoreJournal) -> None:
+        """Fold the journal into the storage file.
+
+        Tools that read the storage file without replaying the journal,
+        like backups or an older version, then see the full data.
+        """
+        async with self._write_lock:
+            self._async_cleanup_final_write_listener()
+            if self._read_only:
+                return
+            try:
+                await self.hass.async_add_executor_job(
+                    journal.compact, self.path, self._encoder, self._atomic_writes
+                )
+            except (json_util.SerializationError, WriteError) as err:
+                _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
@@ -541,6 +857,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal and self._journal.records:
+                # Write a snapshot of the journal when Home Assistant stops
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -551,6 +871,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            self._journal.write(path, data, self._encoder, self._atomic_writes)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -572,3 +896,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal:
+            self._journal.reset()
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self._journal.path)
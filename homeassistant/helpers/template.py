@@ -7,15 +7,18 @@ import asyncio
 import base64
 import collections.abc
 from collections.abc import Callable, Generator, Iterable
-from contextlib import AbstractContextManager
+from contextlib import AbstractContextManager, suppress
 from contextvars import ContextVar
-from copy import deepcopy
+from copy import copy, deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
+import os
 import pathlib
 import random
 import re
@@ -34,7 +37,6 @@ from typing import (
     overload,
 )
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
@@ -53,14 +55,17 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -78,6 +83,7 @@ from homeassistant.util import (
     slugify as slugify_util,
 )
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
@@ -94,8 +100,9 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import STORAGE_DIR
 from .translation import async_translate_state
-from .typing import TemplateVarsType
+from .typing import UNDEFINED, TemplateVarsType
 
 if TYPE_CHECKING:
     from _typeshed import OptExcInfo
@@ -171,6 +178,19 @@ CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+COMPILED_TEMPLATE_CACHE_FILE = "core.template_cache"
+# Compiled code can only be loaded by the Python and Jinja versions that wrote it,
+# and by the Home Assistant version that set up the template environment for it
+_COMPILED_TEMPLATE_CACHE_HEADER = b"%s%s %s\n" % (
+    MAGIC_NUMBER,
+    jinja2.__version__.encode(),
+    __version__.encode(),
+)
+
+# The template source, if the environment has hass, is limited and is strict
+type _CompiledTemplateKey = tuple[str, bool, bool, bool]
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -194,6 +214,62 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
     return template_state
 
 
+class CompiledTemplateCache:
+    """Cache the compiled code of templates for all template objects."""
+
+    __slots__ = ("_codes", "hits", "misses")
+
+    def __init__(self, size: int) -> None:
+        """Initialize the cache."""
+        self._codes: LRU[_CompiledTemplateKey, CodeType] = LRU(size)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: _CompiledTemplateKey) -> CodeType | None:
+        """Return the compiled code of a template if it is cached."""
+        if (code := self._codes.get(key)) is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return code
+
+    def __setitem__(self, key: _CompiledTemplateKey, code: CodeType) -> None:
+        """Cache the compiled code of a template."""
+        self._codes[key] = code
+
+    def __len__(self) -> int:
+        """Return the number of cached templates."""
+        return len(self._codes)
+
+    def info(self) -> dict[str, Any]:
+        """Return the size and hit rate of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._codes),
+            "max_size": self._codes.get_size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def dumps(self) -> bytes:
+        """Serialize the templates compiled by environments with hass."""
+        return _COMPILED_TEMPLATE_CACHE_HEADER + marshal.dumps(
+            [(key, code) for key, code in self._codes.items() if key[1]]
+        )
+
+    def load(self, entries: list[tuple[_CompiledTemplateKey, CodeType]]) -> None:
+        """Add serialized templates that are not cached yet."""
+        codes = self._codes
+        # Entries are ordered most recently used first
+        for key, code in reversed(entries):
+            if key not in codes:
+                codes[key] = code
+
+
+COMPILED_TEMPLATE_CACHE = CompiledTemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
+
+
 def async_setup(hass: HomeAssistant) -> bool:
     """Set up tracking the template LRUs."""
 
@@ -397,7 +473,9 @@ class RenderInfo:
         "filter_lifecycle",
         "has_time",
         "is_static",
+        "iterated_states",
         "rate_limit",
+        "state_reads",
         "template",
     )
 
@@ -417,6 +495,11 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
+        # The state objects the render read, with the names of the properties
+        # it read from them. None when the render depends on more than states.
+        self.state_reads: dict[str, tuple[State | None, set[str]]] | None = {}
+        # The entity ids of the domains (or all states for None) it iterated
+        self.iterated_states: dict[str | None, list[str]] = {}
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -463,10 +546,52 @@ class RenderInfo:
             raise self.exception
         return cast(str, self._result)
 
+    def collect_state_read(
+        self, entity_id: str, state: State | None, name: str | None
+    ) -> None:
+        """Record that the render read a property of a state object."""
+        if (state_reads := self.state_reads) is None:
+            return
+        if (read := state_reads.get(entity_id)) is None:
+            state_reads[entity_id] = read = (state, set())
+        elif read[0] is not state:
+            # Read from more than one state object, only
+            # the exact same state object will do
+            read[1].add("*")
+        if name is not None:
+            read[1].add(name)
+
+    def state_reads_unchanged(self) -> bool:
+        """Return if a render would read the same values as the last one.
+
+        Renders that only depend on states return the same result when
+        the states they read and the properties they read from them
+        have not changed, so they do not need to be rendered again.
+        """
+        if (state_reads := self.state_reads) is None:
+            return False
+        template = self.template
+        assert template.hass is not None
+        states = template.hass.states
+        for domain, entity_ids in self.iterated_states.items():
+            if states.async_entity_ids(domain) != entity_ids:
+                return False
+        for entity_id, (seen, names) in state_reads.items():
+            if (current := states.get(entity_id)) is seen:
+                continue
+            if current is None or seen is None or "*" in names:
+                return False
+            for name in names:
+                if getattr(current, name) != getattr(seen, name):
+                    return False
+            state_reads[entity_id] = (current, names)
+        return True
+
     def _freeze_static(self) -> None:
         self.is_static = True
         self._freeze_sets()
         self.all_states = False
+        self.state_reads = None
 
     def _freeze_sets(self) -> None:
         self.entities = frozenset(self.entities)
@@ -476,6 +601,9 @@ class RenderInfo:
     def _freeze(self) -> None:
         self._freeze_sets()
 
+        if self.has_time or self.exception:
+            self.state_reads = None
+
         if self.rate_limit is None:
             if self.all_states or self.exception:
                 self.rate_limit = ALL_STATES_RATE_LIMIT
@@ -513,7 +641,10 @@ class Template:
         "_hash_cache",
         "_limited",
         "_log_fn",
+        "_max_render_time",
+        "_render_time",
         "_renders",
+        "_skipped_renders",
         "_strict",
         "hass",
         "is_static",
@@ -550,6 +681,54 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._skipped_renders: int = 0
+        self._render_time: float = 0.0
+        self._max_render_time: float = 0.0
+
+    @property
+    def render_stats(self) -> dict[str, float]:
+        """Return how often the template rendered and the time it took.
+
+        Only renders of tracked templates are timed, the render time
+        is recorded by the scheduler that renders them.
+        """
+        return {
+            "renders": self._renders,
+            "skipped_renders": self._skipped_renders,
+            "render_time": self._render_time,
+            "max_render_time": self._max_render_time,
+        }
+
+    @callback
+    def async_add_render_time(self, render_time: float) -> None:
+        """Add the time a render took to the render stats."""
+        self._render_time += render_time
+        self._max_render_time = max(render_time, self._max_render_time)
+
+    @callback
+    def async_reuse_render_info(self, info: RenderInfo) -> RenderInfo | None:
+        """Return info as render info of this template if a render is not needed.
+
+        The info can come from an earlier render of this template or of an
+        equal one compiled the same way, rendered with the same variables.
+        Returns None when the template must be rendered again.
+        """
+        other = info.template
+        if other is not self and (
+            other != self
+            or bool(other._strict) != bool(self._strict)  # noqa: SLF001
+            or bool(other._limited) != bool(self._limited)  # noqa: SLF001
+            or other._log_fn is not None  # noqa: SLF001
+            or self._log_fn is not None
+        ):
+            return None
+        if not info.state_reads_unchanged():
+            return None
+        self._skipped_renders += 1
+        if other is not self:
+            info = copy(info)
+            info.template = self
+        return info
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -577,7 +756,9 @@ class Template:
         if self.is_static or self._compiled_code is not None:
             return
 
-        if compiled := self._env.template_cache.get(self.template):
+        if compiled := COMPILED_TEMPLATE_CACHE.get(
+            (self.template, *self._env.compile_flags)
+        ):
             self._compiled_code = compiled
             return
 
@@ -790,10 +971,13 @@ class Template:
         error_value: Any = _SENTINEL,
         variables: dict[str, Any] | None = None,
         parse_result: bool = False,
+        value_json: Any = _SENTINEL,
     ) -> Any:
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too. Callers that already
+        parsed the value can pass it as value_json, or UNDEFINED if the
+        value is not valid JSON.
 
         This method must be run in the event loop.
         """
@@ -807,10 +991,13 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        try:  # noqa: SIM105 - suppress is much slower
-            variables["value_json"] = json_loads(value)
-        except JSON_DECODE_EXCEPTIONS:
-            pass
+        if value_json is _SENTINEL:
+            try:  # noqa: SIM105 - suppress is much slower
+                variables["value_json"] = json_loads(value)
+            except JSON_DECODE_EXCEPTIONS:
+                pass
+        elif value_json is not UNDEFINED:
+            variables["value_json"] = value_json
 
         try:
             render_result = _render_with_context(
@@ -922,10 +1109,12 @@ class AllStates:
     def _collect_all(self) -> None:
         if (render_info := _render_info.get()) is not None:
             render_info.all_states = True
+            _collect_iterated_states(self._hass, render_info, None)
 
     def _collect_all_lifecycle(self) -> None:
         if (render_info := _render_info.get()) is not None:
             render_info.all_states_lifecycle = True
+            _collect_iterated_states(self._hass, render_info, None)
 
     def __iter__(self) -> Generator[TemplateState]:
         """Return all states."""
@@ -967,6 +1156,7 @@ class StateTranslated:
 
     def __call__(self, entity_id: str) -> str | None:
         """Retrieve translated state if available."""
+        _collect_untracked()
         state = _get_state_if_valid(self._hass, entity_id)
 
         if state is None:
@@ -1012,10 +1202,12 @@ class DomainStates:
     def _collect_domain(self) -> None:
         if (entity_collect := _render_info.get()) is not None:
             entity_collect.domains.add(self._domain)  # type: ignore[attr-defined]
+            _collect_iterated_states(self._hass, entity_collect, self._domain)
 
     def _collect_domain_lifecycle(self) -> None:
         if (entity_collect := _render_info.get()) is not None:
             entity_collect.domains_lifecycle.add(self._domain)  # type: ignore[attr-defined]
+            _collect_iterated_states(self._hass, entity_collect, self._domain)
 
     def __iter__(self) -> Generator[TemplateState]:
         """Return the iteration over all the states."""
@@ -1051,9 +1243,13 @@ class TemplateStateBase(State):
         self._entity_id = entity_id
         self._cache: dict[str, Any] = {}
 
-    def _collect_state(self) -> None:
-        if self._collect and (render_info := _render_info.get()):
+    def _collect_state(self, name: str) -> None:
+        if (render_info := _render_info.get()) is None:
+            return
+        if self._collect:
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+        if render_info.state_reads is not None:
+            render_info.collect_state_read(self._entity_id, self._state, name)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
@@ -1061,8 +1257,11 @@ class TemplateStateBase(State):
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            if render_info := _render_info.get():
+                if self._collect:
+                    render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                if render_info.state_reads is not None:
+                    render_info.collect_state_read(self._entity_id, self._state, item)
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1081,55 +1280,57 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state("state")
         return self._state.state
 
     @property
     def attributes(self) -> ReadOnlyDict[str, Any]:  # type: ignore[override]
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_state("attributes")
         return self._state.attributes
 
     @property
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state("last_changed")
         return self._state.last_changed
 
     @property
     def last_reported(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_reported."""
-        self._collect_state()
+        # last_reported is updated in place without a state_changed event
+        _collect_untracked()
+        self._collect_state("last_reported")
         return self._state.last_reported
 
     @property
     def last_updated(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state("last_updated")
         return self._state.last_updated
 
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_state("context")
         return self._state.context
 
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state("domain")
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state("object_id")
         return self._state.object_id
 
     @property
     def name(self) -> str:  # type: ignore[override]
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state("name")
         return self._state.name
 
     @property
@@ -1146,8 +1347,11 @@ class TemplateStateBase(State):
             async_rounded_state,
         )
 
-        self._collect_state()
+        self._collect_state("state")
+        self._collect_state("attributes")
         if rounded and self._state.domain == SENSOR_DOMAIN:
+            # The display precision is stored in the entity registry
+            _collect_untracked()
             state = async_rounded_state(self._hass, self._entity_id, self._state)
         else:
             state = self._state.state
@@ -1157,7 +1361,7 @@ class TemplateStateBase(State):
 
     def __eq__(self, other: object) -> bool:
         """Ensure we collect on equality check."""
-        self._collect_state()
+        self._collect_state("*")
         return self._state.__eq__(other)
 
 
@@ -1174,6 +1378,7 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        self._collect_state("*")
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -1197,6 +1402,7 @@ class TemplateStateFromEntityId(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        self._collect_state("*")
         return f"<template TemplateStateFromEntityId({self._entity_id})>"
 
 
@@ -1208,6 +1414,22 @@ def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
         entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
 
 
+def _collect_iterated_states(
+    hass: HomeAssistant, render_info: RenderInfo, domain: str | None
+) -> None:
+    """Record the entity ids of the states of a domain, or all states."""
+    if render_info.state_reads is not None and domain not in (
+        iterated_states := render_info.iterated_states
+    ):
+        iterated_states[domain] = hass.states.async_entity_ids(domain)
+
+
+def _collect_untracked() -> None:
+    """Record that the render depends on more than the states it read."""
+    if (render_info := _render_info.get()) is not None:
+        render_info.state_reads = None
+
+
 def _state_generator(
     hass: HomeAssistant, domain: str | None
 ) -> Generator[TemplateState]:
@@ -1244,6 +1466,8 @@ def _get_state(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
 def _get_template_state_from_state(
     hass: HomeAssistant, entity_id: str, state: State | None
 ) -> TemplateState | None:
+    if (render_info := _render_info.get()) is not None:
+        render_info.collect_state_read(entity_id, state, None)
     if state is None:
         # Only need to collect if none, if not none collect first actual
         # access to the state properties in the state wrapper.
@@ -2606,6 +2830,7 @@ def random_every_time(context, values):
     Unlike Jinja's random filter,
     this is context-dependent to avoid caching the chosen value.
     """
+    _collect_untracked()
     return random.choice(values)
 
 
@@ -2808,6 +3033,53 @@ def make_logging_undefined(
     return LoggingUndefined
 
 
+async def async_load_compiled_templates(hass: HomeAssistant) -> None:
+    """Load the templates compiled by the last run and save them on shutdown.
+
+    This avoids compiling all the templates of the configuration again
+    at startup.
+    """
+    path = hass.config.path(STORAGE_DIR, COMPILED_TEMPLATE_CACHE_FILE)
+    COMPILED_TEMPLATE_CACHE.load(
+        await hass.async_add_executor_job(_read_compiled_templates, path)
+    )
+
+    async def _async_save_compiled_templates(_: Event) -> None:
+        with suppress(WriteError):
+            await hass.async_add_executor_job(
+                _write_compiled_templates, path, COMPILED_TEMPLATE_CACHE.dumps()
+            )
+
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save_compiled_templates
+    )
+
+
+def _write_compiled_templates(path: str, data: bytes) -> None:
+    """Write the compiled templates."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_utf8_file(path, data, private=True, mode="wb")
+
+
+def _read_compiled_templates(
+    path: str,
+) -> list[tuple[_CompiledTemplateKey, CodeType]]:
+    """Read the compiled templates if they were written by this version."""
+    try:
+        data = pathlib.Path(path).read_bytes()
+    except FileNotFoundError:
+        return []
+    if not data.startswith(_COMPILED_TEMPLATE_CACHE_HEADER):
+        _LOGGER.debug("Ignoring templates compiled by another version")
+        return []
+    try:
+        entries = marshal.loads(data[len(_COMPILED_TEMPLATE_CACHE_HEADER) :])
+    except (EOFError, ValueError, TypeError) as err:
+        _LOGGER.warning("Unable to load compiled templates: %s", err)
+        return []
+    return cast(list[tuple[_CompiledTemplateKey, CodeType]], entries)
+
+
 async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
@@ -2862,6 +3134,17 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+# Functions that only read states through the template state wrappers,
+# all other functions that depend on hass read more than states
+_STATE_FUNCTIONS: set[Callable[..., Any]] = {
+    expand,
+    has_value,
+    is_state,
+    is_state_attr,
+    state_attr,
+}
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2875,9 +3158,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | None
-        ] = weakref.WeakValueDictionary()
+        # The log function does not change the compiled code
+        self.compile_flags = (hass is not None, bool(limited), bool(strict))
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2993,9 +3275,18 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         ) -> Callable[Concatenate[Any, _P], _R]:
             """Wrap function that depend on hass."""
 
-            @wraps(func)
-            def wrapper(_: Any, *args: _P.args, **kwargs: _P.kwargs) -> _R:
-                return func(hass, *args, **kwargs)
+            if func in _STATE_FUNCTIONS:
+
+                @wraps(func)
+                def wrapper(_: Any, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+                    return func(hass, *args, **kwargs)
+
+            else:
+
+                @wraps(func)
+                def wrapper(_: Any, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+                    _collect_untracked()
+                    return func(hass, *args, **kwargs)
 
             return jinja_context(wrapper)
 
@@ -3231,7 +3522,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             )
 
         compiled = super().compile(source)
-        self.template_cache[source] = compiled
+        if isinstance(source, str):
+            COMPILED_TEMPLATE_CACHE[(source, *self.compile_flags)] = compiled
         return compiled
 
 
@@ -133,6 +133,7 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_IMPORT_TIMES: HassKey[dict[str, dict[str, float]]] = HassKey("import_times")
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -271,6 +272,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMES] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -645,6 +647,28 @@ def async_register_preload_platform(hass: HomeAssistant, platform_name: str) ->
         preload_platforms.append(platform_name)
 
 
+@callback
+def async_register_lazy_platform(hass: HomeAssistant, platform_name: str) -> None:
+    """Register a platform that is only imported when it is first used.
+
+    The platform is no longer preloaded when an integration is loaded.
+    """
+    preload_platforms = hass.data[DATA_PRELOAD_PLATFORMS]
+    if platform_name in preload_platforms:
+        preload_platforms.remove(platform_name)
+
+
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, dict[str, float]]:
+    """Return the time it took to import the modules of each integration.
+
+    Modules are keyed by their name in the integration package, the
+    package itself is keyed as __init__. An import includes the time
+    it took to import the modules it imported that were not loaded yet.
+    """
+    return hass.data[DATA_IMPORT_TIMES]
+
+
 class Integration:
     """An integration in Home Assistant."""
 
@@ -1072,7 +1096,7 @@ class Integration:
         domain = self.domain
         try:
             cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
+                ComponentProtocol, self._import_module_timed("__init__", self.pkg_path)
             )
         except ImportError:
             raise
@@ -1269,7 +1293,12 @@ class Integration:
         full_name = f"{self.domain}.{platform_name}"
         cache = self.hass.data[DATA_COMPONENTS]
         try:
-            cache[full_name] = self._import_platform(platform_name)
+            if f"{self.pkg_path}.{platform_name}" in sys.modules:
+                cache[full_name] = self._import_platform(platform_name)
+            else:
+                start = time.perf_counter()
+                cache[full_name] = self._import_platform(platform_name)
+                self._record_import_time(platform_name, time.perf_counter() - start)
         except ModuleNotFoundError:
             if self.domain in cache:
                 # If the domain is loaded, cache that the platform
@@ -1295,6 +1324,23 @@ class Integration:
 
         return cast(ModuleType, cache[full_name])
 
+    def _import_module_timed(self, name: str, module_name: str) -> ModuleType:
+        """Import a module of the integration and record the time it took."""
+        if module_name in sys.modules:
+            return importlib.import_module(module_name)
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        self._record_import_time(name, time.perf_counter() - start)
+        return module
+
+    def _record_import_time(self, name: str, seconds: float) -> None:
+        """Record the time it took to import a module of the integration.
+
+        This method must be thread-safe as it's called from the executor
+        and the event loop.
+        """
+        self.hass.data[DATA_IMPORT_TIMES].setdefault(self.domain, {})[name] = seconds
+
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform.
 
@@ -55,6 +55,8 @@ class RuntimeConfig:
 
     safe_mode: bool = False
 
+    lazy_platforms: bool = False
+
 
 class HassEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
     """Event loop policy for Home Assistant."""
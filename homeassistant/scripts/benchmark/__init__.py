@@ -6,10 +6,16 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import datetime, timedelta
+import itertools
+import json
 import logging
+from pathlib import Path
 from timeit import default_timer as timer
+from types import MappingProxyType
 
 from homeassistant import core
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
@@ -17,6 +23,9 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.util import dt as dt_util
+
+from .scenarios import DEFAULT_ENTITY_COUNT, SCENARIOS, compare_results, run_suite
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -30,17 +39,81 @@ def run(args):
     logging.getLogger("homeassistant.core").setLevel(logging.CRITICAL)
 
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
-    parser.add_argument("name", choices=BENCHMARKS)
+    parser.add_argument(
+        "name",
+        nargs="?",
+        choices=[*BENCHMARKS, *SCENARIOS, "suite"],
+        help="Benchmark or scenario to run, suite runs all scenarios",
+    )
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--entities",
+        type=int,
+        default=DEFAULT_ENTITY_COUNT,
+        help="Number of entities in the instance the scenarios run against",
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="Untimed iterations per scenario"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed iterations per scenario"
+    )
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        type=Path,
+        metavar=("BASELINE", "CURRENT"),
+        help="Compare two result files and flag regressions",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative change that counts as a regression when comparing",
+    )
 
     args = parser.parse_args()
 
-    bench = BENCHMARKS[args.name]
-    print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
+    if args.compare:
+        return run_compare(*args.compare, args.threshold)
+
+    if args.name is None:
+        parser.error("a benchmark or scenario name is required")
+
+    if args.name in BENCHMARKS:
+        bench = BENCHMARKS[args.name]
+        print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
+
+        with suppress(KeyboardInterrupt):
+            while True:
+                asyncio.run(run_benchmark(bench))
+        return 0
 
-    with suppress(KeyboardInterrupt):
-        while True:
-            asyncio.run(run_benchmark(bench))
+    names = list(SCENARIOS) if args.name == "suite" else [args.name]
+    results = run_suite(names, args.entities, args.warmup, args.repeat)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output, encoding="utf-8")
+    print(output)
+    return 0
+
+
+def run_compare(baseline: Path, current: Path, threshold: float) -> int:
+    """Compare two suite results and return 1 if any scenario regressed."""
+    comparison = compare_results(
+        json.loads(baseline.read_text(encoding="utf-8")),
+        json.loads(current.read_text(encoding="utf-8")),
+        threshold,
+    )
+    for result in comparison:
+        print(
+            f"{result['scenario']:<25} "
+            f"ops/s {result['ops_per_sec_change']:+.1%} "
+            f"p99 {result['p99_change']:+.1%}"
+            f"{'  REGRESSION' if result['regression'] else ''}"
+        )
+    return 1 if any(result["regression"] for result in comparison) else 0
 
 
 async def run_benchmark(bench):
@@ -308,3 +381,164 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+def _reference_time_weighted_average(
+    fstates: list[tuple[float, core.State]], start: datetime, end: datetime
+) -> tuple[float, float, float]:
+    """Calculate mean, min and max one state at a time with datetimes."""
+    old_fstate: float | None = None
+    old_start_time: datetime | None = None
+    accumulated = 0.0
+    for fstate, state in fstates:
+        start_time = max(state.last_updated, start)
+        if old_start_time is None:
+            start = start_time
+        else:
+            assert old_fstate is not None
+            accumulated += old_fstate * (start_time - old_start_time).total_seconds()
+        old_fstate = fstate
+        old_start_time = start_time
+    assert old_fstate is not None and old_start_time is not None
+    accumulated += old_fstate * (end - old_start_time).total_seconds()
+    period_seconds = (end - start).total_seconds()
+    mean = accumulated / period_seconds if period_seconds else 0.0
+    values = [fstate for fstate, _ in fstates]
+    return mean, min(values), max(values)
+
+
+@benchmark
+async def sensor_statistics_mean(hass: core.HomeAssistant) -> float:
+    """Calculate 5-minute mean, min and max of 3000 sensors a hundred times.
+
+    Every sensor changes every 10 seconds. The results are checked against
+    a calculation that processes one state at a time with datetimes.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor.recorder import _time_weighted_average
+
+    sensors = 3000
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    end = start + timedelta(minutes=5)
+    histories = [
+        [
+            (
+                float((idx + change) % 50),
+                core.State(
+                    f"sensor.sensor_{idx}",
+                    str((idx + change) % 50),
+                    last_updated=start + timedelta(seconds=10 * change + idx % 10),
+                ),
+            )
+            for change in range(-1, 30)
+        ]
+        for idx in range(sensors)
+    ]
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+
+    def calculate(fstates: list[tuple[float, core.State]]) -> tuple[float, ...]:
+        values = [fstate for fstate, _ in fstates]
+        timestamps = [state.last_updated_timestamp for _, state in fstates]
+        mean = _time_weighted_average(timestamps, values, start_ts, end_ts)
+        return mean, min(values), max(values)
+
+    for fstates in histories:
+        # Warm up the cached timestamps like the recorder history does
+        for _, state in fstates:
+            state.last_updated_timestamp  # noqa: B018
+        for result, expected in zip(
+            calculate(fstates),
+            _reference_time_weighted_average(fstates, start, end),
+            strict=True,
+        ):
+            assert abs(result - expected) <= 1e-9 * max(abs(expected), 1)
+
+    reference_start = timer()
+    for fstates in itertools.islice(itertools.cycle(histories), 100 * sensors):
+        _reference_time_weighted_average(fstates, start, end)
+    reference = timer() - reference_start
+
+    start_time = timer()
+    for fstates in itertools.islice(itertools.cycle(histories), 100 * sensors):
+        calculate(fstates)
+    runtime = timer() - start_time
+    print(f"One state at a time with datetimes took {reference}s")
+    return runtime
+
+
+@benchmark
+async def mqtt_message_dispatch(hass: core.HomeAssistant) -> float:
+    """Dispatch MQTT messages on 10k topics to simple and wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.client import Client as MQTTClient, MQTTMessage
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import MQTT
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.models import MqttData
+
+    topic_count = 10_000
+    passes = 10
+    count = 0
+
+    @core.callback
+    def listener(_):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+    entry = ConfigEntry(
+        data={},
+        discovery_keys=MappingProxyType({}),
+        domain="mqtt",
+        minor_version=1,
+        options={},
+        source="user",
+        title="Benchmark",
+        unique_id=None,
+        version=1,
+    )
+    client = MQTT(hass, entry, {})
+    client._mqtt_data = MqttData(client=client, config=[])  # noqa: SLF001
+
+    # Half of the topics have a subscription of their own, like Zigbee2MQTT
+    # devices. The other half are Tasmota devices, every tenth of them has a
+    # wildcard subscription and the rest only match the shared wildcards.
+    topics = [
+        f"zigbee2mqtt/device_{idx}" if idx % 2 else f"tele/tasmota_{idx}/SENSOR"
+        for idx in range(topic_count)
+    ]
+    for topic in topics[1::2]:
+        client.async_subscribe(topic, listener, 0)
+    for idx in range(0, topic_count, 20):
+        client.async_subscribe(f"tele/tasmota_{idx}/+", listener, 0)
+    for topic_filter in (
+        "zigbee2mqtt/+/availability",
+        "zigbee2mqtt/bridge/#",
+        "tasmota/discovery/+/config",
+        "homeassistant/+/+/config",
+        "+/+/LWT",
+    ):
+        client.async_subscribe(topic_filter, listener, 0)
+
+    messages = []
+    for topic in topics:
+        message = MQTTMessage(topic=topic.encode())
+        message.payload = b'{"power": "on"}'
+        messages.append(message)
+    on_message = client._async_mqtt_on_message  # noqa: SLF001
+    # The paho client is not used by the message handler
+    mqttc = MQTTClient()
+
+    start = timer()
+
+    for _ in range(passes):
+        for message in messages:
+            on_message(mqttc, None, message)
+
+    runtime = timer() - start
+    assert count == passes * (topic_count // 2 + topic_count // 20)
+    client.cleanup()
+    return runtime
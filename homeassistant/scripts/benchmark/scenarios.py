@@ -0,0 +1,490 @@
+"""Scenario based benchmarks that run against a realistic Home Assistant."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+import logging
+import tempfile
+from timeit import default_timer as timer
+from typing import Any
+
+from homeassistant import bootstrap, config_entries, core, loader
+from homeassistant.auth import models as auth_models, permissions as perm_mdl
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.websocket_api import (
+    async_register_command,
+    commands as websocket_commands,
+    connection as websocket_connection,
+)
+from homeassistant.components.websocket_api.http import WebSocketAdapter
+from homeassistant.const import __version__
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity_registry as er,
+    recorder as recorder_helper,
+)
+from homeassistant.helpers.template import Template
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+# mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_ENTITY_COUNT = 10_000
+
+AUTOMATION_COUNT = 100
+HISTORY_QUERIES = 10
+HISTORY_ENTITIES_PER_QUERY = 100
+WEBSOCKET_SUBSCRIBERS = 50
+WEBSOCKET_STATE_CHANGES = 1_000
+AUTOMATION_FIRED_EVENT = "benchmark_automation_fired"
+
+type ScenarioIteration = Callable[[], Awaitable[int]]
+type ScenarioFactory = Callable[[core.HomeAssistant, int], Awaitable[ScenarioIteration]]
+
+
+@dataclass(slots=True, frozen=True)
+class Scenario:
+    """Describe a benchmark scenario.
+
+    The factory prepares the scenario on a populated instance and returns
+    a coroutine function that runs one timed iteration and returns the
+    number of operations it performed.
+    """
+
+    name: str
+    factory: ScenarioFactory
+    config: dict[str, Any] = field(default_factory=dict)
+
+
+SCENARIOS: dict[str, Scenario] = {}
+
+
+def scenario(
+    config: dict[str, Any] | None = None,
+) -> Callable[[ScenarioFactory], ScenarioFactory]:
+    """Decorate to mark a scenario and the integrations it needs."""
+
+    def _decorator(func: ScenarioFactory) -> ScenarioFactory:
+        SCENARIOS[func.__name__] = Scenario(func.__name__, func, config or {})
+        return func
+
+    return _decorator
+
+
+def _recorder_config(config_dir: str) -> dict[str, Any]:
+    """Return a recorder config that writes to a database in the config dir."""
+    return {"db_url": f"sqlite:///{config_dir}/benchmark.db", "commit_interval": 1}
+
+
+def _entity_ids(entity_count: int) -> list[str]:
+    """Return entity ids spread over the domains of a typical install."""
+    domains = ("sensor", "binary_sensor", "light", "switch", "sensor")
+    return [
+        f"{domains[idx % len(domains)]}.benchmark_{idx}" for idx in range(entity_count)
+    ]
+
+
+def _state_for(entity_id: str, value: int) -> tuple[str, dict[str, Any]]:
+    """Return a realistic state and attributes for an entity."""
+    domain = entity_id.partition(".")[0]
+    name = {"friendly_name": entity_id.partition(".")[2].replace("_", " ").title()}
+    if domain == "sensor":
+        return str(value % 1000 / 10), {
+            **name,
+            "unit_of_measurement": "W",
+            "device_class": "power",
+            "state_class": "measurement",
+        }
+    if domain == "light":
+        return ("on", {**name, "brightness": value % 256, "color_mode": "brightness"})
+    return ("on" if value % 2 else "off"), name
+
+
+@core.callback
+def async_populate_states(
+    hass: core.HomeAssistant, entity_ids: list[str], value: int = 0
+) -> None:
+    """Write a state for every entity."""
+    async_set = hass.states.async_set
+    for idx, entity_id in enumerate(entity_ids):
+        state, attributes = _state_for(entity_id, idx + value)
+        async_set(entity_id, state, attributes)
+
+
+@asynccontextmanager
+async def async_benchmark_hass(
+    entity_count: int, config: dict[str, Any]
+) -> AsyncIterator[core.HomeAssistant]:
+    """Create a started instance with the given integrations and entities."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = core.HomeAssistant(config_dir)
+        loader.async_setup(hass)
+        hass.config.skip_pip = True
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        assert await async_setup_component(hass, core.DOMAIN, {})
+        if "recorder" in config:
+            recorder_helper.async_initialize_recorder(hass)
+        for domain, domain_config in config.items():
+            if domain == "recorder":
+                domain_config = {**_recorder_config(config_dir), **domain_config}
+            if not await async_setup_component(hass, domain, {domain: domain_config}):
+                raise RuntimeError(f"Unable to set up {domain} for the benchmark")
+        async_populate_states(hass, _entity_ids(entity_count))
+        await hass.async_start()
+        if "recorder" in config:
+            instance = get_instance(hass)
+            await instance.async_recorder_ready.wait()
+            await instance.async_block_till_done()
+        try:
+            yield hass
+        finally:
+            await hass.async_stop()
+
+
+@scenario()
+async def startup(hass: core.HomeAssistant, entity_count: int) -> ScenarioIteration:
+    """Start and stop an instance with the recorder, automations and templates."""
+    config = {
+        "recorder": {},
+        "automation": _automation_config(AUTOMATION_COUNT),
+        "template": _template_entities_config(),
+    }
+
+    async def _iteration() -> int:
+        async with async_benchmark_hass(entity_count, config) as started:
+            await started.async_block_till_done()
+        return 1
+
+    return _iteration
+
+
+@scenario({"recorder": {}})
+async def recorder_writes(
+    hass: core.HomeAssistant, entity_count: int
+) -> ScenarioIteration:
+    """Write a state change for every entity and wait for the recorder."""
+    entity_ids = _entity_ids(entity_count)
+    instance = get_instance(hass)
+    value = 0
+
+    async def _iteration() -> int:
+        nonlocal value
+        value += 1
+        async_populate_states(hass, entity_ids, value)
+        await hass.async_block_till_done()
+        await instance.async_block_till_done()
+        return len(entity_ids)
+
+    return _iteration
+
+
+@scenario({"recorder": {}})
+async def history_queries(
+    hass: core.HomeAssistant, entity_count: int
+) -> ScenarioIteration:
+    """Query the history of a hundred entities at a time."""
+    entity_ids = _entity_ids(entity_count)
+    instance = get_instance(hass)
+    start_time = dt_util.utcnow() - timedelta(hours=1)
+    # Record a few changes per entity so there is history to query
+    for value in range(1, 4):
+        async_populate_states(hass, entity_ids, value)
+        await hass.async_block_till_done()
+    await instance.async_block_till_done()
+    queries = [
+        entity_ids[offset : offset + HISTORY_ENTITIES_PER_QUERY]
+        for offset in range(
+            0,
+            min(entity_count, HISTORY_QUERIES * HISTORY_ENTITIES_PER_QUERY),
+            HISTORY_ENTITIES_PER_QUERY,
+        )
+    ]
+
+    async def _iteration() -> int:
+        for query_entity_ids in queries:
+            await instance.async_add_executor_job(
+                history.get_significant_states,
+                hass,
+                start_time,
+                None,
+                query_entity_ids,
+            )
+        return len(queries)
+
+    return _iteration
+
+
+def _template_entities_config() -> list[dict[str, Any]]:
+    """Return template entities that iterate and read states."""
+    return [
+        {
+            "sensor": [
+                {
+                    "name": "benchmark_power_total",
+                    "state": "{{ states.sensor | map(attribute='state') "
+                    "| map('float', 0) | sum }}",
+                },
+                {
+                    "name": "benchmark_lights_on",
+                    "state": "{{ states.light | selectattr('state', 'eq', 'on') "
+                    "| list | count }}",
+                },
+            ]
+        }
+    ]
+
+
+BENCHMARK_TEMPLATES = (
+    "{{ states('sensor.benchmark_0') | float(0) * 2 }}",
+    "{{ is_state('light.benchmark_2', 'on') and state_attr('light.benchmark_2', "
+    "'brightness') }}",
+    "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}",
+    "{{ states.sensor | map(attribute='state') | map('float', 0) | sum }}",
+    "{{ states | selectattr('attributes.device_class', 'eq', 'power') "
+    "| map(attribute='entity_id') | list | length }}",
+    "{% for state in states.switch %}{{ state.name }}{% endfor %}",
+)
+
+
+@scenario()
+async def template_render(
+    hass: core.HomeAssistant, entity_count: int
+) -> ScenarioIteration:
+    """Re-render templates that read single entities and iterate states."""
+    templates = [Template(source, hass) for source in BENCHMARK_TEMPLATES]
+
+    async def _iteration() -> int:
+        for template in templates:
+            template.async_render_to_info()
+        return len(templates)
+
+    return _iteration
+
+
+def _automation_config(automation_count: int) -> list[dict[str, Any]]:
+    """Return state triggered automations that fire an event."""
+    return [
+        {
+            "id": f"benchmark_{idx}",
+            "triggers": {
+                "trigger": "state",
+                "entity_id": f"switch.benchmark_trigger_{idx}",
+                "to": "on",
+            },
+            "conditions": {
+                "condition": "template",
+                "value_template": "{{ trigger.to_state.state == 'on' }}",
+            },
+            "actions": {"event": AUTOMATION_FIRED_EVENT},
+        }
+        for idx in range(automation_count)
+    ]
+
+
+@scenario({"automation": _automation_config(AUTOMATION_COUNT)})
+async def automation_triggering(
+    hass: core.HomeAssistant, entity_count: int
+) -> ScenarioIteration:
+    """Trigger every automation once and wait for the actions to finish."""
+    trigger_ids = [f"switch.benchmark_trigger_{idx}" for idx in range(AUTOMATION_COUNT)]
+    fired = 0
+
+    @core.callback
+    def _async_automation_fired(_: core.Event) -> None:
+        nonlocal fired
+        fired += 1
+
+    hass.bus.async_listen(AUTOMATION_FIRED_EVENT, _async_automation_fired)
+
+    async def _iteration() -> int:
+        nonlocal fired
+        fired = 0
+        for entity_id in trigger_ids:
+            hass.states.async_set(entity_id, "off")
+        await hass.async_block_till_done()
+        for entity_id in trigger_ids:
+            hass.states.async_set(entity_id, "on")
+        await hass.async_block_till_done()
+        assert fired == len(trigger_ids)
+        return fired
+
+    return _iteration
+
+
+def _websocket_connection(
+    hass: core.HomeAssistant, send_message: Callable[[Any], None]
+) -> websocket_connection.ActiveConnection:
+    """Return a connection for an owner that is not attached to a socket."""
+    async_register_command(hass, websocket_commands.handle_subscribe_entities)
+    user = auth_models.User(
+        name="Benchmark",
+        perm_lookup=perm_mdl.PermissionLookup(er.async_get(hass), dr.async_get(hass)),
+        is_owner=True,
+    )
+    refresh_token = auth_models.RefreshToken(
+        user=user, client_id=None, access_token_expiration=timedelta(minutes=30)
+    )
+    return websocket_connection.ActiveConnection(
+        WebSocketAdapter(_LOGGER, {"connid": id(user)}),
+        hass,
+        send_message,
+        user,
+        refresh_token,
+    )
+
+
+@scenario()
+async def websocket_subscribe(
+    hass: core.HomeAssistant, entity_count: int
+) -> ScenarioIteration:
+    """Subscribe new connections to all entities like reconnecting dashboards."""
+    sent_bytes = 0
+
+    def _send_message(message: Any) -> None:
+        nonlocal sent_bytes
+        if isinstance(message, bytes):
+            sent_bytes += len(message)
+
+    async def _iteration() -> int:
+        for _ in range(WEBSOCKET_SUBSCRIBERS):
+            connection = _websocket_connection(hass, _send_message)
+            connection.async_handle({"id": 1, "type": "subscribe_entities"})
+            connection.async_handle_close()
+        return WEBSOCKET_SUBSCRIBERS
+
+    return _iteration
+
+
+@scenario()
+async def websocket_fanout(
+    hass: core.HomeAssistant, entity_count: int
+) -> ScenarioIteration:
+    """Fan out state changes to many subscribe_entities connections."""
+    entity_ids = _entity_ids(entity_count)[:WEBSOCKET_STATE_CHANGES]
+    delivered = 0
+    value = 0
+
+    def _send_message(message: Any) -> None:
+        nonlocal delivered
+        delivered += 1
+
+    for _ in range(WEBSOCKET_SUBSCRIBERS):
+        _websocket_connection(hass, _send_message).async_handle(
+            {"id": 1, "type": "subscribe_entities"}
+        )
+
+    async def _iteration() -> int:
+        nonlocal delivered, value
+        delivered = 0
+        value += 1
+        async_populate_states(hass, entity_ids, value)
+        await hass.async_block_till_done()
+        return delivered
+
+    return _iteration
+
+
+async def async_run_scenario(
+    bench: Scenario, entity_count: int, warmup: int, repeat: int
+) -> dict[str, Any]:
+    """Run a scenario and return its statistics."""
+    async with async_benchmark_hass(entity_count, bench.config) as hass:
+        iteration = await bench.factory(hass, entity_count)
+        for _ in range(warmup):
+            await iteration()
+        durations: list[float] = []
+        operations = 0
+        for _ in range(repeat):
+            start = timer()
+            operations += await iteration()
+            durations.append(timer() - start)
+        # Make sure nothing is left running when the instance stops
+        await hass.async_block_till_done()
+    return summarize(operations, durations)
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Return the nearest rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(
+        0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1)
+    )
+    return sorted_values[rank]
+
+
+def summarize(operations: int, durations: list[float]) -> dict[str, Any]:
+    """Summarize the durations of the iterations of a scenario."""
+    total = sum(durations)
+    ordered = sorted(durations)
+    return {
+        "iterations": len(durations),
+        "operations": operations,
+        "ops_per_sec": operations / total if total else 0.0,
+        "mean_ms": total / len(durations) * 1000 if durations else 0.0,
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[dict[str, Any]]:
+    """Compare two suite runs and return the per scenario differences.
+
+    A scenario regressed when its throughput dropped or its p99 latency
+    grew by more than the threshold, expressed as a fraction.
+    """
+    comparison: list[dict[str, Any]] = []
+    baseline_scenarios: dict[str, Any] = baseline.get("scenarios", {})
+    for name, result in current.get("scenarios", {}).items():
+        if (base := baseline_scenarios.get(name)) is None:
+            continue
+        ops_change = (
+            result["ops_per_sec"] / base["ops_per_sec"] - 1
+            if base["ops_per_sec"]
+            else 0.0
+        )
+        p99_change = result["p99_ms"] / base["p99_ms"] - 1 if base["p99_ms"] else 0.0
+        comparison.append(
+            {
+                "scenario": name,
+                "ops_per_sec_change": ops_change,
+                "p99_change": p99_change,
+                "regression": ops_change < -threshold or p99_change > threshold,
+            }
+        )
+    return comparison
+
+
+async def async_run_suite(
+    names: list[str], entity_count: int, warmup: int, repeat: int
+) -> dict[str, Any]:
+    """Run scenarios one after another and collect their results."""
+    results: dict[str, Any] = {}
+    for name in names:
+        results[name] = await async_run_scenario(
+            SCENARIOS[name], entity_count, warmup, repeat
+        )
+        _LOGGER.debug("Scenario %s finished: %s", name, results[name])
+    return {
+        "version": __version__,
+        "entities": entity_count,
+        "warmup": warmup,
+        "repeat": repeat,
+        "scenarios": results,
+    }
+
+
+def run_suite(
+    names: list[str], entity_count: int, warmup: int, repeat: int
+) -> dict[str, Any]:
+    """Run scenarios in a new event loop."""
+    return asyncio.run(async_run_suite(names, entity_count, warmup, repeat))
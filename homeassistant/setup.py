@@ -677,6 +677,13 @@ class SetupPhases(StrEnum):
     """Wait time for the platforms to import."""
     WAIT_IMPORT_PACKAGES = "wait_import_packages"
     """Wait time for the packages to import."""
+    IMPORT = "import"
+    """Import of the integration and its platforms.
+
+    This is recorded from the import times of the loader once startup
+    has finished, the time of each module is in
+    loader.async_get_import_timings.
+    """
 
 
 @singleton.singleton(DATA_SETUP_STARTED)
@@ -816,6 +823,15 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
     return domain_timings
 
 
+@callback
+def async_record_import_times(hass: core.HomeAssistant) -> None:
+    """Record the import time of each integration that was set up."""
+    setup_time = _setup_times(hass)
+    for domain, import_times in loader.async_get_import_timings(hass).items():
+        if domain in setup_time:
+            setup_time[domain][None][SetupPhases.IMPORT] = sum(import_times.values())
+
+
 @callback
 def async_get_domain_setup_times(
     hass: core.HomeAssistant, domain: str
@@ -1,7 +1,10 @@
 """The tests the History component websocket_api."""
 
 import asyncio
+from collections.abc import Iterator
 from datetime import timedelta
+import threading
+from typing import Any
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
@@ -9,7 +12,7 @@ import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import ReadQueryKind, Recorder
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -454,6 +457,191 @@ async def test_history_during_period_bad_end_time(
     assert response["error"]["code"] == "invalid_end_time"
 
 
+async def test_history_during_period_columnar(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period_columnar."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.test", "off", attributes={"any": "changed"})
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.other", "5", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period_columnar",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test", "sensor.other"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["result"] is None
+
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    chunk = response["event"]
+    assert chunk["chunk"] == 0
+    assert chunk["attributes"] == [{"any": "attr"}, {"any": "changed"}]
+    assert chunk["states"] == {
+        "sensor.test": {"s": ["on", "off", "on"], "lu": ANY, "a": [0, 1, 0]},
+        "sensor.other": {"s": ["5"], "lu": ANY, "a": [0]},
+    }
+    assert len(chunk["states"]["sensor.test"]["lu"]) == 3
+
+    response = await client.receive_json()
+    assert response["event"] == {"done": True, "chunks": 1}
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period_columnar",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "significant_changes_only": False,
+            "no_attributes": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"]["states"] == {
+        "sensor.test": {"s": ["on", "off", "on"], "lu": ANY, "lc": [None] * 3}
+    }
+    assert response["event"]["attributes"] == []
+    response = await client.receive_json()
+    assert response["event"] == {"done": True, "chunks": 1}
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period_columnar",
+            "start_time": "cats",
+            "entity_ids": ["sensor.test"],
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
+async def test_history_during_period_columnar_unsubscribe(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test unsubscribing stops reading history_during_period_columnar chunks."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+
+    proceed = threading.Event()
+    closed = threading.Event()
+    chunks_read: list[int] = []
+
+    def _stream_chunks(*args: Any) -> Iterator[dict[str, Any]]:
+        try:
+            for chunk in range(3):
+                chunks_read.append(chunk)
+                yield {"states": {}, "attributes": []}
+                proceed.wait(5)
+        finally:
+            closed.set()
+
+    client = await hass_ws_client()
+    with patch.object(
+        websocket_api.history,
+        "stream_significant_states_with_session",
+        _stream_chunks,
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period_columnar",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        subscription = response["id"]
+        response = await client.receive_json()
+        assert response["event"]["chunk"] == 0
+
+        await client.send_json_auto_id(
+            {"type": "unsubscribe_events", "subscription": subscription}
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        proceed.set()
+        assert await hass.async_add_executor_job(closed.wait, 5)
+        await hass.async_block_till_done()
+
+    # The chunk read while waiting is dropped and no done event is sent
+    assert chunks_read == [0, 1]
+    await client.send_json_auto_id({"type": "ping"})
+    response = await client.receive_json()
+    assert response["type"] == "pong"
+
+
+async def test_downsampled_history_during_period(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test downsampled_history_during_period."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for seconds, state in ((10, "1"), (20, "2"), (25, "unavailable"), (30, "6")):
+        with freeze_time(now + timedelta(seconds=seconds)):
+            hass.states.async_set("sensor.power", state)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with freeze_time(now + timedelta(seconds=40)):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/downsampled_history_during_period",
+                "start_time": now.isoformat(),
+                "end_time": (now + timedelta(hours=1)).isoformat(),
+                "entity_ids": ["sensor.power"],
+                "points": 1,
+            }
+        )
+        response = await client.receive_json()
+    assert response["success"]
+    # 1 for 10s, 2 for 5s and 6 for the 10s until now
+    assert response["result"] == {
+        "sensor.power": [
+            {"start": now.timestamp(), "min": 1.0, "max": 6.0, "mean": 3.2, "last": 6.0}
+        ]
+    }
+    # The job returns json, the bucket is reported as the row it read
+    assert recorder_mock.read_query_scheduler is not None
+    assert recorder_mock.read_query_scheduler.stats[ReadQueryKind.HISTORY].rows == 1
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/downsampled_history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "points": 0,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_stream_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2154,3 +2342,42 @@ async def test_history_stream_live_chained_events(
         "id": 1,
         "type": "event",
     }
+
+
+async def test_history_stream_live_shares_serialized_states(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test live streams with the same options share the serialized states."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    clients = [await hass_ws_client(), await hass_ws_client()]
+    for client in clients:
+        await client.send_json_auto_id(
+            {
+                "type": "history/stream",
+                "entity_ids": ["sensor.one"],
+                "start_time": now.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": False,
+                "minimal_response": False,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["states"]["sensor.one"][0]["s"] == "on"
+
+    await async_recorder_block_till_done(hass)
+    live_states = hass.data[websocket_api.DATA_LIVE_STATES]
+    hits, misses = live_states.get_stats()
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+
+    responses = [await client.receive_json() for client in clients]
+    assert responses[0]["event"] == responses[1]["event"]
+    assert responses[0]["event"]["states"]["sensor.one"][0]["s"] == "off"
+    assert live_states.get_stats() == (hits + 1, misses + 1)
@@ -4,7 +4,7 @@ import asyncio
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -16,8 +16,16 @@ from homeassistant.components import logbook, recorder
 # pylint: disable-next=hass-component-root-import
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
-from homeassistant.components.logbook.models import EventAsRow, LazyEventPartialState
-from homeassistant.components.logbook.processor import EventProcessor
+from homeassistant.components.logbook.models import (
+    EventAsRow,
+    LazyEventPartialState,
+    async_event_to_row,
+)
+from homeassistant.components.logbook.processor import (
+    EntityNameCache,
+    EventCache,
+    EventProcessor,
+)
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
@@ -44,8 +52,10 @@ from homeassistant.const import (
 from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
+from homeassistant.helpers.json import json_bytes
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .common import MockRow, mock_humanify
 
@@ -3002,3 +3012,122 @@ async def test_logbook_with_non_iterable_entity_filter(hass: HomeAssistant) -> N
         },
     )
     await hass.async_block_till_done()
+
+
+async def test_logbook_caches_are_bounded(hass: HomeAssistant) -> None:
+    """Test the event and entity name caches keep the most recently used items."""
+    with (
+        patch("homeassistant.components.logbook.processor.EVENT_CACHE_SIZE", 2),
+        patch("homeassistant.components.logbook.processor.ENTITY_NAME_CACHE_SIZE", 2),
+    ):
+        event_cache = EventCache()
+        entity_name_cache = EntityNameCache(hass)
+
+    rows = [MockRow(EVENT_CALL_SERVICE, {"service": str(idx)}) for idx in range(3)]
+    events = [event_cache.get(row) for row in rows]
+    assert [event.data["service"] for event in events] == ["0", "1", "2"]
+    assert len(event_cache.event_cache) == 2
+    assert event_cache.get(rows[2]) is events[2]
+    assert event_cache.get(rows[0]) is not events[0]
+
+    for idx in range(3):
+        hass.states.async_set(f"light.l{idx}", "on", {ATTR_FRIENDLY_NAME: f"L{idx}"})
+    assert [entity_name_cache.get(f"light.l{idx}") for idx in range(3)] == [
+        "L0",
+        "L1",
+        "L2",
+    ]
+    hass.states.async_set("light.l0", "on", {ATTR_FRIENDLY_NAME: "Renamed"})
+    hass.states.async_set("light.l2", "on", {ATTR_FRIENDLY_NAME: "Renamed"})
+    # Evicted names are looked up again
+    assert entity_name_cache.get("light.l0") == "Renamed"
+    assert entity_name_cache.get("light.l2") == "L2"
+
+
+@pytest.mark.usefixtures("recorder_mock")
+async def test_humanify_live_does_not_share_stream_context(
+    hass: HomeAssistant,
+) -> None:
+    """Test shared live entries do not use the context lookup of a stream."""
+    await async_setup_component(hass, "logbook", {})
+    context = ha.Context()
+    event = Event(
+        logbook.EVENT_LOGBOOK_ENTRY,
+        {logbook.ATTR_NAME: "Alarm", logbook.ATTR_MESSAGE: "is triggered"},
+        context=context,
+    )
+    context_row = MockRow(PSEUDO_EVENT_STATE_CHANGED, context=context)
+    context_row.entity_id = "switch.trigger"
+    context_row.state = "on"
+
+    streams = []
+    for _ in range(2):
+        stream = EventProcessor(hass, (logbook.EVENT_LOGBOOK_ENTRY,))
+        stream.switch_to_live()
+        streams.append(stream)
+    streams[0].logbook_run.context_lookup[context_row.context_id_bin] = context_row
+
+    (private_entry,) = streams[0].humanify((async_event_to_row(event),))
+    assert private_entry["context_entity_id"] == "switch.trigger"
+
+    (shared_entry,) = streams[0].humanify_live([event])
+    assert streams[1].humanify_live([event]) == [shared_entry]
+    entry = json_loads(json_bytes(shared_entry))
+    assert entry["name"] == "Alarm"
+    assert "context_entity_id" not in entry
+
+
+@pytest.mark.usefixtures("recorder_mock")
+async def test_humanify_context_started_far_back(hass: HomeAssistant) -> None:
+    """Test a context is found however many rows ago it started."""
+    await async_setup_component(hass, "logbook", {})
+    context = ha.Context()
+    context_row = MockRow(PSEUDO_EVENT_STATE_CHANGED, context=context)
+    context_row.entity_id = "switch.trigger"
+    context_row.state = "on"
+    context_row.icon = None
+    # Rows of other contexts which do not produce entries
+    other_rows = [
+        MockRow(logbook.EVENT_LOGBOOK_ENTRY, context=ha.Context()) for _ in range(20000)
+    ]
+    row = MockRow(
+        logbook.EVENT_LOGBOOK_ENTRY,
+        {logbook.ATTR_NAME: "Alarm", logbook.ATTR_MESSAGE: "is triggered"},
+        context=context,
+    )
+
+    event_processor = EventProcessor(hass, (logbook.EVENT_LOGBOOK_ENTRY,))
+    entries = list(event_processor.humanify([context_row, *other_rows, row]))
+
+    assert entries[-1]["name"] == "Alarm"
+    assert entries[-1]["context_entity_id"] == "switch.trigger"
+
+
+@pytest.mark.usefixtures("recorder_mock")
+async def test_get_events_json(hass: HomeAssistant) -> None:
+    """Test the events are serialized as they are humanified."""
+    await async_setup_component(hass, "logbook", {})
+    for name in ("Alarm", "Door"):
+        hass.bus.async_fire(
+            logbook.EVENT_LOGBOOK_ENTRY,
+            {logbook.ATTR_NAME: name, logbook.ATTR_MESSAGE: "is triggered"},
+        )
+    await async_wait_recording_done(hass)
+    event_processor = EventProcessor(
+        hass, (logbook.EVENT_LOGBOOK_ENTRY,), timestamp=True
+    )
+    start = dt_util.utcnow() - timedelta(hours=1)
+    end = dt_util.utcnow() + timedelta(hours=1)
+
+    events, last_when = await hass.async_add_executor_job(
+        event_processor.get_events_json, start, end
+    )
+
+    entries = json_loads(json_bytes(events))
+    assert [entry["name"] for entry in entries] == ["Alarm", "Door"]
+    assert last_when == entries[-1]["when"]
+    events, last_when = await hass.async_add_executor_job(
+        event_processor.get_events_json, end, end + timedelta(hours=1)
+    )
+    assert json_loads(json_bytes(events)) == []
+    assert last_when is None
@@ -2,6 +2,8 @@
 
 import asyncio
 from datetime import timedelta
+from functools import partial
+from itertools import count
 import socket
 import ssl
 import time
@@ -23,7 +25,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -134,6 +142,187 @@ async def test_mqtt_await_ack_at_disconnect(hass: HomeAssistant) -> None:
         await hass.async_block_till_done(wait_background_tasks=True)
 
 
+async def test_publish_inflight_window(hass: HomeAssistant) -> None:
+    """Test publishes are queued when the in-flight window is full."""
+    mids = count(1)
+
+    class FakeInfo:
+        """Returns a simulated client publish response."""
+
+        def __init__(self) -> None:
+            self.mid = next(mids)
+            self.rc = 0
+
+    with patch(
+        "homeassistant.components.mqtt.async_client.AsyncMQTTClient"
+    ) as mock_client:
+        mqtt_client = mock_client.return_value
+        mqtt_client.connect = MagicMock(
+            return_value=0,
+            side_effect=lambda *args, **kwargs: hass.loop.call_soon_threadsafe(
+                mqtt_client.on_connect, mqtt_client, None, 0, 0, 0
+            ),
+        )
+        mqtt_client.publish = MagicMock(side_effect=lambda *args: FakeInfo())
+        entry = MockConfigEntry(
+            domain=mqtt.DOMAIN,
+            data={
+                mqtt.CONF_BROKER: "test-broker",
+                mqtt.CONF_DISCOVERY: False,
+                "max_inflight": 2,
+                "coalesce_publish": True,
+            },
+            version=mqtt.CONFIG_ENTRY_VERSION,
+            minor_version=mqtt.CONFIG_ENTRY_MINOR_VERSION,
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        mqtt_client.max_inflight_messages_set.assert_called_once_with(2)
+
+        tasks = [
+            hass.async_create_task(mqtt.async_publish(hass, topic, payload, 1))
+            for topic, payload in (
+                ("test/1", "a"),
+                ("test/2", "b"),
+                ("test/3", "c"),
+                ("test/4", "d"),
+                ("test/3", "e"),
+            )
+        ]
+        await asyncio.sleep(0)
+        assert [
+            publish_call[0][:2] for publish_call in mqtt_client.publish.call_args_list
+        ] == [
+            ("test/1", "a"),
+            ("test/2", "b"),
+        ]
+
+        # The ACK frees a slot for the next queued message,
+        # the queued message on test/3 took the latest payload
+        mqtt_client.on_publish(0, 0, 1)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert mqtt_client.publish.call_count == 3
+        assert mqtt_client.publish.call_args[0][:2] == ("test/3", "e")
+
+        for mid in (2, 3, 4):
+            mqtt_client.on_publish(0, 0, mid)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        assert mqtt_client.publish.call_count == 4
+        assert mqtt_client.publish.call_args[0][:2] == ("test/4", "d")
+
+        stats = hass.data["mqtt"].publish_stats
+        assert stats.published == 4
+        assert stats.queued == 2
+        assert stats.coalesced == 1
+        assert stats.max_queue_size == 2
+        assert stats.failed == 0
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+
+async def test_publish_inflight_window_invalid_publish(hass: HomeAssistant) -> None:
+    """Test a queued publish rejected by paho resolves its caller."""
+    mids = count(1)
+
+    class FakeInfo:
+        """Returns a simulated client publish response."""
+
+        def __init__(self) -> None:
+            self.mid = next(mids)
+            self.rc = 0
+
+    def _publish(topic: str, *args: Any) -> FakeInfo:
+        if "#" in topic:
+            raise ValueError("Publish topic cannot contain wildcards.")
+        return FakeInfo()
+
+    with patch(
+        "homeassistant.components.mqtt.async_client.AsyncMQTTClient"
+    ) as mock_client:
+        mqtt_client = mock_client.return_value
+        mqtt_client.connect = MagicMock(
+            return_value=0,
+            side_effect=lambda *args, **kwargs: hass.loop.call_soon_threadsafe(
+                mqtt_client.on_connect, mqtt_client, None, 0, 0, 0
+            ),
+        )
+        mqtt_client.publish = MagicMock(side_effect=_publish)
+        entry = MockConfigEntry(
+            domain=mqtt.DOMAIN,
+            data={
+                mqtt.CONF_BROKER: "test-broker",
+                mqtt.CONF_DISCOVERY: False,
+                "max_inflight": 1,
+            },
+            version=mqtt.CONFIG_ENTRY_VERSION,
+            minor_version=mqtt.CONFIG_ENTRY_MINOR_VERSION,
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+
+        valid = hass.async_create_task(mqtt.async_publish(hass, "test/1", "a", 1))
+        invalid = hass.async_create_task(mqtt.async_publish(hass, "test/#", "b", 1))
+        await asyncio.sleep(0)
+        assert mqtt_client.publish.call_count == 1
+
+        mqtt_client.on_publish(0, 0, 1)
+        await valid
+        with pytest.raises(ValueError, match="wildcards"):
+            await invalid
+
+        stats = hass.data["mqtt"].publish_stats
+        assert stats.published == 1
+        assert stats.queued == 1
+        assert stats.failed == 1
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+
+async def test_publish_inflight_window_at_least_one(hass: HomeAssistant) -> None:
+    """Test a max_inflight of zero still lets one publish through."""
+
+    class FakeInfo:
+        """Returns a simulated client publish response."""
+
+        mid = 1
+        rc = 0
+
+    with patch(
+        "homeassistant.components.mqtt.async_client.AsyncMQTTClient"
+    ) as mock_client:
+        mqtt_client = mock_client.return_value
+        mqtt_client.connect = MagicMock(
+            return_value=0,
+            side_effect=lambda *args, **kwargs: hass.loop.call_soon_threadsafe(
+                mqtt_client.on_connect, mqtt_client, None, 0, 0, 0
+            ),
+        )
+        mqtt_client.publish = MagicMock(side_effect=lambda *args: FakeInfo())
+        entry = MockConfigEntry(
+            domain=mqtt.DOMAIN,
+            data={
+                mqtt.CONF_BROKER: "test-broker",
+                mqtt.CONF_DISCOVERY: False,
+                "max_inflight": 0,
+            },
+            version=mqtt.CONFIG_ENTRY_VERSION,
+            minor_version=mqtt.CONFIG_ENTRY_MINOR_VERSION,
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        mqtt_client.max_inflight_messages_set.assert_called_once_with(1)
+
+        task = hass.async_create_task(mqtt.async_publish(hass, "test/1", "a", 1))
+        await asyncio.sleep(0)
+        assert mqtt_client.publish.call_count == 1
+
+        mqtt_client.on_publish(0, 0, 1)
+        await task
+        assert hass.data["mqtt"].publish_stats.published == 1
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+
 @pytest.mark.parametrize("mqtt_config_entry_options", [ENTRY_DEFAULT_BIRTH_MESSAGE])
 async def test_publish(
     hass: HomeAssistant, setup_with_birth_msg_client_mock: MqttMockPahoClient
@@ -252,6 +441,38 @@ async def test_all_subscriptions_run_when_decode_fails(
     assert len(recorded_calls) == 1
 
 
+async def test_payload_decoded_once_per_encoding(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test subscribers with the same encoding share the decoded payload."""
+    await mqtt_mock_entry()
+    calls: list[tuple[str, ReceiveMessage]] = []
+
+    @callback
+    def _record(name: str, msg: ReceiveMessage) -> None:
+        calls.append((name, msg))
+
+    await mqtt.async_subscribe(hass, "test-topic", partial(_record, "utf-8"))
+    await mqtt.async_subscribe(hass, "test-topic/#", partial(_record, "wildcard"))
+    await mqtt.async_subscribe(
+        hass, "test-topic", partial(_record, "raw"), encoding=None
+    )
+    await mqtt.async_subscribe(hass, "test-topic", partial(_record, "utf-8"))
+
+    async_fire_mqtt_message(hass, "test-topic", '{"temperature": 21.5}')
+    await hass.async_block_till_done()
+
+    messages = dict(calls)
+    assert len(calls) == 4
+    assert messages["utf-8"].payload == '{"temperature": 21.5}'
+    assert messages["raw"].payload == b'{"temperature": 21.5}'
+    assert messages["raw"].subscribed_topic == "test-topic"
+    utf8_messages = [msg for name, msg in calls if name == "utf-8"]
+    assert utf8_messages[0] is utf8_messages[1]
+    assert messages["wildcard"].subscribed_topic == "test-topic/#"
+    assert messages["wildcard"].payload is messages["utf-8"].payload
+
+
 async def test_subscribe_topic(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -635,6 +856,114 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+@pytest.mark.parametrize(
+    "topic",
+    [
+        "sport",
+        "sport/tennis",
+        "sport/tennis/player1",
+        "sport/tennis/player1/ranking",
+        "sport/badminton/player1",
+        "/finance",
+        "finance",
+        "$SYS/broker/uptime",
+        "$SYS",
+        "zigbee2mqtt/bridge/state",
+        "",
+        "/",
+    ],
+)
+def test_subscription_trie(topic: str) -> None:
+    """Test the subscription trie matches the same topics as paho."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    topic_filters = [
+        "#",
+        "+",
+        "+/+",
+        "/+",
+        "+/tennis/#",
+        "sport/#",
+        "sport/+",
+        "sport/tennis/+",
+        "sport/+/player1",
+        "sport/tennis/player1",
+        "$SYS/#",
+        "$SYS/+/uptime",
+        "zigbee2mqtt/+/state",
+    ]
+    trie = mqtt.client.SubscriptionTrie()
+    subscriptions = [
+        mqtt.client.Subscription(topic_filter, False, HassJob(lambda msg: None))
+        for topic_filter in topic_filters
+    ]
+    for subscription in subscriptions:
+        trie.add(subscription)
+    assert len(trie) == len(topic_filters)
+
+    expected = []
+    for subscription in subscriptions:
+        matcher = MQTTMatcher()
+        matcher[subscription.topic] = True
+        if next(matcher.iter_match(topic), False):
+            expected.append(subscription)
+    assert trie.match(topic) == expected
+
+    for subscription in subscriptions:
+        assert subscription.topic in trie
+        trie.remove(subscription)
+        assert subscription not in trie.match(topic)
+    assert len(trie) == 0
+    assert "sport/#" not in trie
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions[0])
+
+
+async def test_subscribe_wildcard_invalidates_matches(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test matched subscriptions are updated when subscribing and unsubscribing."""
+    await mqtt_mock_entry()
+    calls: list[str] = []
+
+    @callback
+    def _record(topic_filter: str, msg: ReceiveMessage) -> None:
+        calls.append(topic_filter)
+
+    unsub_level = await mqtt.async_subscribe(
+        hass, "test-topic/+/state", partial(_record, "test-topic/+/state")
+    )
+    async_fire_mqtt_message(hass, "test-topic/device/state", "test-payload")
+    await hass.async_block_till_done()
+    assert calls == ["test-topic/+/state"]
+
+    unsub_subtree = await mqtt.async_subscribe(
+        hass, "test-topic/#", partial(_record, "test-topic/#")
+    )
+    unsub_topic = await mqtt.async_subscribe(
+        hass, "test-topic/device/state", partial(_record, "test-topic/device/state")
+    )
+    async_fire_mqtt_message(hass, "test-topic/device/state", "test-payload")
+    await hass.async_block_till_done()
+    assert calls[1:] == [
+        "test-topic/device/state",
+        "test-topic/+/state",
+        "test-topic/#",
+    ]
+
+    unsub_level()
+    unsub_topic()
+    async_fire_mqtt_message(hass, "test-topic/device/state", "test-payload")
+    await hass.async_block_till_done()
+    assert calls[4:] == ["test-topic/#"]
+
+    unsub_subtree()
+    async_fire_mqtt_message(hass, "test-topic/device/state", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 5
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
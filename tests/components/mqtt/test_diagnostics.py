@@ -42,6 +42,23 @@ async def test_entry_diagnostics(
         "devices": [],
         "mqtt_config": {"data": default_entry_data, "options": default_entry_options},
         "mqtt_debug_info": {"entities": [], "triggers": []},
+        "discovery": {
+            "messages": 0,
+            "deduplicated": 0,
+            "bulk_batches": 0,
+            "bulk_messages": 0,
+            "time_to_available": None,
+        },
+        "publish": {
+            "published": 0,
+            "failed": 0,
+            "queued": 0,
+            "coalesced": 0,
+            "max_queue_size": 0,
+            "latency_total": 0.0,
+            "latency_max": 0.0,
+            "write_batches": 0,
+        },
     }
 
     # Discover a device with an entity and a trigger
@@ -127,6 +144,14 @@ async def test_entry_diagnostics(
         "devices": [expected_device],
         "mqtt_config": {"data": default_entry_data, "options": default_entry_options},
         "mqtt_debug_info": expected_debug_info,
+        "discovery": {
+            "messages": 2,
+            "deduplicated": 0,
+            "bulk_batches": 0,
+            "bulk_messages": 0,
+            "time_to_available": ANY,
+        },
+        "publish": ANY,
     }
 
     assert await get_diagnostics_for_device(
@@ -263,6 +288,14 @@ async def test_redact_diagnostics(
         "devices": [expected_device],
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
+        "discovery": {
+            "messages": 1,
+            "deduplicated": 0,
+            "bulk_batches": 0,
+            "bulk_messages": 0,
+            "time_to_available": ANY,
+        },
+        "publish": ANY,
     }
 
     assert await get_diagnostics_for_device(
@@ -1625,6 +1625,90 @@ async def test_duplicate_removal(
     assert "Component has already been discovered: binary_sensor bla" not in caplog.text
 
 
+async def test_bulk_discovery_retained(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test retained discovery messages are loaded in batches."""
+    await mqtt_mock_entry()
+    discovery_stats = hass.data["mqtt"].discovery_stats
+    for object_id in ("bla1", "bla2", "bla3"):
+        async_fire_mqtt_message(
+            hass,
+            f"homeassistant/binary_sensor/{object_id}/config",
+            f'{{ "name": "{object_id}", "state_topic": "test-topic" }}',
+            retain=True,
+        )
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/device/dev1/config",
+        '{"dev": {"ids": ["dev1"]}, "o": {"name": "foobar"}, "cmps": '
+        '{"sensor1": {"p": "sensor", "name": "bla4", "stat_t": "test-topic", '
+        '"uniq_id": "bla4"}}}',
+        retain=True,
+    )
+    # Messages received while the batch is pending are queued to keep the order
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla1/config", "")
+    await hass.async_block_till_done()
+
+    assert hass.states.get("binary_sensor.bla1") is None
+    assert hass.states.get("binary_sensor.bla2") is not None
+    assert hass.states.get("binary_sensor.bla3") is not None
+    assert hass.states.get("sensor.none_bla4") is not None
+    assert discovery_stats.messages == 5
+    assert discovery_stats.bulk_batches == 1
+    assert discovery_stats.bulk_messages == 5
+    assert discovery_stats.time_to_available is not None
+
+
+async def test_discovery_unchanged_payload(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test an unchanged discovery payload is not processed again."""
+    await mqtt_mock_entry()
+    discovery_stats = hass.data["mqtt"].discovery_stats
+    payload = '{ "name": "Beer", "state_topic": "test-topic" }'
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload)
+    await hass.async_block_till_done()
+    assert discovery_stats.time_to_available is not None
+
+    # The retained config is received again after a reconnect
+    with patch(
+        "homeassistant.components.mqtt.binary_sensor.MqttBinarySensor.discovery_update"
+    ) as discovery_update:
+        async_fire_mqtt_message(
+            hass, "homeassistant/binary_sensor/bla/config", payload, retain=True
+        )
+        await hass.async_block_till_done()
+    discovery_update.assert_not_called()
+    assert discovery_stats.deduplicated == 1
+
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert discovery_stats.deduplicated == 1
+    state = hass.states.get("binary_sensor.beer")
+    assert state is not None
+    assert state.name == "Milk"
+
+    # Once removed, the same config is discovered again
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", "")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is None
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert discovery_stats.deduplicated == 1
+    assert hass.states.get("binary_sensor.milk") is not None
+
+
 @pytest.mark.parametrize(
     ("discovery_payloads", "entity_ids"),
     [
@@ -20,6 +20,8 @@ from homeassistant.components.mqtt.models import (
     MqttCommandTemplateException,
     MqttValueTemplateException,
     ReceiveMessage,
+    async_payload_json,
+    async_payload_json_copy,
 )
 from homeassistant.components.mqtt.schemas import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.sensor import SensorDeviceClass
@@ -36,7 +38,7 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr, entity_registry as er, template
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import async_get_platforms
-from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 from homeassistant.util.dt import utcnow
@@ -216,6 +218,47 @@ async def test_value_template_value(hass: HomeAssistant) -> None:
         assert template_state_calls.call_count == 1
 
 
+async def test_value_template_parses_payload_once(hass: HomeAssistant) -> None:
+    """Test value templates rendering the same payload parse it once."""
+    payload = '{"id": 4321, "name": "beer"}'
+    tpl_id = mqtt.MqttValueTemplate(template.Template("{{ value_json.id }}", hass=hass))
+    tpl_name = mqtt.MqttValueTemplate(
+        template.Template("{{ value_json.name }}", hass=hass)
+    )
+    with patch(
+        "homeassistant.components.mqtt.models.json_loads",
+        side_effect=json.loads,
+    ) as json_loads_mock:
+        assert tpl_id.async_render_with_possible_json_value(payload) == "4321"
+        assert tpl_name.async_render_with_possible_json_value(payload) == "beer"
+        assert tpl_id.async_render_with_possible_json_value(payload, "0") == "4321"
+    assert json_loads_mock.call_count == 1
+
+
+def test_payload_json() -> None:
+    """Test a parsed payload is shared."""
+    payload = '{"id": 4321}'
+    value_json = async_payload_json(payload)
+    assert value_json == {"id": 4321}
+    assert async_payload_json(payload) is value_json
+    assert async_payload_json('{"id": 4321}') == value_json
+    assert async_payload_json("ON") is UNDEFINED
+    assert async_payload_json(b"[1, 2]") == [1, 2]
+    assert async_payload_json(bytearray(b"12")) == 12
+
+
+def test_payload_json_copy() -> None:
+    """Test a copied parsed payload does not share the cached value."""
+    payload = '{"id": 4321, "list": [{"nested": 1}]}'
+    value_json = async_payload_json(payload)
+    copied = async_payload_json_copy(payload)
+    assert copied == value_json
+    copied["list"][0]["nested"] = 2
+    copied["list"].append(3)
+    assert async_payload_json(payload) == {"id": 4321, "list": [{"nested": 1}]}
+    assert async_payload_json_copy("ON") is UNDEFINED
+
+
 async def test_value_template_fails(hass: HomeAssistant) -> None:
     """Test the rendering of MQTT value template fails."""
     entity = MockEntity(entity_id="sensor.test")
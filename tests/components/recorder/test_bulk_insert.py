@@ -0,0 +1,188 @@
+"""Test inserting recorder rows in bulk."""
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.bulk_insert import BulkInserter
+from homeassistant.components.recorder.const import BULK_INSERT_MAX_DEFERRED_COMMITS
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from .common import async_recorder_block_till_done, async_wait_recording_done
+
+from tests.typing import RecorderInstanceContextManager
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceContextManager,
+) -> None:
+    """Set up recorder."""
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{"bulk_insert": True, "bulk_insert_batch_size": 3}]
+)
+async def test_bulk_insert_states_and_events(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test states and events are linked when inserted in bulk."""
+    assert recorder_mock._bulk_inserter is not None
+
+    for value in range(5):
+        hass.states.async_set("sensor.one", str(value), {"value": value % 2})
+        hass.states.async_set("sensor.two", str(value), {"value": value % 2})
+    hass.bus.async_fire("bulk_event", {"data": 1})
+    hass.bus.async_fire("bulk_event", {"data": 1})
+    hass.bus.async_fire("bulk_event")
+    await async_wait_recording_done(hass)
+
+    hass.states.async_set("sensor.one", "after_commit")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        metadata_ids = {
+            states_meta.entity_id: states_meta.metadata_id
+            for states_meta in session.query(StatesMeta)
+        }
+        assert set(metadata_ids) == {"sensor.one", "sensor.two"}
+        assert session.query(StateAttributes).count() == 3
+
+        for entity_id, expected in (
+            ("sensor.one", ["0", "1", "2", "3", "4", "after_commit"]),
+            ("sensor.two", ["0", "1", "2", "3", "4"]),
+        ):
+            db_states = (
+                session.query(States)
+                .filter(States.metadata_id == metadata_ids[entity_id])
+                .order_by(States.last_updated_ts)
+                .all()
+            )
+            assert [db_state.state for db_state in db_states] == expected
+            assert db_states[0].old_state_id is None
+            assert [db_state.old_state_id for db_state in db_states[1:]] == [
+                db_state.state_id for db_state in db_states[:-1]
+            ]
+            assert all(db_state.attributes_id for db_state in db_states)
+
+        event_type_id = (
+            session.query(EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "bulk_event")
+            .scalar()
+        )
+        db_events = (
+            session.query(Events).filter(Events.event_type_id == event_type_id).all()
+        )
+        assert len(db_events) == 3
+        data_ids = [db_event.data_id for db_event in db_events]
+        assert data_ids[0] == data_ids[1] is not None
+        assert data_ids[2] is None
+        assert session.query(EventData).filter(EventData.data_id.in_(data_ids)).one()
+
+
+@pytest.mark.parametrize(
+    "recorder_config",
+    [{"commit_interval": 5, "bulk_insert": True, "bulk_insert_batch_size": 3}],
+)
+async def test_bulk_insert_last_reported_after_flush(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test last reported is kept for states inserted before the commit."""
+    hass.states.async_set("sensor.one", "on")
+    await async_recorder_block_till_done(hass)
+    # The states meta, attributes and state rows fill a batch
+    assert recorder_mock._bulk_inserter.pending_rows == 0
+    assert recorder_mock._bulk_inserter.uncommitted_rows
+
+    hass.states.async_set("sensor.one", "on", force_update=False)
+    await hass.async_block_till_done()
+    last_reported = hass.states.get("sensor.one").last_reported_timestamp
+    hass.states.async_set("sensor.one", "off")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = session.query(States).order_by(States.last_updated_ts).all()
+        assert [db_state.state for db_state in db_states] == ["on", "off"]
+        assert db_states[0].last_reported_ts == last_reported
+        assert db_states[0].last_reported_ts != db_states[0].last_updated_ts
+        assert db_states[1].old_state_id == db_states[0].state_id
+
+
+@pytest.mark.parametrize(
+    "recorder_config",
+    [{"commit_interval": 5, "bulk_insert": True, "bulk_insert_batch_size": 10}],
+)
+async def test_bulk_insert_defers_commit_with_backlog(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test commits are deferred while the backlog is larger than a batch."""
+    with patch.object(Recorder, "backlog", new_callable=PropertyMock, return_value=10):
+        deferred = [
+            recorder_mock._async_defer_commit()
+            for _ in range(BULK_INSERT_MAX_DEFERRED_COMMITS + 1)
+        ]
+        assert deferred == [True] * BULK_INSERT_MAX_DEFERRED_COMMITS + [False]
+        assert recorder_mock._async_defer_commit() is True
+
+    with patch.object(Recorder, "backlog", new_callable=PropertyMock, return_value=9):
+        assert recorder_mock._async_defer_commit() is False
+
+
+def test_bulk_insert_flush_keeps_rows_on_error() -> None:
+    """Test rows are inserted again when a flush failed."""
+    bulk_inserter = BulkInserter(10)
+    event_types = EventTypes(event_type="bulk_event")
+    bulk_inserter.add(event_types)
+    session = MagicMock()
+    session.execute.side_effect = OperationalError("INSERT", {}, Exception())
+
+    with pytest.raises(OperationalError):
+        bulk_inserter.flush(session)
+    assert bulk_inserter.pending_rows == 1
+
+    session.execute.side_effect = None
+    session.execute.return_value.scalars.return_value = [5]
+    bulk_inserter.flush(session)
+    assert bulk_inserter.pending_rows == 0
+    assert event_types.event_type_id == 5
+    assert session.execute.call_count == 2
+
+
+async def test_bulk_insert_disabled_by_default(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test rows are added to the session unless bulk inserts are enabled."""
+    assert recorder_mock._bulk_inserter is None
+    assert recorder_mock._async_defer_commit() is False
+
+
+@pytest.mark.parametrize("recorder_config", [{"bulk_insert": True}])
+async def test_bulk_insert_not_supported(
+    hass: HomeAssistant,
+    async_test_recorder: RecorderInstanceContextManager,
+    recorder_config: dict,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test falling back to the session when ids cannot be returned."""
+    with patch(
+        "sqlalchemy.engine.default.DefaultDialect"
+        ".insert_executemany_returning_sort_by_parameter_order",
+        False,
+    ):
+        async with async_test_recorder(hass, recorder_config) as instance:
+            assert instance._bulk_inserter is None
+            hass.states.async_set("sensor.one", "on")
+            await async_wait_recording_done(hass)
+
+    assert "does not support returning ids from bulk inserts" in caplog.text
@@ -663,3 +663,50 @@ async def test_specificly_included_entity_always_wins_over_glob(
 
     assert filtered_events_entity_ids == filter_accept
     assert not filtered_events_entity_ids.intersection(filter_reject)
+
+
+async def test_same_entity_included_excluded_with_excluded_domain(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test an included entity wins over the same excluded entity."""
+    filter_accept = {
+        "media_player.test",
+        "thermostat.test",
+    }
+    filter_reject = {
+        "media_player.test2",
+        "script.can_cancel_this_one",
+    }
+    conf = {
+        CONF_INCLUDE: {
+            CONF_ENTITIES: ["media_player.test"],
+        },
+        CONF_EXCLUDE: {
+            CONF_DOMAINS: ["script"],
+            CONF_ENTITIES: ["media_player.test", "media_player.test2"],
+        },
+    }
+
+    extracted_filter = extract_include_exclude_filter_conf(conf)
+    entity_filter = convert_include_exclude_filter(extracted_filter)
+    sqlalchemy_filter = sqlalchemy_filter_from_include_exclude_conf(extracted_filter)
+    assert sqlalchemy_filter is not None
+
+    for entity_id in filter_accept:
+        assert entity_filter(entity_id) is True
+
+    for entity_id in filter_reject:
+        assert entity_filter(entity_id) is False
+
+    (
+        filtered_states_entity_ids,
+        filtered_events_entity_ids,
+    ) = await _async_get_states_and_events_with_filter(
+        hass, sqlalchemy_filter, filter_accept | filter_reject
+    )
+
+    assert filtered_states_entity_ids == filter_accept
+    assert not filtered_states_entity_ids.intersection(filter_reject)
+
+    assert filtered_events_entity_ids == filter_accept
+    assert not filtered_events_entity_ids.intersection(filter_reject)
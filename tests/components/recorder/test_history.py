@@ -16,13 +16,15 @@ from homeassistant.components.recorder.db_schema import (
     StateAttributes,
     States,
     StatesMeta,
+    StatisticsShortTerm,
 )
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .common import (
     assert_dict_of_states_equal_without_context_and_last_changed,
@@ -124,6 +126,255 @@ async def test_significant_states_with_session_single_entity(
         assert len(states["demo.id"]) == 2
 
 
+async def test_stream_significant_states_with_session(
+    hass: HomeAssistant,
+) -> None:
+    """Test streaming significant states in columnar chunks."""
+    start = dt_util.utcnow()
+    hass.states.async_set("demo.one", "on", {"attr": 1})
+    hass.states.async_set("demo.two", "a", {"attr": 1})
+    hass.states.async_set("demo.one", "off", {"attr": 2})
+    hass.states.async_set("demo.two", "b", {"attr": 1})
+    hass.states.async_set("demo.one", "on", {"attr": 1})
+    await async_wait_recording_done(hass)
+    end = dt_util.utcnow()
+
+    with session_scope(hass=hass, read_only=True) as session:
+        chunks = list(
+            history.stream_significant_states_with_session(
+                hass,
+                session,
+                start,
+                end,
+                entity_ids=["demo.one", "demo.two"],
+                chunk_size=2,
+            )
+        )
+        assert (
+            list(
+                history.stream_significant_states_with_session(
+                    hass, session, start, end, entity_ids=["demo.never"]
+                )
+            )
+            == []
+        )
+
+    assert len(chunks) == 3
+    # Attributes are referenced by their index in the same chunk
+    assert [json_loads(json_bytes(chunk["attributes"])) for chunk in chunks] == [
+        [{"attr": 1}, {"attr": 2}],
+        [{"attr": 1}],
+        [{"attr": 1}],
+    ]
+    columns: dict[str, dict[str, list]] = {}
+    for chunk in chunks:
+        attributes = json_loads(json_bytes(chunk["attributes"]))
+        for entity_id, chunk_columns in chunk["states"].items():
+            entity_columns = columns.setdefault(entity_id, {"s": [], "lu": [], "a": []})
+            entity_columns["s"].extend(chunk_columns["s"])
+            entity_columns["lu"].extend(chunk_columns["lu"])
+            entity_columns["a"].extend(attributes[ref] for ref in chunk_columns["a"])
+
+    assert columns["demo.one"]["s"] == ["on", "off", "on"]
+    assert columns["demo.one"]["a"] == [{"attr": 1}, {"attr": 2}, {"attr": 1}]
+    assert columns["demo.two"]["s"] == ["a", "b"]
+    assert columns["demo.two"]["a"] == [{"attr": 1}, {"attr": 1}]
+    for entity_columns in columns.values():
+        assert entity_columns["lu"] == sorted(entity_columns["lu"])
+        assert all(
+            start.timestamp() < lu < end.timestamp() for lu in entity_columns["lu"]
+        )
+
+
+async def test_get_downsampled_states_with_session(
+    hass: HomeAssistant,
+) -> None:
+    """Test numeric states are reduced to time weighted buckets."""
+    start = dt_util.utcnow().replace(microsecond=0) - timedelta(minutes=1)
+    for seconds, entity_id, state in (
+        (-5, "sensor.seeded", "4"),
+        (1, "sensor.power", "1"),
+        (2, "sensor.power", "5"),
+        (3, "sensor.power", "unavailable"),
+        (4, "sensor.power", "3"),
+        (12, "sensor.power", "10"),
+        (14, "sensor.power", "20"),
+        (15, "sensor.seeded", "8"),
+    ):
+        with freeze_time(start + timedelta(seconds=seconds)):
+            hass.states.async_set(entity_id, state)
+            hass.states.async_set("sensor.text", f"text{state}")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        buckets = history.get_downsampled_states_with_session(
+            hass,
+            session,
+            start,
+            start + timedelta(seconds=20),
+            ["sensor.power", "sensor.seeded", "sensor.text", "sensor.never"],
+            2,
+        )
+
+    assert buckets == {
+        "sensor.power": [
+            {
+                "start": start.timestamp(),
+                "min": 1.0,
+                "max": 5.0,
+                # 1 for 1s, 5 for 1s, unavailable for 1s and 3 for 6s
+                "mean": 3.0,
+                "last": 3.0,
+            },
+            {
+                "start": start.timestamp() + 10,
+                "min": 3.0,
+                "max": 20.0,
+                # 3 carried in for 2s, 10 for 2s and 20 for 6s
+                "mean": 14.6,
+                "last": 20.0,
+            },
+        ],
+        "sensor.seeded": [
+            {
+                "start": start.timestamp(),
+                "min": 4.0,
+                "max": 4.0,
+                "mean": 4.0,
+                "last": 4.0,
+            },
+            {
+                "start": start.timestamp() + 10,
+                "min": 4.0,
+                "max": 8.0,
+                "mean": 6.0,
+                "last": 8.0,
+            },
+        ],
+        "sensor.text": [],
+        "sensor.never": [],
+    }
+
+
+async def test_get_downsampled_states_not_after_now(
+    hass: HomeAssistant,
+) -> None:
+    """Test the last state is not carried past now."""
+    start = dt_util.utcnow().replace(microsecond=0)
+    with freeze_time(start + timedelta(seconds=1)):
+        hass.states.async_set("sensor.power", "10")
+    await async_wait_recording_done(hass)
+
+    with (
+        freeze_time(start + timedelta(seconds=5)),
+        session_scope(hass=hass, read_only=True) as session,
+    ):
+        buckets = history.get_downsampled_states_with_session(
+            hass,
+            session,
+            start,
+            start + timedelta(seconds=20),
+            ["sensor.power"],
+            2,
+        )
+
+    assert buckets == {
+        "sensor.power": [
+            {
+                "start": start.timestamp(),
+                "min": 10.0,
+                "max": 10.0,
+                "mean": 10.0,
+                "last": 10.0,
+            },
+        ],
+    }
+
+
+async def test_get_downsampled_states_from_short_term_statistics(
+    hass: HomeAssistant,
+) -> None:
+    """Test short term statistics are used for wide buckets."""
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=1
+    )
+    recorder.get_instance(hass).async_import_statistics(
+        {
+            "has_mean": True,
+            "has_sum": False,
+            "name": None,
+            "source": "recorder",
+            "statistic_id": "sensor.power",
+            "unit_of_measurement": "W",
+        },
+        [
+            {
+                "start": start + timedelta(minutes=5 * period),
+                "mean": mean,
+                "min": mean - 1,
+                "max": mean + 1,
+            }
+            for period, mean in enumerate((10.0, 20.0, 30.0))
+        ],
+        StatisticsShortTerm,
+    )
+    for minutes, entity_id, state in (
+        (1, "sensor.other", "7"),
+        (14, "sensor.power", "50"),
+        (17, "sensor.power", "60"),
+    ):
+        with freeze_time(start + timedelta(minutes=minutes)):
+            hass.states.async_set(entity_id, state)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        buckets = history.get_downsampled_states_with_session(
+            hass,
+            session,
+            start,
+            start + timedelta(minutes=20),
+            ["sensor.power", "sensor.other"],
+            2,
+        )
+
+    assert buckets == {
+        "sensor.power": [
+            {
+                "start": start.timestamp(),
+                "min": 9.0,
+                "max": 21.0,
+                "mean": 15.0,
+                "last": 20.0,
+            },
+            {
+                "start": start.timestamp() + 600,
+                "min": 29.0,
+                "max": 60.0,
+                # The tail after the last period is filled from the states,
+                # 30 for 5 minutes, 50 for 2 minutes and 60 for 3 minutes
+                "mean": 43.0,
+                "last": 60.0,
+            },
+        ],
+        "sensor.other": [
+            {
+                "start": start.timestamp(),
+                "min": 7.0,
+                "max": 7.0,
+                "mean": 7.0,
+                "last": 7.0,
+            },
+            {
+                "start": start.timestamp() + 600,
+                "min": 7.0,
+                "max": 7.0,
+                "mean": 7.0,
+                "last": 7.0,
+            },
+        ],
+    }
+
+
 @pytest.mark.parametrize(
     ("attributes", "no_attributes", "limit"),
     [
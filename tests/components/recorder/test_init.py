@@ -1440,6 +1440,11 @@ async def test_compile_missing_statistics(
         assert len(stats_5min) == 1
         assert len(stats_hourly) == 1
 
+        catch_up = instance.statistics_catch_up
+        assert catch_up is not None
+        assert catch_up.first_period == now
+        assert catch_up.periods == catch_up.compiled == 12
+
         await async_wait_recording_done(hass)
         await async_wait_recording_done(hass)
         await hass.async_stop()
@@ -4,16 +4,23 @@ from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
 import sqlite3
-from unittest.mock import patch
+from typing import Any
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
 
 from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
-from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.const import (
+    PURGE_CURSOR_SAVE_DELAY,
+    PURGE_CURSOR_STORAGE_KEY,
+    PURGE_CURSOR_STORAGE_VERSION,
+    SupportedDialect,
+)
 from homeassistant.components.recorder.db_schema import (
     Events,
     EventTypes,
@@ -45,6 +52,7 @@ from .common import (
     convert_pending_states_to_meta,
 )
 
+from tests.common import async_fire_time_changed
 from tests.typing import RecorderInstanceContextManager
 
 TEST_EVENT_TYPES = (
@@ -110,6 +118,94 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+async def test_purge_old_data_time_budget(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a purge slice stops when it runs out of time and saves its cursor."""
+    for _ in range(4):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 6),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 6),
+    ):
+        finished = purge_old_data(
+            recorder_mock,
+            purge_before,
+            states_batch_size=5,
+            events_batch_size=5,
+            repack=False,
+            time_budget=0,
+        )
+    assert not finished
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 18
+
+    progress = recorder_mock.purge_progress
+    assert progress.in_progress
+    assert progress.purge_before == purge_before
+    assert progress.slices == 1
+    assert progress.states == 6
+
+    await hass.async_block_till_done()
+    freezer.tick(PURGE_CURSOR_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[PURGE_CURSOR_STORAGE_KEY]["data"] == {
+        "cursor": {
+            "purge_before": purge_before.isoformat(),
+            "repack": False,
+            "apply_filter": False,
+        }
+    }
+
+    finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert finished
+    assert not progress.in_progress
+    assert progress.slices == 2
+    assert progress.states == 16
+
+    await hass.async_block_till_done()
+    freezer.tick(PURGE_CURSOR_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[PURGE_CURSOR_STORAGE_KEY]["data"] == {"cursor": None}
+
+
+async def test_purge_resumes_after_restart(
+    hass: HomeAssistant,
+    async_test_recorder: RecorderInstanceContextManager,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test an unfinished purge is resumed when the recorder starts."""
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    hass_storage[PURGE_CURSOR_STORAGE_KEY] = {
+        "version": PURGE_CURSOR_STORAGE_VERSION,
+        "key": PURGE_CURSOR_STORAGE_KEY,
+        "data": {
+            "cursor": {
+                "purge_before": purge_before.isoformat(),
+                "repack": True,
+                "apply_filter": False,
+            }
+        },
+    }
+    with patch(
+        "homeassistant.components.recorder.tasks.purge.purge_old_data",
+        return_value=False,
+    ) as purge_mock:
+        async with async_test_recorder(hass):
+            await async_recorder_block_till_done(hass)
+
+    purge_mock.assert_called_with(ANY, purge_before, True, False)
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     assert recorder_mock.states_manager.oldest_ts is None
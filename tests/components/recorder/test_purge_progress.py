@@ -0,0 +1,84 @@
+"""Test tracking the progress of an incremental purge."""
+
+from datetime import timedelta
+
+from homeassistant.components.recorder.const import (
+    PURGE_BATCH_TARGET_LATENCY,
+    PURGE_MIN_BATCH_SIZE,
+)
+from homeassistant.components.recorder.purge_progress import PurgeProgress
+from homeassistant.util import dt as dt_util
+
+
+def test_batch_size_adapts_to_latency() -> None:
+    """Test the batch size shrinks on slow batches and grows on fast ones."""
+    progress = PurgeProgress(4000)
+    assert progress.batch_size == 4000
+
+    progress.add_batch(4000, 0, PURGE_BATCH_TARGET_LATENCY * 4)
+    assert progress.batch_size == 1000
+
+    progress.add_batch(0, 1000, PURGE_BATCH_TARGET_LATENCY * 1000)
+    assert progress.batch_size == PURGE_MIN_BATCH_SIZE
+
+    # A batch without rows says nothing about the latency of deletes
+    progress.add_batch(0, 0, 0.0)
+    assert progress.batch_size == PURGE_MIN_BATCH_SIZE
+
+    progress.add_batch(PURGE_MIN_BATCH_SIZE, 0, PURGE_BATCH_TARGET_LATENCY / 4)
+    assert progress.batch_size == PURGE_MIN_BATCH_SIZE * 2
+
+    for _ in range(10):
+        progress.add_batch(1, 0, 0.0)
+    assert progress.batch_size == 4000
+
+    progress.set_max_batch_size(500)
+    assert progress.batch_size == 500
+
+    assert progress.batches == 14
+    assert progress.states == 4000 + PURGE_MIN_BATCH_SIZE + 10
+    assert progress.events == 1000
+
+
+def test_progress_and_cursor() -> None:
+    """Test the progress is reset for a new purge and the cursor while it runs."""
+    progress = PurgeProgress(4000)
+    assert not progress.in_progress
+    assert progress.as_cursor() is None
+    assert progress.rows_per_second == 0.0
+
+    purge_before = dt_util.utcnow() - timedelta(days=10)
+    progress.start(purge_before, False, True)
+    progress.add_batch(100, 50, 0.1)
+    progress.add_slice(1.5, False)
+    assert progress.in_progress
+    assert progress.as_cursor() == {
+        "purge_before": purge_before.isoformat(),
+        "repack": False,
+        "apply_filter": True,
+    }
+
+    # Resuming the same purge keeps the progress
+    progress.start(purge_before, False, True)
+    progress.add_slice(1.5, True)
+    assert not progress.in_progress
+    assert progress.as_cursor() is None
+    assert progress.as_dict() | {"started": None, "finished": None} == {
+        "in_progress": False,
+        "purge_before": purge_before,
+        "started": None,
+        "finished": None,
+        "slices": 2,
+        "batches": 1,
+        "batch_size": 4000,
+        "states": 100,
+        "events": 50,
+        "duration": 3.0,
+        "rows_per_second": 50.0,
+        "last_batch_latency": 0.1,
+        "last_slice_duration": 1.5,
+    }
+
+    progress.start(purge_before, False, True)
+    assert progress.in_progress
+    assert progress.slices == progress.states == progress.events == 0
@@ -0,0 +1,137 @@
+"""Test the read query scheduler."""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.const import ReadQueryKind
+from homeassistant.components.recorder.read_pool import (
+    ReadQueryScheduler,
+    add_read_rows,
+)
+from homeassistant.core import HomeAssistant
+
+from tests.typing import RecorderInstanceContextManager
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceContextManager,
+) -> None:
+    """Set up recorder."""
+
+
+async def test_read_jobs_are_scheduled_fairly(hass: HomeAssistant) -> None:
+    """Test queries of each kind are run in turn."""
+    release = threading.Event()
+    order: list[str] = []
+
+    def _query(name: str) -> list[int]:
+        release.wait(5)
+        order.append(name)
+        return [1, 2]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        scheduler = ReadQueryScheduler(hass, executor, 1)
+        futures = [
+            scheduler.async_add_job(ReadQueryKind.HISTORY, _query, "history_1"),
+            scheduler.async_add_job(ReadQueryKind.HISTORY, _query, "history_2"),
+            scheduler.async_add_job(ReadQueryKind.HISTORY, _query, "history_3"),
+            scheduler.async_add_job(ReadQueryKind.LOGBOOK, _query, "logbook_1"),
+            scheduler.async_add_job(ReadQueryKind.STATISTICS, _query, "statistics_1"),
+        ]
+        assert scheduler.queued == 4
+        release.set()
+        for future in futures:
+            assert await future == [1, 2]
+
+    assert order == [
+        "history_1",
+        "logbook_1",
+        "statistics_1",
+        "history_2",
+        "history_3",
+    ]
+    info = scheduler.async_info()
+    assert info["running"] == 0
+    assert info["queued"] == 0
+    assert info["kinds"]["history"]["queries"] == 3
+    assert info["kinds"]["history"]["rows"] == 6
+    assert info["kinds"]["logbook"]["queries"] == 1
+    assert len(info["recent"]) == 5
+
+
+async def test_read_job_errors_and_cancellation(hass: HomeAssistant) -> None:
+    """Test errors are passed on and cancelled queries are skipped."""
+    release = threading.Event()
+    calls: list[str] = []
+
+    def _query(name: str) -> dict[str, list[int]]:
+        release.wait(5)
+        calls.append(name)
+        if name == "fails":
+            raise ValueError(name)
+        return {"sensor.one": [1, 2], "sensor.two": [3]}
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        scheduler = ReadQueryScheduler(hass, executor, 1)
+        failing = scheduler.async_add_job(ReadQueryKind.HISTORY, _query, "fails")
+        cancelled = scheduler.async_add_job(ReadQueryKind.HISTORY, _query, "skip")
+        succeeding = scheduler.async_add_job(ReadQueryKind.HISTORY, _query, "works")
+        cancelled.cancel()
+        release.set()
+        with pytest.raises(ValueError):
+            await failing
+        assert await succeeding == {"sensor.one": [1, 2], "sensor.two": [3]}
+
+    assert calls == ["fails", "works"]
+    stats = scheduler.stats[ReadQueryKind.HISTORY]
+    assert stats.queries == 2
+    assert stats.failed == 1
+    assert stats.rows == 3
+
+
+async def test_recorder_read_job(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test read jobs run on the read executor of the recorder."""
+
+    def _thread_name() -> str:
+        return threading.current_thread().name
+
+    thread_name = await recorder_mock.async_add_read_job(
+        ReadQueryKind.LOGBOOK, _thread_name
+    )
+    assert thread_name.startswith("DbReader")
+    assert recorder_mock.read_query_scheduler is not None
+    assert recorder_mock.read_query_scheduler.stats[ReadQueryKind.LOGBOOK].queries == 1
+
+
+async def test_read_job_reports_rows(hass: HomeAssistant) -> None:
+    """Test queries with serialized results report their rows."""
+
+    def _serialized() -> bytes:
+        add_read_rows(2)
+        add_read_rows(3)
+        return b"[1, 2, 3, 4, 5]"
+
+    def _reduced() -> tuple[float, bytes]:
+        add_read_rows(0)
+        return 1.0, b"[]"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        scheduler = ReadQueryScheduler(hass, executor, 1)
+        assert (
+            await scheduler.async_add_job(ReadQueryKind.HISTORY, _serialized)
+            == b"[1, 2, 3, 4, 5]"
+        )
+        assert await scheduler.async_add_job(ReadQueryKind.LOGBOOK, _reduced) == (
+            1.0,
+            b"[]",
+        )
+        # Rows reported outside of a read job are ignored
+        await hass.async_add_executor_job(add_read_rows, 10)
+
+    assert scheduler.stats[ReadQueryKind.HISTORY].rows == 5
+    assert scheduler.stats[ReadQueryKind.LOGBOOK].rows == 0
+    assert [job.rows for job in scheduler.recent] == [5, 0]
@@ -1,15 +1,20 @@
 """The tests for sensor recorder platform."""
 
-from datetime import timedelta
+from collections.abc import Iterator
+from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsRuns,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -2561,6 +2566,54 @@ async def test_recorder_platform_with_statistics(
     recorder_platform.validate_statistics.assert_called_once_with(hass)
 
 
+async def test_compile_missing_statistics_hourly_batches(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test missed periods are compiled from batches of at most one hour."""
+    instance = recorder.get_instance(hass)
+    batches: list[tuple[datetime, datetime]] = []
+
+    def _mock_compile_statistics_batch(
+        hass: HomeAssistant, session: Session, start: datetime, end: datetime
+    ) -> Iterator[PlatformCompiledStatistics]:
+        batches.append((start, end))
+        while start < end:
+            yield PlatformCompiledStatistics([], {})
+            start += timedelta(minutes=5)
+
+    recorder_platform = Mock(
+        spec=["compile_statistics_batch"],
+        compile_statistics_batch=_mock_compile_statistics_batch,
+    )
+    await _setup_mock_domain(hass, recorder_platform)
+    await async_recorder_block_till_done(hass)
+
+    now = dt_util.utcnow()
+    last_period = now.replace(
+        minute=now.minute - now.minute % 5, second=0, microsecond=0
+    )
+    last_run = last_period - timedelta(minutes=155)
+
+    def _set_last_run() -> None:
+        with session_scope(hass=hass) as session:
+            session.query(StatisticsRuns).delete()
+            session.add(StatisticsRuns(start=last_run))
+
+    await instance.async_add_executor_job(_set_last_run)
+    await instance.async_add_executor_job(
+        statistics.compile_missing_statistics, instance
+    )
+
+    first_period = last_run + timedelta(minutes=5)
+    assert batches == [
+        (first_period, first_period + timedelta(hours=1)),
+        (first_period + timedelta(hours=1), first_period + timedelta(hours=2)),
+        (first_period + timedelta(hours=2), last_period),
+    ]
+    assert instance.statistics_catch_up.periods == 30
+    assert instance.statistics_catch_up.compiled == 30
+
+
 async def test_recorder_platform_without_statistics(
     hass: HomeAssistant,
     setup_recorder: None,
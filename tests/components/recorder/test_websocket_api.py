@@ -14,6 +14,7 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.db_schema import Statistics, StatisticsShortTerm
 from homeassistant.components.recorder.statistics import (
+    StatisticsCatchUpProgress,
     async_add_external_statistics,
     get_last_statistics,
     get_latest_short_term_statistics_with_session,
@@ -32,6 +33,7 @@ from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
 
 from .common import (
     async_recorder_block_till_done,
+    async_wait_purge_done,
     async_wait_recording_done,
     create_engine_test,
     do_adhoc_statistics,
@@ -2569,6 +2571,100 @@ async def test_recorder_info(
     }
 
 
+async def test_recorder_read_queries(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the statistics of the read-only queries."""
+    client = await hass_ws_client()
+    now = dt_util.utcnow()
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id(
+        {
+            "type": "recorder/statistics_during_period",
+            "start_time": now.isoformat(),
+            "statistic_ids": ["sensor.test"],
+            "period": "hour",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    await client.send_json_auto_id({"type": "recorder/read_queries"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["workers"] == 4
+    assert result["queued"] == 0
+    assert result["kinds"]["statistics"]["queries"] == 1
+    assert result["kinds"]["history"]["queries"] == 0
+    assert result["recent"] == [
+        {
+            "kind": "statistics",
+            "name": "_ws_get_statistics_during_period",
+            "duration": ANY,
+            "queue_wait": ANY,
+            "rows": 0,
+            "failed": False,
+        }
+    ]
+
+
+async def test_recorder_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the progress of the purge."""
+    client = await hass_ws_client()
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["in_progress"] is False
+    assert response["result"]["slices"] == 0
+
+    await hass.services.async_call("recorder", "purge", {"keep_days": 0}, blocking=True)
+    await async_wait_purge_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["in_progress"] is False
+    assert result["slices"] == 1
+    assert result["purge_before"] is not None
+    assert result["finished"] is not None
+
+
+async def test_recorder_statistics_catch_up(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the progress of compiling missed statistics."""
+    client = await hass_ws_client()
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/statistics_catch_up"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    first_period = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    recorder_mock.statistics_catch_up = StatisticsCatchUpProgress(
+        first_period, 12, compiled=6, duration=2.0
+    )
+    await client.send_json_auto_id({"type": "recorder/statistics_catch_up"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "first_period": first_period.isoformat(),
+        "periods": 12,
+        "compiled": 6,
+        "duration": 2.0,
+        "periods_per_second": 3.0,
+        "remaining_seconds": 2.0,
+    }
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
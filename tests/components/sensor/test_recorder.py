@@ -36,6 +36,11 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor.recorder import (
+    _time_weighted_average,
+    compile_statistics,
+    compile_statistics_batch,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
@@ -5506,3 +5511,69 @@ async def test_clean_up_repairs(
         ("sensor", "test_issue_1"),
         ("sensor", "test_issue_2"),
     }
+
+
+async def test_compile_statistics_batch(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test compiling a batch of periods matches compiling every period."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    await async_record_meter_states(
+        hass,
+        freezer,
+        zero,
+        "sensor.energy",
+        ENERGY_SENSOR_ATTRIBUTES,
+        ["10", "15", "20", "10", "30", "40", "50", "60", "90"],
+    )
+    await async_record_states(
+        hass, freezer, zero, "sensor.power", POWER_SENSOR_ATTRIBUTES
+    )
+    freezer.move_to(zero + timedelta(minutes=20))
+    await async_wait_recording_done(hass)
+    periods = [zero + timedelta(minutes=5 * i) for i in range(3)]
+
+    def _compile() -> tuple[list, list]:
+        with session_scope(hass=hass, read_only=True) as session:
+            per_period = [
+                compile_statistics(hass, session, start, start + timedelta(minutes=5))
+                for start in periods
+            ]
+            batch = list(
+                compile_statistics_batch(
+                    hass, session, zero, zero + timedelta(minutes=15)
+                )
+            )
+        return per_period, batch
+
+    per_period, batch = await get_instance(hass).async_add_executor_job(_compile)
+    assert len(batch) == 3
+    assert batch == per_period
+    assert {
+        stat["meta"]["statistic_id"]
+        for compiled in batch
+        for stat in compiled.platform_stats
+    } == {"sensor.energy", "sensor.power"}
+
+
+@pytest.mark.parametrize(
+    ("timestamps", "values", "expected"),
+    [
+        # The last known state before the start counts from the start
+        ([50.0, 150.0], [10.0, 20.0], 15.0),
+        # States before the start are superseded by later ones
+        ([10.0, 50.0, 150.0], [99.0, 10.0, 20.0], 15.0),
+        # Without a last known state the period starts with the first state
+        ([150.0, 175.0], [10.0, 20.0], 15.0),
+        # A single state at the end of the period
+        ([200.0], [10.0], 0.0),
+    ],
+)
+def test_time_weighted_average(
+    timestamps: list[float], values: list[float], expected: float
+) -> None:
+    """Test calculating a time weighted average from timestamps and values."""
+    assert _time_weighted_average(timestamps, values, 100.0, 200.0) == expected
@@ -17,6 +17,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.commands import ENTITIES_SNAPSHOT
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -1359,6 +1360,34 @@ async def test_render_template_renders_template(
     }
 
 
+async def test_render_template_load(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test getting the render load of the tracked templates."""
+    hass.states.async_set("light.test", "on")
+    await websocket_client.send_json_auto_id(
+        {"type": "render_template", "template": "{{ states('light.test') }}"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["result"] == "on"
+
+    await websocket_client.send_json_auto_id({"type": "render_template/load"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    load = msg["result"]
+    assert load["trackers"] == 1
+    assert load["renders"] >= 1
+    assert load["templates"]["{{ states('light.test') }}"]["renders"] >= 1
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json_auto_id({"type": "render_template/load"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_render_template_with_timeout_and_variables(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2917,3 +2946,34 @@ async def test_subscribe_entities_chained_state_change(
 
     await websocket_client.close()
     await hass.async_block_till_done()
+
+
+async def test_subscribe_entities_shares_snapshot(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test subscribers to all entities share the serialized snapshot."""
+    hass.states.async_set("light.one", "on", {"color": "red"})
+    hass.states.async_set("light.two", "off")
+    clients = [await hass_ws_client(hass) for _ in range(3)]
+
+    async def _subscribe(client: MockHAClientWebSocket) -> dict[str, Any]:
+        await client.send_json_auto_id({"type": "subscribe_entities"})
+        msg = await client.receive_json()
+        assert msg["success"]
+        msg = await client.receive_json()
+        return msg["event"]["a"]
+
+    first = await _subscribe(clients[0])
+    assert set(first) == {"light.one", "light.two"}
+    snapshot = hass.data[ENTITIES_SNAPSHOT]
+    buffer = snapshot.async_get_buffer()
+    assert await _subscribe(clients[1]) == first
+    assert snapshot.async_get_buffer() is buffer
+
+    hass.states.async_set("light.one", "off", {"color": "red"})
+    hass.states.async_remove("light.two")
+    hass.states.async_set("light.three", "on")
+    entities = await _subscribe(clients[2])
+    assert set(entities) == {"light.one", "light.three"}
+    assert entities["light.one"]["s"] == "off"
+    assert snapshot.async_get_buffer() is not buffer
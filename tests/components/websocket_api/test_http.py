@@ -6,10 +6,12 @@ from typing import Any, cast
 from unittest.mock import patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
+from aiohttp.http_websocket import WebSocketWriter
 import pytest
 
 from homeassistant.components.websocket_api import (
     async_register_command,
+    async_response,
     const,
     http,
     websocket_command,
@@ -17,6 +19,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -46,6 +49,20 @@ async def test_pending_msg_overflow(
     assert msg.type is WSMsgType.CLOSE
 
 
+async def test_pending_msg_bytes_overflow(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test pending message bytes overflows."""
+    with patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG_BYTES", 64):
+        for idx in range(10):
+            await websocket_client.send_json({"id": idx + 1, "type": "ping"})
+        msg = await websocket_client.receive()
+        assert msg.type is WSMsgType.CLOSE
+    assert "Reached 64 pending bytes" in caplog.text
+
+
 async def test_cleanup_on_cancellation(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -523,3 +540,157 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+@pytest.mark.parametrize("payload_size", [10, 200, 70000])
+async def test_coalesced_frame_sizes(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, payload_size: int
+) -> None:
+    """Test coalesced messages are written as a single frame of any size."""
+
+    @callback
+    @websocket_command({"type": "send_many"})
+    def send_many(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        for idx in range(3):
+            connection.send_result(msg["id"], {"idx": idx, "data": "x" * payload_size})
+
+    async_register_command(hass, send_many)
+    websocket_client = await hass_ws_client(hass)
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+
+    await websocket_client.send_json({"id": 2, "type": "send_many"})
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.TEXT
+    results = json_loads(msg.data)
+    assert [result["result"]["idx"] for result in results] == [0, 1, 2]
+    assert all(len(result["result"]["data"]) == payload_size for result in results)
+
+    await websocket_client.send_json({"id": 3, "type": "connection/writer_stats"})
+    msg = await websocket_client.receive_json()
+    stats = msg["result"]
+    assert stats["queue_depth"] == 0
+    assert stats["queue_bytes"] == 0
+    # The supported_features result was sent on its own
+    assert stats["messages"] == 4
+    assert stats["frames"] == 2
+    assert stats["bytes"] > 3 * payload_size
+    assert stats["peak_queue_depth"] == 3
+    assert stats["peak_queue_bytes"] > 3 * payload_size
+    assert stats["max_flush_latency"] >= stats["last_flush_latency"] >= 0
+
+
+async def test_coalesce_while_socket_not_writable(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test messages are held back and coalesced while the socket is not writable."""
+    writable = True
+
+    class _Transport:
+        """Transport that reports a write buffer until it is writable."""
+
+        def __init__(self, transport: asyncio.Transport) -> None:
+            self._transport = transport
+
+        def __getattr__(self, name: str) -> Any:
+            return getattr(self._transport, name)
+
+        def get_write_buffer_size(self) -> int:
+            return 0 if writable else 1
+
+    def _transport(request: web.BaseRequest) -> _Transport | None:
+        if (transport := request._protocol.transport) is None:
+            return None
+        return _Transport(transport)
+
+    @callback
+    def _send_later(connection: ActiveConnection, msg_id: int) -> None:
+        nonlocal writable
+        for idx in (1, 2):
+            connection.send_result(msg_id, {"idx": idx})
+        writable = True
+
+    @callback
+    @websocket_command({"type": "send_while_not_writable"})
+    def send_while_not_writable(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        nonlocal writable
+        writable = False
+        connection.send_result(msg["id"], {"idx": 0})
+        hass.loop.call_later(0.02, _send_later, connection, msg["id"])
+
+    async_register_command(hass, send_while_not_writable)
+    with patch.object(web.BaseRequest, "transport", property(_transport)):
+        websocket_client = await hass_ws_client(hass)
+        await websocket_client.send_json(
+            {
+                "id": 1,
+                "type": "supported_features",
+                "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+            }
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"] is True
+
+        await websocket_client.send_json({"id": 2, "type": "send_while_not_writable"})
+        msg = await websocket_client.receive()
+        results = json_loads(msg.data)
+        assert [result["result"]["idx"] for result in results] == [0, 1, 2]
+
+        await websocket_client.send_json({"id": 3, "type": "connection/writer_stats"})
+        msg = await websocket_client.receive_json()
+    assert msg["result"]["writability_waits"] == 1
+    assert msg["result"]["frames"] == 2
+
+
+async def test_drained_waits_until_written(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test waiting for the queued messages to be written to the socket."""
+    release = asyncio.Event()
+    drained_before_write: list[bool] = []
+    send_frame = WebSocketWriter.send_frame
+
+    async def _send_frame(
+        self: WebSocketWriter, message: bytes, opcode: int, compress: int | None = None
+    ) -> None:
+        if b"blocked" in message:
+            # The client is not reading
+            await release.wait()
+        await send_frame(self, message, opcode, compress)
+
+    @websocket_command({"type": "send_and_drain"})
+    @async_response
+    async def send_and_drain(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        connection.send_result(msg["id"], "blocked")
+        drained = hass.async_create_task(connection.async_drained())
+        await asyncio.sleep(0.05)
+        drained_before_write.append(drained.done())
+        release.set()
+        await drained
+        # Nothing is queued, so there is nothing to wait for
+        await connection.async_drained()
+        connection.send_event(msg["id"], "drained")
+
+    async_register_command(hass, send_and_drain)
+    with patch.object(WebSocketWriter, "send_frame", _send_frame):
+        websocket_client = await hass_ws_client(hass)
+        await websocket_client.send_json({"id": 1, "type": "send_and_drain"})
+        msg = await websocket_client.receive_json()
+        assert msg["result"] == "blocked"
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == "drained"
+
+    assert drained_before_write == [False]
@@ -0,0 +1,84 @@
+"""Test delivering live streams in batches."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from homeassistant.components import websocket_api
+from homeassistant.components.websocket_api.const import (
+    STREAM_BACKPRESSURE_PENDING_MSG,
+    STREAM_MAX_COALESCE_TIME,
+)
+from homeassistant.core import HomeAssistant
+
+_real_sleep = asyncio.sleep
+
+
+async def _yield() -> None:
+    """Let the stream task run while asyncio.sleep is patched."""
+    for _ in range(3):
+        await _real_sleep(0)
+
+
+async def test_stream_batches(hass: HomeAssistant) -> None:
+    """Test items are sent in batches and stale items are skipped."""
+    connection = Mock(pending_messages=Mock(return_value=0))
+    stream_queue: asyncio.Queue[int] = asyncio.Queue()
+    sleep = AsyncMock()
+
+    def _build_message(items: list[int]) -> bytes | None:
+        if items == [4]:
+            return None
+        return ",".join(str(item) for item in items).encode()
+
+    with patch("homeassistant.components.websocket_api.stream.asyncio.sleep", sleep):
+        task = asyncio.create_task(
+            websocket_api.async_stream_batches(
+                connection, stream_queue, lambda item: item == 0, _build_message, 0.1
+            )
+        )
+        for item in (0, 1, 2, 3):
+            stream_queue.put_nowait(item)
+        await _yield()
+        await _yield()
+        stream_queue.put_nowait(4)
+        await _yield()
+        await _yield()
+        task.cancel()
+
+    assert [call.args[0] for call in connection.send_message.mock_calls] == [b"1,2,3"]
+    assert [call.args[0] for call in sleep.mock_calls] == [0.1, 0.1]
+
+
+async def test_stream_batches_backpressure(hass: HomeAssistant) -> None:
+    """Test batches are collected for longer while the client falls behind."""
+    pending_messages = [STREAM_BACKPRESSURE_PENDING_MSG] * 5 + [0, 0]
+    connection = Mock(pending_messages=Mock(side_effect=pending_messages))
+    stream_queue: asyncio.Queue[int] = asyncio.Queue()
+    sleep = AsyncMock()
+
+    with patch("homeassistant.components.websocket_api.stream.asyncio.sleep", sleep):
+        task = asyncio.create_task(
+            websocket_api.async_stream_batches(
+                connection,
+                stream_queue,
+                lambda item: False,
+                lambda items: b"batch",
+                1.0,
+            )
+        )
+        for item in range(7):
+            stream_queue.put_nowait(item)
+            await _yield()
+            await _yield()
+        task.cancel()
+
+    assert [call.args[0] for call in sleep.mock_calls] == [
+        1.0,
+        2.0,
+        4.0,
+        STREAM_MAX_COALESCE_TIME,
+        STREAM_MAX_COALESCE_TIME,
+        STREAM_MAX_COALESCE_TIME,
+        1.0,
+    ]
+    assert len(connection.send_message.mock_calls) == 7
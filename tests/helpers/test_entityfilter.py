@@ -4,6 +4,7 @@ from homeassistant.helpers.entityfilter import (
     FILTER_SCHEMA,
     INCLUDE_EXCLUDE_FILTER_SCHEMA,
     EntityFilter,
+    combine_filter_matchers,
     generate_filter,
 )
 
@@ -280,6 +281,18 @@ def test_exclude_glob_case5_include_strong() -> None:
     assert testfilter("sun.sun") is True
 
 
+def test_exclude_domain_case5_include_strong() -> None:
+    """Test case 5 - an included entity wins over the same excluded entity."""
+    testfilter = generate_filter(
+        [], ["sensor.both"], ["binary_sensor"], ["sensor.both", "sensor.excluded"]
+    )
+
+    assert testfilter("sensor.both") is True
+    assert testfilter("sensor.excluded") is False
+    assert testfilter("sensor.test") is True
+    assert testfilter("binary_sensor.test") is False
+
+
 def test_no_domain_case6() -> None:
     """Test case 6 - include and exclude specified, with no domains."""
     incl_dom = {}
@@ -479,3 +492,28 @@ def test_complex_include_exclude_filter() -> None:
     }
     filt: EntityFilter = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
     assert filt("switch.espresso_keuken") is True
+
+
+def test_combine_filter_matchers() -> None:
+    """Test the predicate structure shared with the recorder filters."""
+
+    def combine(**matchers: str) -> str | None:
+        return combine_filter_matchers(
+            matchers.get("i_d"),
+            matchers.get("i_e"),
+            matchers.get("i_g"),
+            matchers.get("e_d"),
+            matchers.get("e_e"),
+            matchers.get("e_g"),
+            any_of=lambda *items: f"({' | '.join(items)})",
+            all_of=lambda *items: f"({' & '.join(items)})",
+            negate=lambda item: f"~{item}",
+        )
+
+    assert combine() is None
+    assert combine(i_d="D", i_e="E") == "(E | D)"
+    assert combine(e_g="G") == "~G"
+    assert combine(i_d="D", i_e="E", e_e="X", e_g="Y") == ("(E | (~X & (~Y & D)))")
+    assert combine(i_g="G", e_e="X") == "(~X & G)"
+    assert combine(i_e="E", e_d="D", e_e="X") == "(E | ~(X | D))"
+    assert combine(i_e="E", e_e="X") == "E"
@@ -30,6 +30,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_template_render_scheduler,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -3183,6 +3184,176 @@ async def test_async_track_template_result_multiple_templates(
     ]
 
 
+async def test_async_track_template_result_skips_unchanged_reads(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates are not rendered when the states they read did not change."""
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "2")
+    template = Template(
+        "{{ states.sensor | selectattr('entity_id', 'eq', 'sensor.one')"
+        " | map(attribute='state') | list }}",
+        hass,
+    )
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.append([update.result for update in updates])
+
+    async_track_template_result(
+        hass, [TrackTemplate(template, None, 0)], refresh_listener
+    )
+    await hass.async_block_till_done()
+    renders = template.render_stats["renders"]
+
+    # Only the entity id of sensor.two is read
+    hass.states.async_set("sensor.two", "3")
+    # The state of sensor.one is read, but not its attributes
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "kW"})
+    await hass.async_block_till_done()
+    assert template.render_stats["renders"] == renders
+    assert template.render_stats["skipped_renders"] == 2
+    assert refresh_runs == []
+
+    hass.states.async_set("sensor.one", "4")
+    await hass.async_block_till_done()
+    assert template.render_stats["renders"] > renders
+    assert refresh_runs == [[["4"]]]
+    renders = template.render_stats["renders"]
+
+    # Adding a state to the domain changes what is iterated
+    hass.states.async_set("sensor.three", "5")
+    await hass.async_block_till_done()
+    assert template.render_stats["renders"] > renders
+    assert template.render_stats["skipped_renders"] == 2
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states.sensor | list }}",
+        "{{ states | list }}",
+        "{{ states.sensor.one | string }}",
+        "{{ states.sensor.one }}",
+    ],
+)
+async def test_async_track_template_result_stringified_states(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test templates rendering whole state objects are rendered on changes."""
+    hass.states.async_set("sensor.one", "1")
+    template = Template(template_str, hass)
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.append([update.result for update in updates])
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template, None, 0)], refresh_listener
+    )
+    info.async_refresh()
+    await hass.async_block_till_done()
+    refresh_runs.clear()
+
+    hass.states.async_set("sensor.one", "2")
+    await hass.async_block_till_done()
+    assert len(refresh_runs) == 1
+    assert "sensor.one=2" in str(refresh_runs[0][0])
+    assert template.render_stats["skipped_renders"] == 0
+
+
+async def test_async_track_template_result_shared_renders(
+    hass: HomeAssistant,
+) -> None:
+    """Test equal templates of different trackers share a render."""
+    hass.states.async_set("sensor.one", "1")
+    templates = [Template("{{ states('sensor.one') }}", hass) for _ in range(2)]
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.extend((update.template, update.result) for update in updates)
+
+    for template in templates:
+        async_track_template_result(
+            hass, [TrackTemplate(template, None)], refresh_listener
+        )
+    await hass.async_block_till_done()
+    scheduler = async_template_render_scheduler(hass)
+    renders = scheduler.renders
+
+    hass.states.async_set("sensor.one", "2")
+    await hass.async_block_till_done()
+    assert refresh_runs == [(templates[0], 2), (templates[1], 2)]
+    assert refresh_runs[1][0] is templates[1]
+    assert scheduler.renders == renders + 1
+    assert scheduler.shared_renders == 1
+
+    load = scheduler.async_render_load()
+    assert load["trackers"] == 2
+    assert load["shared_renders"] == 1
+    assert load["render_time"] > 0
+    template_load = load["templates"]["{{ states('sensor.one') }}"]
+    assert template_load["skipped_renders"] == 1
+    assert 0 < template_load["render_time"] <= load["render_time"]
+
+
+async def test_async_track_template_result_shared_rate_limit_ticks(
+    hass: HomeAssistant,
+) -> None:
+    """Test rate limited refreshes of different trackers run in a shared tick."""
+    templates = [
+        Template("{{ states.sensor | count }}", hass),
+        Template("{{ states.sensor | list | count }}", hass),
+    ]
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.extend(update.result for update in updates)
+
+    for template in templates:
+        async_track_template_result(
+            hass, [TrackTemplate(template, None, 0.05)], refresh_listener
+        )
+    await hass.async_block_till_done()
+    scheduler = async_template_render_scheduler(hass)
+
+    hass.states.async_set("sensor.one", "any")
+    await hass.async_block_till_done()
+    assert refresh_runs == [1, 1]
+    hass.states.async_set("sensor.two", "any")
+    await hass.async_block_till_done()
+    assert refresh_runs == [1, 1]
+
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+    assert refresh_runs == [1, 1, 2, 2]
+
+    load = scheduler.async_render_load()
+    assert load["rate_limit_ticks"] == 1
+    assert load["rate_limited_renders"] == 2
+    assert load["deferred_renders"] == 0
+    assert set(load["templates"]) == {
+        "{{ states.sensor | count }}",
+        "{{ states.sensor | list | count }}",
+    }
+
+
 async def test_async_track_template_result_multiple_templates_mixing_domain(
     hass: HomeAssistant,
 ) -> None:
@@ -8,11 +8,12 @@ from unittest.mock import Mock, patch
 import pytest
 
 from homeassistant import loader
-from homeassistant.const import EVENT_COMPONENT_LOADED
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
+    async_process_lazy_integration_platforms,
 )
 from homeassistant.setup import ATTR_COMPONENT
 
@@ -288,3 +289,101 @@ async def test_process_integration_platforms_no_integrations(
     await hass.async_block_till_done()
 
     assert len(processed) == 0
+
+
+async def test_process_lazy_integration_platforms(hass: HomeAssistant) -> None:
+    """Test lazy integration platforms are processed on first use."""
+    hass.config.lazy_platforms = True
+    hass.set_state(CoreState.starting)
+    loaded_platform = Mock()
+    mock_platform(hass, "loaded.platform_to_check", loaded_platform)
+    hass.config.components.add("loaded")
+
+    event_platform = Mock()
+    mock_platform(hass, "event.platform_to_check", event_platform)
+
+    processed = []
+
+    async def _process_platform(
+        hass: HomeAssistant, domain: str, platform: Any
+    ) -> None:
+        """Process platform."""
+        processed.append((domain, platform))
+
+    await async_process_integration_platforms(
+        hass, "platform_to_check", _process_platform, lazy=True
+    )
+    assert "platform_to_check" not in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+    await hass.async_block_till_done()
+    assert processed == []
+
+    await async_process_lazy_integration_platforms(hass, "platform_to_check")
+    assert sorted(processed) == [("event", event_platform), ("loaded", loaded_platform)]
+
+    # Nothing left to process
+    await async_process_lazy_integration_platforms(hass, "platform_to_check")
+    assert len(processed) == 2
+
+
+async def test_process_lazy_integration_platforms_after_started(
+    hass: HomeAssistant,
+) -> None:
+    """Test lazy integration platforms not used during startup are processed."""
+    hass.config.lazy_platforms = True
+    hass.set_state(CoreState.starting)
+    loaded_platform = Mock()
+    mock_platform(hass, "loaded.platform_to_check", loaded_platform)
+    hass.config.components.add("loaded")
+
+    event_platform = Mock()
+    mock_platform(hass, "event.platform_to_check", event_platform)
+
+    processed = []
+
+    async def _process_platform(
+        hass: HomeAssistant, domain: str, platform: Any
+    ) -> None:
+        """Process platform."""
+        processed.append((domain, platform))
+
+    await async_process_integration_platforms(
+        hass, "platform_to_check", _process_platform, lazy=True
+    )
+    await hass.async_block_till_done()
+    assert processed == []
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert processed == [("loaded", loaded_platform)]
+
+    # Once started, lazy platforms are processed as integrations are loaded
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+    await hass.async_block_till_done()
+    assert processed == [("loaded", loaded_platform), ("event", event_platform)]
+
+
+async def test_process_lazy_integration_platforms_not_enabled(
+    hass: HomeAssistant,
+) -> None:
+    """Test lazy integration platforms are processed directly when not enabled."""
+    hass.set_state(CoreState.starting)
+    loaded_platform = Mock()
+    mock_platform(hass, "loaded.platform_to_check", loaded_platform)
+    hass.config.components.add("loaded")
+
+    processed = []
+
+    async def _process_platform(
+        hass: HomeAssistant, domain: str, platform: Any
+    ) -> None:
+        """Process platform."""
+        processed.append((domain, platform))
+
+    await async_process_integration_platforms(
+        hass, "platform_to_check", _process_platform, lazy=True
+    )
+    await hass.async_block_till_done()
+    assert processed == [("loaded", loaded_platform)]
+    assert "platform_to_check" in hass.data[loader.DATA_PRELOAD_PLATFORMS]
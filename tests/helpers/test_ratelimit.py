@@ -90,3 +90,70 @@ async def test_no_limit(hass: HomeAssistant) -> None:
     assert not refresh_called
     assert not rate_limiter.async_has_timer("key1")
     rate_limiter.async_remove()
+
+
+async def test_shared_ticks(hass: HomeAssistant) -> None:
+    """Test actions that are due close together run in a shared tick."""
+    calls = []
+    scheduler = ratelimit.RateLimitScheduler(hass, tick=0.05)
+
+    scheduler.async_call_later(0.01, calls.append, 1)
+    scheduler.async_call_later(0.005, calls.append, 2)
+    scheduler.async_call_later(0.008, calls.append, 3).cancel()
+    # Postpones the tick until it is due
+    scheduler.async_call_later(0.04, calls.append, 4)
+    scheduler.async_call_later(0.2, calls.append, 5)
+
+    await asyncio.sleep(0.02)
+    assert calls == []
+    await asyncio.sleep(0.05)
+    assert calls == [1, 2, 4]
+    assert scheduler.ticks == 1
+
+    await asyncio.sleep(0.2)
+    assert calls == [1, 2, 4, 5]
+    assert scheduler.ticks == 2
+    assert scheduler.actions == 4
+
+
+async def test_shared_ticks_keyed_rate_limit(hass: HomeAssistant) -> None:
+    """Test keyed rate limits defer their actions to the shared ticks."""
+    calls = []
+    scheduler = ratelimit.RateLimitScheduler(hass, tick=0.05)
+    rate_limiter = ratelimit.KeyedRateLimit(hass, scheduler)
+    now = time.time()
+    rate_limiter.async_triggered("key1", now)
+    rate_limiter.async_triggered("key2", now)
+
+    assert rate_limiter.async_schedule_action("key1", 0.01, now, calls.append, 1)
+    assert rate_limiter.async_schedule_action("key2", 0.005, now, calls.append, 2)
+    assert rate_limiter.async_has_timer("key1")
+
+    await asyncio.sleep(0.05)
+    assert calls == [1, 2]
+    assert scheduler.ticks == 1
+
+    rate_limiter.async_triggered("key1", time.time())
+    assert rate_limiter.async_schedule_action(
+        "key1", 0.01, time.time(), calls.append, 3
+    )
+    rate_limiter.async_remove()
+    await asyncio.sleep(0.05)
+    assert calls == [1, 2]
+
+
+async def test_shared_ticks_budget(hass: HomeAssistant) -> None:
+    """Test actions exceeding the budget of a tick are deferred to the next one."""
+    calls = []
+    scheduler = ratelimit.RateLimitScheduler(hass, tick=0.01, budget=0)
+
+    # Later actions are due earlier and join the tick of the first one
+    for idx, delay in enumerate((0.003, 0.002, 0.001)):
+        scheduler.async_call_later(delay, calls.append, idx)
+
+    await asyncio.sleep(0.008)
+    assert calls == [0]
+    await asyncio.sleep(0.05)
+    assert calls == [0, 1, 2]
+    assert scheduler.ticks == 3
+    assert scheduler.deferred_actions == 3
@@ -667,6 +667,161 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test saves are journaled and replayed on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        store_file = hass.config.path(storage.STORAGE_DIR, MOCK_KEY)
+        journal_file = f"{store_file}{storage.JOURNAL_SUFFIX}"
+
+        data: dict[str, Any] = {
+            "items": [{"id": "a", "value": 1}, {"id": "b"}, {"id": "c"}],
+            "removed": "yes",
+            "number": 1,
+            "flag": 1,
+            "padding": list(range(1000)),
+        }
+        await store.async_save(data)
+        snapshot = await hass.async_add_executor_job(_read_file, store_file)
+        assert not await hass.async_add_executor_job(os.path.exists, journal_file)
+
+        # Modify, insert and remove list items and dict keys,
+        # and change values which Python considers equal
+        data = {
+            "items": [{"id": "a", "value": 2}, {"id": "x"}, {"id": "c"}, {"id": "d"}],
+            "number": 1.0,
+            "flag": True,
+            "padding": list(range(1000)),
+            "added": {"nested": [1]},
+        }
+        await store.async_save(data)
+        await store.async_save(data)
+        data["items"].pop(0)
+        await store.async_save(data)
+
+        assert await hass.async_add_executor_job(_read_file, store_file) == snapshot
+        journal = await hass.async_add_executor_job(_read_file, journal_file)
+        # The unchanged save was skipped
+        assert journal.count("\n") == 2
+
+        loaded = await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load()
+        assert loaded == data
+        assert list(loaded) == list(data)
+        assert type(loaded["number"]) is float
+        assert loaded["flag"] is True
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(os.path.exists, journal_file)
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into a snapshot."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        store_file = hass.config.path(storage.STORAGE_DIR, MOCK_KEY)
+        journal_file = f"{store_file}{storage.JOURNAL_SUFFIX}"
+        data = {"items": list(range(100))}
+
+        with patch.object(storage, "JOURNAL_MAX_RECORDS", 2):
+            await store.async_save(data)
+            data["items"][0] = -1
+            await store.async_save(data)
+            data["items"][1] = -1
+            await store.async_save(data)
+            stale_journal = await hass.async_add_executor_job(_read_file, journal_file)
+            data["items"][2] = -1
+            await store.async_save(data)
+
+        assert not await hass.async_add_executor_job(os.path.exists, journal_file)
+        snapshot = json.loads(await hass.async_add_executor_job(_read_file, store_file))
+        assert snapshot["data"] == data
+
+        # A crash after writing the snapshot leaves the old journal behind
+        await hass.async_add_executor_job(_write_file, journal_file, stale_journal)
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+            == data
+        )
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_snapshot_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is folded into the storage file on the final write."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        store_file = hass.config.path(storage.STORAGE_DIR, MOCK_KEY)
+        journal_file = f"{store_file}{storage.JOURNAL_SUFFIX}"
+        data = {"count": 0, "padding": list(range(1000))}
+        await store.async_save(data)
+        data["count"] = 1
+        await store.async_save(data)
+        assert await hass.async_add_executor_job(os.path.exists, journal_file)
+        data["count"] = 2
+        store.async_delay_save(lambda: data, 60)
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        assert not await hass.async_add_executor_job(os.path.exists, journal_file)
+        snapshot = json.loads(await hass.async_add_executor_job(_read_file, store_file))
+        assert snapshot["data"] == data
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_incomplete_record(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an incomplete journal record is ignored on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_file = hass.config.path(
+            storage.STORAGE_DIR, f"{MOCK_KEY}{storage.JOURNAL_SUFFIX}"
+        )
+        data = {"count": 0, "padding": list(range(1000))}
+        await store.async_save(data)
+        data["count"] = 1
+        await store.async_save(data)
+        journal = await hass.async_add_executor_job(_read_file, journal_file)
+        # Simulate a crash while appending a record
+        await hass.async_add_executor_job(
+            _write_file, journal_file, journal + journal[:10]
+        )
+
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+            == data
+        )
+        assert f"Ignoring incomplete journal record for {MOCK_KEY}" in caplog.text
+
+        await hass.async_stop(force=True)
+
+
+def _read_file(path: str) -> str:
+    """Read a file."""
+    with open(path, encoding="utf8") as file:
+        return file.read()
+
+
+def _write_file(path: str, content: str) -> None:
+    """Write a file."""
+    with open(path, "w", encoding="utf8") as file:
+        file.write(content)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 import json
 import logging
 import math
+from pathlib import Path
 import random
 from types import MappingProxyType
 from typing import Any
@@ -22,6 +23,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfArea,
@@ -32,6 +34,7 @@ from homeassistant.const import (
     UnitOfSpeed,
     UnitOfTemperature,
     UnitOfVolume,
+    __version__,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import TemplateError
@@ -48,7 +51,7 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.json import json_dumps
-from homeassistant.helpers.typing import TemplateVarsType
+from homeassistant.helpers.typing import UNDEFINED, TemplateVarsType
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 from homeassistant.util.read_only_dict import ReadOnlyDict
@@ -166,6 +169,87 @@ def test_template_equality() -> None:
         template.Template(["{{ template_one }}"])
 
 
+async def test_render_info_state_reads(hass: HomeAssistant) -> None:
+    """Test the states read by a render are recorded."""
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    tmpl = template.Template("{{ states('sensor.one') }}", hass)
+
+    info = tmpl.async_render_to_info()
+    assert info.state_reads == {
+        "sensor.one": (hass.states.get("sensor.one"), {"state"})
+    }
+    assert info.state_reads_unchanged()
+
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "kW"})
+    assert info.state_reads_unchanged()
+    hass.states.async_set("sensor.one", "2", {"unit_of_measurement": "kW"})
+    assert not info.state_reads_unchanged()
+
+    hass.states.async_remove("sensor.one")
+    info = tmpl.async_render_to_info()
+    assert info.state_reads == {"sensor.one": (None, set())}
+    assert info.state_reads_unchanged()
+    hass.states.async_set("sensor.one", "3")
+    assert not info.state_reads_unchanged()
+
+    stats = tmpl.render_stats
+    assert stats["skipped_renders"] == 0
+    assert stats["render_time"] == stats["max_render_time"] == 0
+
+    tmpl.async_add_render_time(0.25)
+    tmpl.async_add_render_time(0.5)
+    stats = tmpl.render_stats
+    assert stats["render_time"] == 0.75
+    assert stats["max_render_time"] == 0.5
+
+
+async def test_reuse_render_info(hass: HomeAssistant) -> None:
+    """Test render info is reused by equal templates while the reads are unchanged."""
+    hass.states.async_set("sensor.one", "1")
+    tmpl = template.Template("{{ states('sensor.one') }}", hass)
+    info = tmpl.async_render_to_info()
+    assert tmpl.async_reuse_render_info(info) is info
+
+    equal = template.Template("{{ states('sensor.one') }}", hass)
+    reused = equal.async_reuse_render_info(info)
+    assert reused is not info
+    assert reused.template is equal
+    assert reused.result() == 1
+    assert info.template is tmpl
+
+    strict = template.Template("{{ states('sensor.one') }}", hass)
+    strict.async_render_to_info(strict=True)
+    assert strict.async_reuse_render_info(info) is None
+    other = template.Template("{{ states('sensor.two') }}", hass)
+    assert other.async_reuse_render_info(info) is None
+
+    hass.states.async_set("sensor.one", "2")
+    assert equal.async_reuse_render_info(info) is None
+
+    assert tmpl.render_stats["skipped_renders"] == 1
+    assert equal.render_stats["skipped_renders"] == 1
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ now() }}",
+        "{{ area_entities('kitchen') }}",
+        "{{ ['a', 'b'] | random }}",
+        "{{ states.sensor.one.last_reported }}",
+        "{{ states('sensor.one', rounded=True) }}",
+        "{{ states('sensor.one') | invalid_filter }}",
+    ],
+)
+async def test_render_info_state_reads_untracked(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test renders depending on more than the states they read are not skipped."""
+    hass.states.async_set("sensor.one", "1")
+    info = template.Template(template_str, hass).async_render_to_info()
+    assert not info.state_reads_unchanged()
+
+
 def test_invalid_template(hass: HomeAssistant) -> None:
     """Invalid template raises error."""
     tmpl = template.Template("{{", hass)
@@ -1890,6 +1974,24 @@ def test_render_with_possible_json_value_and_dont_parse_result(
     assert isinstance(result, str)
 
 
+def test_render_with_possible_json_value_already_parsed(hass: HomeAssistant) -> None:
+    """Render with possible JSON value that was already parsed."""
+    tpl = template.Template("{{ value_json.hello }}", hass)
+    assert (
+        tpl.async_render_with_possible_json_value(
+            '{"hello": "world"}', value_json={"hello": "parsed"}
+        )
+        == "parsed"
+    )
+    tpl = template.Template("{{ value_json is defined }}", hass)
+    assert (
+        tpl.async_render_with_possible_json_value(
+            '{"hello": "world"}', value_json=UNDEFINED
+        )
+        == "False"
+    )
+
+
 def test_if_state_exists(hass: HomeAssistant) -> None:
     """Test if state exists works."""
     hass.states.async_set("test.object", "available")
@@ -5166,27 +5268,167 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+async def test_compiled_template_cache() -> None:
+    """Test equal template strings share their compiled code."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
+    key = (template_string, *template._NO_HASS_ENV.compile_flags)
     tpl = template.Template(
         (template_string),
     )
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template.COMPILED_TEMPLATE_CACHE.get(key) is tpl._compiled_code
 
+    hits = template.COMPILED_TEMPLATE_CACHE.hits
+    del tpl
     tpl2 = template.Template(
         (template_string),
     )
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template.COMPILED_TEMPLATE_CACHE.get(key) is tpl2._compiled_code
+    assert template.COMPILED_TEMPLATE_CACHE.hits == hits + 2
+    info = template.COMPILED_TEMPLATE_CACHE.info()
+    assert info["max_size"] == template.COMPILED_TEMPLATE_CACHE_SIZE
+    assert 0 < info["hit_rate"] <= 1
+
+
+async def test_compiled_template_cache_is_bounded() -> None:
+    """Test the compiled template cache drops the least recently used templates."""
+    cache = template.CompiledTemplateCache(2)
+    codes = [compile(str(idx), "<template>", "eval") for idx in range(3)]
+    for idx, code in enumerate(codes):
+        cache[(str(idx), True, False, False)] = code
+
+    assert len(cache) == 2
+    assert cache.get(("0", True, False, False)) is None
+    assert cache.get(("2", True, False, False)) is codes[2]
+    assert cache.info() == {
+        "size": 2,
+        "max_size": 2,
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
 
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+
+async def test_compiled_templates_persisted(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test compiled templates are saved on shutdown and loaded at startup."""
+    hass.config.config_dir = str(tmp_path)
+    template_string = "{{ states('sensor.persisted') | int(0) + 1 }}"
+    path = hass.config.path(".storage", template.COMPILED_TEMPLATE_CACHE_FILE)
+    cache = template.CompiledTemplateCache(template.COMPILED_TEMPLATE_CACHE_SIZE)
+    written: dict[str, bytes] = {}
+
+    def _write(filename: str, data: bytes, **kwargs: Any) -> None:
+        written[filename] = data
+
+    with (
+        patch.object(template, "COMPILED_TEMPLATE_CACHE", cache),
+        patch.object(template, "write_utf8_file", _write),
+        patch(
+            "homeassistant.helpers.template.pathlib.Path.read_bytes",
+            side_effect=FileNotFoundError,
+        ),
+    ):
+        await template.async_load_compiled_templates(hass)
+        assert len(cache) == 0
+        template.Template(template_string, hass).ensure_valid()
+        # Templates without hass are not saved
+        template.Template("{{ 1 + 1 }}").ensure_valid()
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+    assert written[path].startswith(template._COMPILED_TEMPLATE_CACHE_HEADER)
+
+    cache = template.CompiledTemplateCache(template.COMPILED_TEMPLATE_CACHE_SIZE)
+    with (
+        patch.object(template, "COMPILED_TEMPLATE_CACHE", cache),
+        patch.object(template, "write_utf8_file", _write),
+        patch(
+            "homeassistant.helpers.template.pathlib.Path.read_bytes",
+            return_value=written.pop(path),
+        ),
+    ):
+        await template.async_load_compiled_templates(hass)
+        assert len(cache) == 1
+        tpl = template.Template(template_string, hass)
+        tpl.ensure_valid()
+        assert cache.hits == 1
+        assert tpl.async_render() == 1
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+    assert path in written
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"other version", template._COMPILED_TEMPLATE_CACHE_HEADER + b"\x00"],
+)
+async def test_compiled_templates_invalid_file(
+    hass: HomeAssistant, tmp_path: Path, data: bytes
+) -> None:
+    """Test compiled templates that can not be loaded are ignored."""
+    hass.config.config_dir = str(tmp_path)
+    cache = template.CompiledTemplateCache(template.COMPILED_TEMPLATE_CACHE_SIZE)
+    with (
+        patch.object(template, "COMPILED_TEMPLATE_CACHE", cache),
+        patch.object(template, "write_utf8_file") as mock_write,
+        patch(
+            "homeassistant.helpers.template.pathlib.Path.read_bytes",
+            return_value=data,
+        ),
+    ):
+        await template.async_load_compiled_templates(hass)
+        assert len(cache) == 0
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+    assert len(mock_write.mock_calls) == 1
+
+
+async def test_compiled_templates_storage_dir_created(
+    hass: HomeAssistant, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test compiled templates are saved when the storage dir does not exist."""
+    hass.config.config_dir = str(tmp_path)
+    cache = template.CompiledTemplateCache(template.COMPILED_TEMPLATE_CACHE_SIZE)
+    with patch.object(template, "COMPILED_TEMPLATE_CACHE", cache):
+        await template.async_load_compiled_templates(hass)
+        template.Template("{{ states('sensor.one') }}", hass).ensure_valid()
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+    path = tmp_path / ".storage" / template.COMPILED_TEMPLATE_CACHE_FILE
+    assert path.read_bytes().startswith(template._COMPILED_TEMPLATE_CACHE_HEADER)
+    assert "Saving file failed" not in caplog.text
+
+
+async def test_compiled_templates_other_version(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test compiled templates saved by another Home Assistant version are ignored."""
+    hass.config.config_dir = str(tmp_path)
+    cache = template.CompiledTemplateCache(template.COMPILED_TEMPLATE_CACHE_SIZE)
+    with patch.object(template, "COMPILED_TEMPLATE_CACHE", cache):
+        await template.async_load_compiled_templates(hass)
+        template.Template("{{ states('sensor.one') }}", hass).ensure_valid()
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+    path = tmp_path / ".storage" / template.COMPILED_TEMPLATE_CACHE_FILE
+    data = path.read_bytes()
+    for saved, loaded in (
+        (data, 1),
+        (data.replace(f" {__version__}\n".encode(), b" 2000.1.0\n", 1), 0),
+    ):
+        path.write_bytes(saved)
+        cache = template.CompiledTemplateCache(template.COMPILED_TEMPLATE_CACHE_SIZE)
+        with patch.object(template, "COMPILED_TEMPLATE_CACHE", cache):
+            await template.async_load_compiled_templates(hass)
+        assert len(cache) == loaded
 
 
 def test_is_template_string() -> None:
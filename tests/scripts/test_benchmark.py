@@ -0,0 +1,148 @@
+"""Test the benchmark script."""
+
+from collections.abc import Coroutine
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.scripts import benchmark
+from homeassistant.scripts.benchmark import scenarios
+
+
+def test_percentile() -> None:
+    """Test nearest rank percentiles."""
+    values = [float(value) for value in range(1, 101)]
+    assert scenarios.percentile(values, 50) == 50.0
+    assert scenarios.percentile(values, 99) == 99.0
+    assert scenarios.percentile(values, 100) == 100.0
+    assert scenarios.percentile([3.0], 99) == 3.0
+    assert scenarios.percentile([], 50) == 0.0
+
+
+def test_summarize() -> None:
+    """Test summarizing scenario iterations."""
+    result = scenarios.summarize(40, [0.1, 0.2, 0.3, 0.4])
+    assert result["iterations"] == 4
+    assert result["operations"] == 40
+    assert result["ops_per_sec"] == pytest.approx(40.0)
+    assert result["mean_ms"] == pytest.approx(250.0)
+    assert result["p50_ms"] == pytest.approx(200.0)
+    assert result["p99_ms"] == pytest.approx(400.0)
+
+
+def _suite(ops_per_sec: float, p99_ms: float) -> dict[str, Any]:
+    """Return suite results with a single scenario to compare."""
+    return {
+        "scenarios": {
+            "recorder_writes": {"ops_per_sec": ops_per_sec, "p99_ms": p99_ms},
+            "only_in_one_run": {"ops_per_sec": 1.0, "p99_ms": 1.0},
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    ("ops_per_sec", "p99_ms", "regression"),
+    [
+        (1000.0, 10.0, False),
+        (950.0, 10.5, False),
+        (850.0, 10.0, True),
+        (1000.0, 12.0, True),
+        (2000.0, 5.0, False),
+    ],
+)
+def test_compare_results(ops_per_sec: float, p99_ms: float, regression: bool) -> None:
+    """Test regressions are flagged above the threshold."""
+    baseline = _suite(1000.0, 10.0)
+    del baseline["scenarios"]["only_in_one_run"]
+    comparison = scenarios.compare_results(baseline, _suite(ops_per_sec, p99_ms), 0.1)
+    assert len(comparison) == 1
+    assert comparison[0]["scenario"] == "recorder_writes"
+    assert comparison[0]["regression"] is regression
+
+
+def test_run_compare(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test the compare mode returns a failing exit code on regressions."""
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps(_suite(1000.0, 10.0)))
+
+    current.write_text(json.dumps(_suite(1000.0, 10.0)))
+    assert benchmark.run_compare(baseline, current, 0.1) == 0
+
+    current.write_text(json.dumps(_suite(500.0, 10.0)))
+    assert benchmark.run_compare(baseline, current, 0.1) == 1
+    assert "recorder_writes" in (output := capsys.readouterr().out)
+    assert "REGRESSION" in output
+
+
+def test_scenarios_registered() -> None:
+    """Test the scenarios the suite covers are registered."""
+    assert {
+        "startup",
+        "recorder_writes",
+        "history_queries",
+        "template_render",
+        "automation_triggering",
+        "websocket_subscribe",
+        "websocket_fanout",
+    } <= set(scenarios.SCENARIOS)
+
+
+def test_run_benchmark_interrupted() -> None:
+    """Test a benchmark stops on a keyboard interrupt without running the suite."""
+    runs = 0
+
+    def _run(coro: Coroutine[Any, Any, None]) -> None:
+        nonlocal runs
+        coro.close()
+        runs += 1
+        if runs == 2:
+            raise KeyboardInterrupt
+
+    with (
+        patch("sys.argv", ["hass", "--script", "benchmark", "sensor_statistics_mean"]),
+        patch("homeassistant.scripts.benchmark.asyncio.run", _run),
+        patch("homeassistant.scripts.benchmark.run_suite") as mock_run_suite,
+    ):
+        assert benchmark.run(None) == 0
+    assert runs == 2
+    mock_run_suite.assert_not_called()
+
+
+def test_run_suite(tmp_path: Path) -> None:
+    """Test running the suite against a small instance and comparing the results."""
+    baseline = tmp_path / "baseline.json"
+    with patch(
+        "sys.argv",
+        [
+            "hass",
+            "--script",
+            "benchmark",
+            "suite",
+            "--entities",
+            "10",
+            "--warmup",
+            "0",
+            "--repeat",
+            "1",
+            "--output",
+            str(baseline),
+        ],
+    ):
+        assert benchmark.run(None) == 0
+
+    results = json.loads(baseline.read_text(encoding="utf-8"))
+    assert results["entities"] == 10
+    assert set(results["scenarios"]) == set(scenarios.SCENARIOS)
+    for result in results["scenarios"].values():
+        assert result["iterations"] == 1
+        assert result["operations"] > 0
+
+    with patch(
+        "sys.argv",
+        ["hass", "--script", "benchmark", "--compare", str(baseline), str(baseline)],
+    ):
+        assert benchmark.run(None) == 0
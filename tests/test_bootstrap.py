@@ -71,6 +71,13 @@ def mock_http_start_stop() -> Generator[None]:
         yield
 
 
+@pytest.fixture(scope="module", autouse=True)
+def mock_compiled_templates_write() -> Generator[None]:
+    """Do not write the compiled template cache to the testing config."""
+    with patch("homeassistant.helpers.template._write_compiled_templates"):
+        yield
+
+
 @patch("homeassistant.bootstrap.async_enable_logging", AsyncMock())
 async def test_home_assistant_core_config_validation(hass: HomeAssistant) -> None:
     """Test if we pass in wrong information for HA conf."""
@@ -8,12 +8,14 @@ from datetime import datetime, timedelta
 import functools
 import gc
 import logging
+from operator import itemgetter
 import os
 import re
 import threading
 import time
 from typing import Any
 from unittest.mock import MagicMock, patch
+from weakref import WeakValueDictionary
 
 from freezegun import freeze_time
 import pytest
@@ -3309,3 +3311,456 @@ async def test_async_set_updates_last_reported(hass: HomeAssistant) -> None:
         assert state.last_reported_timestamp != last_reported_timestamp
         last_reported = state.last_reported
         last_reported_timestamp = state.last_reported_timestamp
+
+
+async def test_statemachine_async_set_many(hass: HomeAssistant) -> None:
+    """Test setting many states shares the timestamp and context."""
+    hass.states.async_set("light.existing", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+    state_changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    state_reported_events: list[ha.Event] = []
+
+    @ha.callback
+    def mock_filter(event_data: ha.EventStateReportedData) -> bool:
+        """Mock filter."""
+        return True
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        state_reported_events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_REPORTED, listener, event_filter=mock_filter)
+
+    hass.states.async_set_many(
+        [
+            ("light.Existing", "on", {"brightness": 100}),
+            ("sensor.new", 42, {"unit_of_measurement": "W"}),
+            ("switch.new", "off", None),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert len(state_reported_events) == 1
+    assert state_reported_events[0].data["entity_id"] == "light.existing"
+    assert [event.data["entity_id"] for event in state_changed_events] == [
+        "sensor.new",
+        "switch.new",
+    ]
+    sensor = hass.states.get("sensor.new")
+    switch = hass.states.get("switch.new")
+    assert sensor.state == "42"
+    assert sensor.attributes == {"unit_of_measurement": "W"}
+    assert switch.attributes == {}
+    assert sensor.last_updated == switch.last_updated
+    assert sensor.context is switch.context
+    assert state_reported_events[0].context is sensor.context
+    assert state_changed_events[0].time_fired == sensor.last_updated
+
+
+async def test_statemachine_async_set_many_event_order(hass: HomeAssistant) -> None:
+    """Test setting many states fires the events in the order of the states."""
+    events: list[ha.Event] = []
+    batches: list[list[ha.Event]] = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        events.append(event)
+
+    @ha.callback
+    def batch_listener(batch: list[ha.Event]) -> None:
+        batches.append(batch)
+
+    @ha.callback
+    def mock_filter(event_data: ha.EventStateReportedData) -> bool:
+        """Mock filter."""
+        return True
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    hass.bus.async_listen(EVENT_STATE_REPORTED, listener, event_filter=mock_filter)
+    hass.bus.async_listen_batch(EVENT_STATE_CHANGED, batch_listener)
+
+    hass.states.async_set_many(
+        [
+            ("light.one", "on", None),
+            ("light.one", "on", None),
+            ("light.one", "off", None),
+            ("light.two", "on", None),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert [
+        (
+            event.event_type,
+            event.data["entity_id"],
+            event.data["new_state"].state,
+        )
+        for event in events
+    ] == [
+        (EVENT_STATE_CHANGED, "light.one", "on"),
+        (EVENT_STATE_REPORTED, "light.one", "on"),
+        (EVENT_STATE_CHANGED, "light.one", "off"),
+        (EVENT_STATE_CHANGED, "light.two", "on"),
+    ]
+    assert [[event.data["entity_id"] for event in batch] for batch in batches] == [
+        ["light.one"],
+        ["light.one", "light.two"],
+    ]
+
+
+async def test_statemachine_async_set_many_context(hass: HomeAssistant) -> None:
+    """Test setting many states with a context and timestamp."""
+    context = ha.Context()
+    hass.states.async_set_many(
+        [("light.one", "on", None), ("light.two", "on", None)],
+        context=context,
+        timestamp=1700000000.0,
+    )
+    for entity_id in ("light.one", "light.two"):
+        state = hass.states.get(entity_id)
+        assert state.context is context
+        assert state.last_updated_timestamp == 1700000000.0
+
+
+async def test_eventbus_listen_batch(hass: HomeAssistant) -> None:
+    """Test batched listeners receive bulk state updates in one call."""
+    batches: list[list[ha.Event]] = []
+
+    @ha.callback
+    def batch_listener(events: list[ha.Event]) -> None:
+        batches.append(events)
+
+    @ha.callback
+    def only_lights(event_data: ha.EventStateChangedData) -> bool:
+        return event_data["entity_id"].startswith("light.")
+
+    unsub = hass.bus.async_listen_batch(
+        EVENT_STATE_CHANGED, batch_listener, event_filter=only_lights
+    )
+    single_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many(
+        [
+            ("light.one", "on", None),
+            ("switch.one", "on", None),
+            ("light.two", "on", None),
+        ]
+    )
+    await hass.async_block_till_done()
+    assert len(batches) == 1
+    assert [event.data["entity_id"] for event in batches[0]] == [
+        "light.one",
+        "light.two",
+    ]
+    assert len(single_events) == 3
+    # Listeners share the same event objects
+    assert batches[0][0] is single_events[0]
+
+    # Single events are delivered as batches of one
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("switch.one", "off")
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert [event.data["entity_id"] for event in batches[1]] == ["light.one"]
+
+    # Nothing is delivered when the whole batch is filtered
+    hass.states.async_set_many([("switch.two", "on", None)])
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+
+    unsub()
+    hass.states.async_set_many([("light.three", "on", None)])
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+
+
+async def test_eventbus_listen_batch_coroutine(hass: HomeAssistant) -> None:
+    """Test batched coroutine listeners."""
+    batches: list[list[ha.Event]] = []
+
+    async def batch_listener(events: list[ha.Event]) -> None:
+        batches.append(events)
+
+    hass.bus.async_listen_batch(EVENT_STATE_CHANGED, batch_listener)
+    hass.states.async_set_many([("light.one", "on", None), ("light.two", "on", None)])
+    await hass.async_block_till_done()
+    assert len(batches) == 1
+    assert len(batches[0]) == 2
+
+
+async def test_eventbus_listen_batch_restrictions(hass: HomeAssistant) -> None:
+    """Test batched listeners enforce the same filter rules."""
+
+    @ha.callback
+    def listener(events: list[ha.Event]) -> None:
+        """Mock listener."""
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batch(EVENT_STATE_REPORTED, listener)
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batch(
+            EVENT_STATE_CHANGED, listener, event_filter=lambda _: True
+        )
+
+
+async def test_eventbus_fire_many_filter_and_listener_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test errors in filters and listeners do not abort a batch."""
+    received: list[ha.Event] = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        received.append(event)
+
+    @ha.callback
+    def bad_filter(event_data: dict[str, Any]) -> bool:
+        if event_data["idx"] == 0:
+            raise ValueError("bad filter")
+        return True
+
+    @ha.callback
+    def bad_batch_listener(events: list[ha.Event]) -> None:
+        raise ValueError("bad listener")
+
+    hass.bus.async_listen("test_event", listener, bad_filter)
+    hass.bus.async_listen_batch("test_event", bad_batch_listener)
+    hass.bus.async_fire_many_internal("test_event", [{"idx": 0}, {"idx": 1}])
+    await hass.async_block_till_done()
+    assert [event.data["idx"] for event in received] == [1]
+    assert "Error in event filter" in caplog.text
+    assert "Error running job" in caplog.text
+
+
+async def test_eventbus_listen_indexed(hass: HomeAssistant) -> None:
+    """Test indexed listeners only receive events for their keys."""
+    index = ha.EventIndex(EVENT_STATE_CHANGED, itemgetter("entity_id"))
+    light_events: list[ha.Event] = []
+    any_events: list[ha.Event] = []
+
+    @ha.callback
+    def light_listener(event: ha.Event) -> None:
+        light_events.append(event)
+
+    @ha.callback
+    def any_listener(event: ha.Event) -> None:
+        any_events.append(event)
+
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    unsub_light = hass.bus.async_listen_indexed(index, "light.kitchen", light_listener)
+    unsub_any = hass.bus.async_listen_indexed(
+        index, ["light.kitchen", "switch.porch"], any_listener
+    )
+    # All listeners of an index share one bus listener
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("switch.porch", "on")
+    hass.states.async_set("switch.other", "on")
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in light_events] == ["light.kitchen"]
+    assert [event.data["entity_id"] for event in any_events] == [
+        "light.kitchen",
+        "switch.porch",
+    ]
+
+    unsub_light()
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert len(light_events) == 1
+    assert len(any_events) == 3
+
+    unsub_any()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+    assert hass.bus.async_listen_indexed(index, [], any_listener)() is None
+
+
+async def test_eventbus_listen_indexed_match_all(hass: HomeAssistant) -> None:
+    """Test indexed listeners with match all and events without a key."""
+
+    def _added_domain(event_data: ha.EventStateChangedData) -> str | None:
+        if event_data["old_state"] is not None:
+            return None
+        return event_data["new_state"].domain
+
+    index = ha.EventIndex(EVENT_STATE_CHANGED, _added_domain, match_all=True)
+    light_events: list[ha.Event] = []
+    all_events: list[ha.Event] = []
+
+    @ha.callback
+    def light_listener(event: ha.Event) -> None:
+        light_events.append(event)
+
+    @ha.callback
+    def all_listener(event: ha.Event) -> None:
+        all_events.append(event)
+
+    hass.bus.async_listen_indexed(index, "light", light_listener)
+    hass.bus.async_listen_indexed(index, MATCH_ALL, all_listener)
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("switch.porch", "on")
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in light_events] == ["light.kitchen"]
+    assert [event.data["entity_id"] for event in all_events] == [
+        "light.kitchen",
+        "switch.porch",
+    ]
+
+
+async def test_eventbus_listen_indexed_dispatch_soon(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test indexed listeners dispatched soon and errors in listeners."""
+    index = ha.EventIndex(
+        EVENT_STATE_CHANGED, itemgetter("entity_id"), dispatch_soon=True
+    )
+    events: list[ha.Event] = []
+
+    @ha.callback
+    def bad_listener(event: ha.Event) -> None:
+        raise ValueError("bad listener")
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        events.append(event)
+
+    hass.bus.async_listen_indexed(index, "light.kitchen", bad_listener)
+    hass.bus.async_listen_indexed(index, "light.kitchen", listener)
+    hass.states.async_set("light.kitchen", "on")
+    assert events == []
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    assert "Error while dispatching event for light.kitchen" in caplog.text
+
+
+async def test_statemachine_compact_storage(hass: HomeAssistant) -> None:
+    """Test compact storage shares identical attributes between states."""
+    attributes = {"unit_of_measurement": "W", "device_class": "power"}
+    hass.states.async_set("sensor.first", "1", attributes)
+    hass.states.async_set("sensor.before", "1", attributes)
+    first = hass.states.get("sensor.first")
+    before = hass.states.get("sensor.before")
+    assert before.as_dict_json
+    assert before.attributes is not first.attributes
+    assert not hass.states.compact_storage
+
+    hass.states.async_enable_compact_storage()
+    assert hass.states.compact_storage
+    # Existing states are interned and their caches are dropped
+    assert before.attributes is first.attributes
+    assert "as_dict_json" not in before._cache
+
+    hass.states.async_set("sensor.one", "1", dict(attributes))
+    hass.states.async_set("sensor.two", "2", dict(attributes))
+    one = hass.states.get("sensor.one")
+    two = hass.states.get("sensor.two")
+    assert one.attributes is two.attributes
+    assert one.attributes is before.attributes
+
+    # Values that compare equal but have a different type are not shared
+    hass.states.async_set("sensor.int", "1", {"value": 1})
+    hass.states.async_set("sensor.float", "1", {"value": 1.0})
+    hass.states.async_set("sensor.bool", "1", {"value": True})
+    assert hass.states.get("sensor.int").as_dict_json != (
+        hass.states.get("sensor.float").as_dict_json
+    )
+    assert hass.states.get("sensor.bool").attributes["value"] is True
+
+    # Unhashable and container values are stored as is
+    hass.states.async_set("sensor.list", "1", {"values": [1, 2]})
+    hass.states.async_set("sensor.list2", "1", {"values": [1, 2]})
+    assert (
+        hass.states.get("sensor.list").attributes
+        is not hass.states.get("sensor.list2").attributes
+    )
+    hass.states.async_set("sensor.tuple", "1", {"values": (1, 2)})
+    hass.states.async_set("sensor.tuple2", "1", {"values": (1.0, 2.0)})
+    assert hass.states.get("sensor.tuple2").attributes["values"] == (1.0, 2.0)
+    assert type(hass.states.get("sensor.tuple2").attributes["values"][0]) is float
+
+    # Equal values that serialize differently are not shared
+    utc_time = datetime(2024, 1, 1, 12, tzinfo=dt_util.UTC)
+    local_time = utc_time.astimezone(dt_util.get_time_zone("Europe/Amsterdam"))
+    hass.states.async_set("sensor.utc", "1", {"at": utc_time})
+    hass.states.async_set("sensor.local", "1", {"at": local_time})
+    assert hass.states.get("sensor.local").attributes["at"].utcoffset()
+    hass.states.async_set("sensor.zero", "1", {"value": 0.0})
+    hass.states.async_set("sensor.negative_zero", "1", {"value": -0.0})
+    hass.states.async_set("sensor.zero2", "1", {"value": 0.0})
+    assert str(hass.states.get("sensor.negative_zero").attributes["value"]) == "-0.0"
+    assert str(hass.states.get("sensor.zero2").attributes["value"]) == "0.0"
+    assert (
+        hass.states.get("sensor.zero").attributes
+        is hass.states.get("sensor.zero2").attributes
+    )
+
+    # Enabling twice is a no-op
+    hass.states.async_enable_compact_storage()
+    assert hass.states.get("sensor.one").attributes is one.attributes
+
+
+def test_intern_attributes_hash_collision() -> None:
+    """Test attributes are only shared when the items match, not just the hash."""
+    interned: WeakValueDictionary[int, ReadOnlyDict[str, Any]] = WeakValueDictionary()
+    attributes = {"unit": "W"}
+    other = ReadOnlyDict({"unit": "kW"})
+    interned[hash((("unit", str, "W"),))] = other
+
+    assert ha._intern_attributes(interned, attributes) is attributes
+    assert ha._intern_attributes(interned, {"unit": "kW"}) is not other
+
+    shared = ha._intern_attributes(interned, {"device_class": "power"})
+    assert ha._intern_attributes(interned, {"device_class": "power"}) is shared
+    assert ha._intern_attributes(interned, {"device_class": "energy"}) is not shared
+
+
+async def test_statemachine_evict_caches(hass: HomeAssistant) -> None:
+    """Test evicting the cached representations of states."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    state = hass.states.get("light.kitchen")
+    as_dict_json = state.as_dict_json
+    compressed = state.as_compressed_state_json
+    timestamp = state.last_changed_timestamp
+
+    hass.states.async_evict_caches()
+    for key in (
+        "_as_dict",
+        "as_dict_json",
+        "json_fragment",
+        "as_compressed_state",
+        "as_compressed_state_json",
+    ):
+        assert key not in state._cache
+    assert state._cache["last_changed_timestamp"] == timestamp
+    assert state.as_dict_json == as_dict_json
+    assert state.as_dict_json is not as_dict_json
+    assert state.as_compressed_state_json == compressed
+
+
+async def test_statemachine_memory_usage(hass: HomeAssistant) -> None:
+    """Test estimating the memory used by states."""
+    assert hass.states.async_memory_usage()["bytes_per_entity"] == 0
+
+    hass.states.async_enable_compact_storage()
+    for idx in range(10):
+        hass.states.async_set(f"sensor.power_{idx}", str(idx), {"unit": "W"})
+    usage = hass.states.async_memory_usage()
+    assert usage["compact_storage"] is True
+    assert usage["entities"] == 10
+    assert usage["unique_attributes"] == 1
+    assert usage["cache_bytes"] == 0
+    assert usage["intern_bytes"] > 0
+    assert usage["total_bytes"] == (
+        usage["state_bytes"]
+        + usage["attributes_bytes"]
+        + usage["cache_bytes"]
+        + usage["intern_bytes"]
+    )
+    assert usage["bytes_per_entity"] == usage["total_bytes"] // 10
+
+    for state in hass.states.async_all():
+        assert state.as_dict_json
+    assert hass.states.async_memory_usage()["cache_bytes"] > 0
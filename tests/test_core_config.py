@@ -1106,3 +1106,12 @@ async def test_core_config_schema_imperial_unit(
 
     issue = issue_registry.async_get_issue("homeassistant", "imperial_unit_system")
     assert issue
+
+
+async def test_compact_states_config(hass: HomeAssistant) -> None:
+    """Test enabling compact state storage from the core config."""
+    await async_process_ha_core_config(hass, {})
+    assert not hass.states.compact_storage
+
+    await async_process_ha_core_config(hass, {"compact_states": True})
+    assert hass.states.compact_storage
@@ -499,6 +499,34 @@ async def test_get_integration_legacy(hass: HomeAssistant) -> None:
     assert integration.get_platform_cached("switch") is not None
 
 
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_get_integration_import_timings(hass: HomeAssistant) -> None:
+    """Test the time it takes to import an integration is recorded."""
+    for module in (
+        "custom_components.test_embedded",
+        "custom_components.test_embedded.switch",
+    ):
+        sys.modules.pop(module, None)
+    integration = await loader.async_get_integration(hass, "test_embedded")
+    integration.get_component()
+    integration.get_platform("switch")
+
+    timings = loader.async_get_import_timings(hass)
+    assert set(timings["test_embedded"]) == {"__init__", "switch"}
+    assert all(seconds >= 0 for seconds in timings["test_embedded"].values())
+
+
+async def test_register_lazy_platform(hass: HomeAssistant) -> None:
+    """Test a lazy platform is no longer preloaded."""
+    loader.async_register_preload_platform(hass, "lazy_platform")
+    assert "lazy_platform" in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+    loader.async_register_lazy_platform(hass, "lazy_platform")
+    assert "lazy_platform" not in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+    # Registering again is a no-op
+    loader.async_register_lazy_platform(hass, "lazy_platform")
+    assert "lazy_platform" not in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_get_integration_custom_component(hass: HomeAssistant) -> None:
     """Test resolving integration."""
@@ -1150,6 +1150,22 @@ async def test_async_get_setup_timings(hass: HomeAssistant) -> None:
     }
 
 
+async def test_async_record_import_times(hass: HomeAssistant) -> None:
+    """Test the import times of integrations that were set up are recorded."""
+    setup_time = setup._setup_times(hass)
+    setup_time["sensor"][None][setup.SetupPhases.SETUP] = 1
+    import_times = loader.async_get_import_timings(hass)
+    import_times["sensor"] = {"__init__": 0.25, "recorder": 0.5}
+    import_times["not_set_up"] = {"__init__": 1}
+
+    setup.async_record_import_times(hass)
+
+    assert setup.async_get_domain_setup_times(hass, "sensor") == {
+        None: {setup.SetupPhases.SETUP: 1, setup.SetupPhases.IMPORT: 0.75}
+    }
+    assert setup.async_get_setup_timings(hass) == {"sensor": 1.75}
+
+
 async def test_setup_config_entry_from_yaml(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None: